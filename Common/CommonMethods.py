@@ -25,6 +25,9 @@
 
 import numpy as np
 import cantera as ct 
+import os 
+import hashlib
+from multiprocessing import current_process
 
 
 def ComputeLewisNumber(flame:ct.Solution):
@@ -56,7 +59,9 @@ def avg_Le_local(Le_sp:np.ndarray):
 
 
 def GetReferenceData(dataset_file:str, x_vars:list[str], train_variables:list[str],dtype=np.float32):
-    """Read csv file and collect input-output pairs into a numpy array of a set data type.
+    """Read csv file and collect input-output pairs into a numpy array of a set data type. Only the columns of the 
+    requested variables are loaded. If binary column storage is available for the data set, the columns are read from 
+    the memory-mapped binary files instead.
 
     :param dataset_file: file path name to csv file
     :type dataset_file: str
@@ -70,28 +75,378 @@ def GetReferenceData(dataset_file:str, x_vars:list[str], train_variables:list[st
     :rtype: np.ndarray[float],np.ndarray[float]
     """
 
-    # Open data file and get variable names from the first line
-    fid = open(dataset_file, 'r')
-    line = fid.readline()
-    fid.close()
-    line = line.strip()
-    line_split = line.split(',')
-    if(line_split[0][0] == '"'):
-        varnames = [s[1:-1] for s in line_split]
-    else:
-        varnames = line_split
+    # Retrieve split data from the full data set if the split data file was not written.
+    if not os.path.isfile(dataset_file) and not BinaryDataExists(dataset_file):
+        file_header, _, split_name = os.path.splitext(dataset_file)[0].rpartition("_")
+        if DataSplitExists(file_header) and (split_name in GetDataSplitNames(file_header)):
+            X_full, Y_full = GetReferenceData(file_header + "_full.csv", x_vars, train_variables, dtype)
+            idx_split = GetDataSplitIndices(file_header, split_name)
+            return X_full[idx_split, :], Y_full[idx_split, :]
+        
+    # Load requested columns from binary data storage when available.
+    if BinaryDataExists(dataset_file):
+        X_data = ReadBinaryData(dataset_file, x_vars, dtype)
+        Y_data = ReadBinaryData(dataset_file, train_variables, dtype)
+        return X_data, Y_data
     
-    # Get indices of controlling and train variables
-    iVar_x = [varnames.index(v) for v in x_vars]
-    iVar_y = [varnames.index(v) for v in train_variables]
+    with open(dataset_file, 'r') as fid:
+        # Get variable names from the first line
+        line = fid.readline()
+        line = line.strip()
+        line_split = line.split(',')
+        if(line_split[0][0] == '"'):
+            varnames = [s[1:-1] for s in line_split]
+        else:
+            varnames = line_split
+        
+        # Get indices of controlling and train variables
+        iVar_x = [varnames.index(v) for v in x_vars]
+        iVar_y = [varnames.index(v) for v in train_variables]
+        iVar_read = iVar_x + iVar_y
 
-    # Retrieve respective data from data set
-    D = np.loadtxt(dataset_file, delimiter=',', skiprows=1, dtype=dtype)
-    X_data = D[:, iVar_x]
-    Y_data = D[:, iVar_y]
+        # Lines are cut after the last requested column, such that the columns beyond are not tokenized. Of the 
+        # remaining columns, only the requested ones are converted.
+        n_read = max(iVar_read) + 1
+        if n_read < len(varnames):
+            lines = (",".join(line.split(',', n_read)[:n_read]) for line in fid)
+        else:
+            lines = fid
+        D = np.loadtxt(lines, delimiter=',', dtype=dtype, usecols=iVar_read, ndmin=2)
+    X_data = D[:, :len(iVar_x)]
+    Y_data = D[:, len(iVar_x):]
 
     return X_data, Y_data
 
+def GetReferenceDataSplits(file_header:str, x_vars:list[str], train_variables:list[str], split_names:list[str]=["train","test","val"], dtype=np.float32):
+    """Read input-output pairs of multiple splits of a data set. If a split index is available, the full data set is 
+    read once and sliced for each split, rather than reading each split separately.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :param x_vars: controlling variables
+    :type x_vars: list[str]
+    :param train_variables: output variables
+    :type train_variables: list[str]
+    :param split_names: names of the data splits to read, "full" refers to the full data set, defaults to ["train","test","val"]
+    :type split_names: list[str], optional
+    :param dtype: data type by which to output data arrays, defaults to np.float32
+    :type dtype: dtype, optional
+    :return: controlling variable and dependent variable data arrays for each split.
+    :rtype: list[tuple[np.ndarray[float],np.ndarray[float]]]
+    """
+    if not DataSplitExists(file_header):
+        return [GetReferenceData(file_header + "_" + split_name + ".csv", x_vars, train_variables, dtype) for split_name in split_names]
+    
+    X_full, Y_full = GetReferenceData(file_header + "_full.csv", x_vars, train_variables, dtype)
+    data_splits = []
+    for split_name in split_names:
+        if split_name == "full":
+            data_splits.append((X_full, Y_full))
+        else:
+            idx_split = GetDataSplitIndices(file_header, split_name)
+            data_splits.append((X_full[idx_split, :], Y_full[idx_split, :]))
+    return data_splits
+
+def GetBinaryDataDir(dataset_file:str):
+    """Get the directory name of the binary column storage corresponding to a csv data file.
+
+    :param dataset_file: file path name to csv file
+    :type dataset_file: str
+    :return: binary column storage directory.
+    :rtype: str
+    """
+    return os.path.splitext(dataset_file)[0] + "_bin"
+
+def BinaryDataExists(dataset_file:str):
+    """Check whether binary column storage is available for a csv data file.
+
+    :param dataset_file: file path name to csv file
+    :type dataset_file: str
+    :return: whether the binary column storage is present.
+    :rtype: bool
+    """
+    return os.path.isfile(GetBinaryDataDir(dataset_file) + "/variables.txt")
+
+def GetBinaryDataVariables(dataset_file:str):
+    """Read the variable names stored in binary column storage.
+
+    :param dataset_file: file path name to csv file
+    :type dataset_file: str
+    :return: list of stored variable names.
+    :rtype: list[str]
+    """
+    with open(GetBinaryDataDir(dataset_file) + "/variables.txt", 'r') as fid:
+        varnames = fid.readline().strip().split(',')
+    return varnames
+
+def WriteBinaryData(dataset_file:str, variables:list[str], data:np.ndarray):
+    """Store data array in binary format, where each column is saved as a separate .npy file.
+
+    :param dataset_file: file path name to csv file the binary storage corresponds to
+    :type dataset_file: str
+    :param variables: variable names of the data array columns
+    :type variables: list[str]
+    :param data: data array
+    :type data: np.ndarray
+    :raises Exception: if the number of variables does not match the number of data columns.
+    """
+    if len(variables) != np.shape(data)[1]:
+        raise Exception("Number of variables should match the number of data columns.")
+    
+    bin_dir = GetBinaryDataDir(dataset_file)
+    if not os.path.isdir(bin_dir):
+        os.mkdir(bin_dir)
+    
+    for iVar in range(len(variables)):
+        np.save(bin_dir + "/column_%i.npy" % iVar, np.ascontiguousarray(data[:, iVar]))
+    
+    # Variable names are written last such that incomplete storage is not picked up by the loader.
+    with open(bin_dir + "/variables.txt", 'w+') as fid:
+        fid.write(",".join(variables) + "\n")
+    return 
+
+def ReadBinaryData(dataset_file:str, variables:list[str], dtype=np.float32):
+    """Load data of selected variables from binary column storage.
+
+    :param dataset_file: file path name to csv file the binary storage corresponds to
+    :type dataset_file: str
+    :param variables: variables to load
+    :type variables: list[str]
+    :param dtype: data type by which to output data array, defaults to np.float32
+    :type dtype: dtype, optional
+    :raises Exception: if any of the variables is not present in the binary storage.
+    :return: data array with the selected variables as columns.
+    :rtype: np.ndarray
+    """
+    bin_dir = GetBinaryDataDir(dataset_file)
+    varnames = GetBinaryDataVariables(dataset_file)
+    for v in variables:
+        if v not in varnames:
+            raise Exception("Variable " + v + " not present in binary data storage " + bin_dir)
+    
+    # Columns are memory-mapped such that only the requested variables are read from disk.
+    Np = GetBinaryDataLength(dataset_file)
+    data = np.empty([Np, len(variables)], dtype=dtype)
+    for iVar, v in enumerate(variables):
+        data[:, iVar] = np.load(bin_dir + "/column_%i.npy" % varnames.index(v), mmap_mode='r')
+    return data
+
+def GetBinaryDataLength(dataset_file:str):
+    """Get the number of data points stored in binary column storage.
+
+    :param dataset_file: file path name to csv file the binary storage corresponds to
+    :type dataset_file: str
+    :return: number of data points.
+    :rtype: int
+    """
+    return len(np.load(GetBinaryDataDir(dataset_file) + "/column_0.npy", mmap_mode='r'))
+
+def ReadBinaryDataRows(dataset_file:str, variables:list[str], idx_rows, dtype=np.float32):
+    """Load a selection of data points of selected variables from binary column storage without loading the 
+    complete columns into memory.
+
+    :param dataset_file: file path name to csv file the binary storage corresponds to
+    :type dataset_file: str
+    :param variables: variables to load
+    :type variables: list[str]
+    :param idx_rows: row indices or slice of the data points to load.
+    :type idx_rows: np.ndarray[int] or slice
+    :param dtype: data type by which to output data array, defaults to np.float32
+    :type dtype: dtype, optional
+    :raises Exception: if any of the variables is not present in the binary storage.
+    :return: data array with the selected data points as rows and the selected variables as columns.
+    :rtype: np.ndarray
+    """
+    bin_dir = GetBinaryDataDir(dataset_file)
+    varnames = GetBinaryDataVariables(dataset_file)
+    for v in variables:
+        if v not in varnames:
+            raise Exception("Variable " + v + " not present in binary data storage " + bin_dir)
+    
+    if isinstance(idx_rows, slice):
+        idx_read, idx_order = idx_rows, slice(None)
+        Np = len(range(*idx_rows.indices(GetBinaryDataLength(dataset_file))))
+    else:
+        # Read rows in ascending order for sequential disk access.
+        idx_order = np.argsort(idx_rows)
+        idx_read = np.asarray(idx_rows)[idx_order]
+        Np = len(idx_rows)
+    
+    data = np.empty([Np, len(variables)], dtype=dtype)
+    for iVar, v in enumerate(variables):
+        column = np.load(bin_dir + "/column_%i.npy" % varnames.index(v), mmap_mode='r')
+        data[idx_order, iVar] = column[idx_read]
+    return data
+
+def GetDataSplitFile(file_header:str):
+    """Get the file name of the train, test, and validation split index of a data set.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :return: split index file name.
+    :rtype: str
+    """
+    return file_header + "_split.npz"
+
+def DataSplitExists(file_header:str):
+    """Check whether a split index is available for a data set.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :return: whether the split index file is present.
+    :rtype: bool
+    """
+    return os.path.isfile(GetDataSplitFile(file_header))
+
+def WriteDataSplit(file_header:str, permutation:np.ndarray, split_names:list[str], split_sizes:list[int], seed:int=None):
+    """Store the row indices of the full data set in split order and the offsets at which each split starts.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :param permutation: row indices of the full data set, ordered such that each split is a consecutive block.
+    :type permutation: np.ndarray[int]
+    :param split_names: names of the data splits in the order in which they occur in the permutation.
+    :type split_names: list[str]
+    :param split_sizes: number of data points in each split. The last split contains the remaining data points.
+    :type split_sizes: list[int]
+    :param seed: random seed used to shuffle the data set, defaults to None
+    :type seed: int, optional
+    :raises Exception: if the number of split names and sizes do not match or exceed the number of data points.
+    """
+    if len(split_names) != len(split_sizes):
+        raise Exception("Number of split names should match the number of split sizes.")
+    if sum(split_sizes) > len(permutation):
+        raise Exception("Split sizes exceed the number of data points.")
+    
+    split_offsets = np.cumsum([0] + split_sizes[:-1])
+    split_offsets = np.append(split_offsets, len(permutation))
+    np.savez(GetDataSplitFile(file_header), permutation=permutation, \
+             split_names=np.array(split_names), \
+             split_offsets=split_offsets, \
+             seed=(-1 if seed is None else seed))
+    return 
+
+def GetDataSplitNames(file_header:str):
+    """Get the names of the splits stored in the split index of a data set.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :return: data split names.
+    :rtype: list[str]
+    """
+    with np.load(GetDataSplitFile(file_header)) as split_data:
+        split_names = [str(s) for s in split_data["split_names"]]
+    return split_names
+
+def GetDataSplitIndices(file_header:str, split_name:str):
+    """Get the row indices of the full data set belonging to a data split.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :param split_name: name of the data split (e.g. "train", "test", or "val").
+    :type split_name: str
+    :raises Exception: if the data split is not defined in the split index.
+    :return: row indices of the data split.
+    :rtype: np.ndarray[int]
+    """
+    with np.load(GetDataSplitFile(file_header)) as split_data:
+        split_names = [str(s) for s in split_data["split_names"]]
+        if split_name not in split_names:
+            raise Exception("Data split " + split_name + " not defined in " + GetDataSplitFile(file_header))
+        iSplit = split_names.index(split_name)
+        split_offsets = split_data["split_offsets"]
+        idx_split = split_data["permutation"][split_offsets[iSplit]:split_offsets[iSplit+1]]
+    return idx_split
+
+def GetDataSetFingerprint(file_header:str):
+    """Get a fingerprint of the data files belonging to a data set, based on the content of the csv files, the 
+    binary column storage, and the split index. The fingerprint changes whenever the data in any of the data set 
+    files changes, and is independent of the location and modification time of the files.
+
+    :param file_header: data set file header, excluding the "_full.csv" suffix.
+    :type file_header: str
+    :return: data set fingerprint.
+    :rtype: str
+    """
+    csv_files = [file_header + suffix for suffix in ["_full.csv", "_train.csv", "_test.csv", "_val.csv"]]
+    data_files = csv_files + [GetDataSplitFile(file_header)]
+    for f in csv_files:
+        if BinaryDataExists(f):
+            bin_dir = GetBinaryDataDir(f)
+            data_files += [bin_dir + "/variables.txt"] + [bin_dir + "/column_%i.npy" % iVar for iVar in range(len(GetBinaryDataVariables(f)))]
+    
+    fingerprint = []
+    for f in data_files:
+        if os.path.isfile(f):
+            file_hash = hashlib.sha1()
+            with open(f, 'rb') as fid:
+                for chunk in iter(lambda: fid.read(1 << 20), b""):
+                    file_hash.update(chunk)
+            fingerprint.append("%s:%s" % (os.path.relpath(f, os.path.dirname(file_header)), file_hash.hexdigest()))
+    return ";".join(fingerprint)
+
+# Environment variables limiting the size of the OpenMP and BLAS thread pools.
+thread_limit_variables = ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "BLIS_NUM_THREADS", "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"]
+
+def GetAvailableCPUs():
+    """Get the CPU cores on which the current process is allowed to run.
+
+    :return: CPU core indices.
+    :rtype: list[int]
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count()))
+
+def SplitCPUs(n_workers:int):
+    """Split the CPU cores available to the current process into contiguous subsets, one per worker process. If 
+    fewer cores than workers are available, workers share cores.
+
+    :param n_workers: number of worker processes.
+    :type n_workers: int
+    :raises Exception: if the number of workers is lower than one.
+    :return: CPU core indices per worker.
+    :rtype: list[list[int]]
+    """
+    if n_workers < 1:
+        raise Exception("Number of workers should be at least one.")
+    cpus = GetAvailableCPUs()
+    if len(cpus) < n_workers:
+        return [[cpus[iWorker % len(cpus)]] for iWorker in range(n_workers)]
+    return [[int(c) for c in cpu_subset] for cpu_subset in np.array_split(cpus, n_workers)]
+
+def LimitProcessResources(cpu_subset:list[int]):
+    """Pin the current process to a subset of the CPU cores and limit the OpenMP and BLAS thread pools to the 
+    number of cores in the subset.
+
+    :param cpu_subset: CPU core indices to which the process is pinned.
+    :type cpu_subset: list[int]
+    :return: number of threads available to the process.
+    :rtype: int
+    """
+    n_threads = len(cpu_subset)
+    for var in thread_limit_variables:
+        os.environ[var] = str(n_threads)
+
+    # Thread pools of libraries loaded before the limits were set are resized at runtime.
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(limits=n_threads)
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_subset)
+    return n_threads
+
+def InitializeWorkerResources(cpu_subsets:list[list[int]]):
+    """Initializer for multiprocessing pool workers, assigning each worker a CPU subset based on its process 
+    identity.
+
+    :param cpu_subsets: CPU core indices per worker, as obtained from SplitCPUs.
+    :type cpu_subsets: list[list[int]]
+    """
+    identity = current_process()._identity
+    iWorker = (identity[0] - 1) if len(identity) > 0 else 0
+    LimitProcessResources(cpu_subsets[iWorker % len(cpu_subsets)])
+    return 
+
 def write_SU2_MLP(file_out:str, weights:list[np.ndarray], biases:list[np.ndarray],activation_function_name:str,train_vars:list[str], controlling_vars:list[str], scaler_function:str,scaler_function_vals_in:list[list[float]],scaler_function_vals_out:list[float],additional_header_info_function=None):
     """Write ASCII file that can be loaded into SU2 through the MLPCpp submodule containing the network weights and biases.
 
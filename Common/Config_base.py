@@ -51,6 +51,7 @@ class Config:
     _batch_expo:int = DefaultProperties.batch_size_exponent             # Mini-batch size exponent (base 2).
     _hidden_layer_architecture:list[int] = DefaultProperties.hidden_layer_architecture  # Hidden layer perceptron count.
     _activation_function:str = DefaultProperties.activation_function    # Hidden layer activation function name.
+    _jit_compile:bool = False                                           # Compile MLP training kernels with XLA.
 
     _scaler_function_name:str = "minmax"        # Scaler function by which MLP train data is scaled.
     _scaler_function_vals_in:list[list[float]]  # Linear scaling function values for controlling variable data.
@@ -324,6 +325,23 @@ class Config:
         """
         return self._activation_function
     
+    def SetJITCompile(self, jit_compile:bool=True):
+        """Compile the MLP train step, validation, and derivative kernels with XLA during training.
+
+        :param jit_compile: compile training kernels with XLA, defaults to True
+        :type jit_compile: bool, optional
+        """
+        self._jit_compile = jit_compile
+        return 
+    
+    def GetJITCompile(self):
+        """Get whether MLP training kernels are compiled with XLA.
+
+        :return: whether XLA compilation is used during training.
+        :rtype: bool
+        """
+        return self._jit_compile
+    
     def UpdateMLPHyperParams(self, trainer):
         """Retrieve the weights and biases from the MLP trainer class and store them in the configuration class.
 
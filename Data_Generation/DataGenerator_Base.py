@@ -40,6 +40,8 @@ class DataGenerator_Base:
 
     __train_fraction:float = DefaultProperties.train_fraction   # Fraction of fluid data used for training.
     __test_fraction:float = DefaultProperties.test_fraction     # Fraction of fluid data used for testing.
+    __write_split_files:bool = True     # Write separate train, test, and validation data files.
+    __split_seed:int = None     # Random seed for shuffling the fluid data set.
 
     __output_file_header:str   # Fluid data output file header.
 
@@ -159,6 +161,45 @@ class DataGenerator_Base:
         """
         return self.__test_fraction
     
+    def SetWriteSplitFiles(self, write_split_files:bool=True):
+        """
+        Write separate train, test, and validation data files in addition to the full data set and split index. 
+        Split files are written by default for tools reading them directly, and can be disabled to save disk space.
+
+        :param write_split_files: write train, test, and validation data files, defaults to True
+        :type write_split_files: bool, optional
+        """
+        self.__write_split_files = write_split_files
+        return 
+    
+    def GetWriteSplitFiles(self):
+        """
+        Get whether separate train, test, and validation data files are written.
+
+        :return: whether split data files are written.
+        :rtype: bool
+        """
+        return self.__write_split_files
+    
+    def SetSplitSeed(self, seed:int=None):
+        """
+        Define the random seed with which the fluid data set is shuffled before splitting into train, test, and validation data.
+
+        :param seed: random seed. If None, the global numpy random state is used.
+        :type seed: int
+        """
+        self.__split_seed = seed 
+        return 
+    
+    def GetSplitSeed(self):
+        """
+        Get the random seed with which the fluid data set is shuffled.
+
+        :return: random seed.
+        :rtype: int
+        """
+        return self.__split_seed
+    
     def ComputeData(self):
         print("Initiating data generation proces...")
         return 
@@ -40,6 +40,7 @@ np.random.seed(2)
 #---------------------------------------------------------------------------------------------#
 from Common.DataDrivenConfig import Config_NICFD
 from Common.Properties import DefaultSettings_NICFD, EntropicVars
+from Common.CommonMethods import WriteBinaryData, WriteDataSplit
 from Data_Generation.DataGenerator_Base import DataGenerator_Base
 
 
@@ -465,7 +466,7 @@ class DataGenerator_CoolProp(DataGenerator_Base):
         return 
     
     def SaveData(self):
-        """Save fluid data in separate files for train, test and validation.
+        """Save fluid data set and the index by which it is split into train, test, and validation data.
         """
 
         # Define output files for all, train, test, and validation data.
@@ -503,39 +504,54 @@ class DataGenerator_CoolProp(DataGenerator_Base):
         # remove inf values
         full_data = full_data[~np.isinf(full_data).any(axis=1), :]
         full_data = full_data[~np.isnan(full_data).any(axis=1), :]
-        # Shuffle data array.
-        np.random.shuffle(full_data)
 
-        # Define number of training and test data points.
+        # Shuffle data array. The splits are stored as consecutive blocks of the shuffled data set.
         Np_full = np.shape(full_data)[0]
+        if self.GetSplitSeed() is None:
+            full_data = full_data[np.random.permutation(Np_full), :]
+        else:
+            full_data = full_data[np.random.RandomState(self.GetSplitSeed()).permutation(Np_full), :]
+        split_index = np.arange(Np_full)
+
+        # Define number of training and test data points.
         Np_train = int(self.GetTrainFraction()*Np_full)
         Np_test = int(self.GetTestFraction()*Np_full)
 
-        train_data = full_data[:Np_train, :]
-        test_data = full_data[Np_train:Np_train+Np_test, :]
-        val_data = full_data[Np_train+Np_test:, :]
+        file_header = self.GetOutputDir() + "/" + self.GetConcatenationFileHeader()
+        WriteDataSplit(file_header, split_index, ["train","test","val"], [Np_train, Np_test, Np_full - Np_train - Np_test], self.GetSplitSeed())
 
-        # Write output data files.
+        # Write full data set.
+        varnames = [v.name for v in all_vars]
         with open(full_file,"w+") as fid:
-            fid.write(",".join(v.name for v in all_vars) + "\n")
+            fid.write(",".join(varnames) + "\n")
             csvWriter = csv.writer(fid)
             csvWriter.writerows(full_data)
-        
-        with open(train_file,"w+") as fid:
-            fid.write(",".join(v.name for v in all_vars) + "\n")
-            csvWriter = csv.writer(fid)
-            csvWriter.writerows(train_data)
-
-        with open(test_file,"w+") as fid:
-            fid.write(",".join(v.name for v in all_vars) + "\n")
-            csvWriter = csv.writer(fid)
-            csvWriter.writerows(test_data)
+        WriteBinaryData(full_file, varnames, full_data)
 
-        with open(val_file,"w+") as fid:
-            fid.write(",".join(v.name for v in all_vars) + "\n")
-            csvWriter = csv.writer(fid)
-            csvWriter.writerows(val_data)
+        # Optionally write separate train, test, and validation data files.
+        if self.GetWriteSplitFiles():
+            train_data = full_data[:Np_train, :]
+            test_data = full_data[Np_train:Np_train+Np_test, :]
+            val_data = full_data[Np_train+Np_test:, :]
+            
+            with open(train_file,"w+") as fid:
+                fid.write(",".join(varnames) + "\n")
+                csvWriter = csv.writer(fid)
+                csvWriter.writerows(train_data)
+
+            with open(test_file,"w+") as fid:
+                fid.write(",".join(varnames) + "\n")
+                csvWriter = csv.writer(fid)
+                csvWriter.writerows(test_data)
+
+            with open(val_file,"w+") as fid:
+                fid.write(",".join(varnames) + "\n")
+                csvWriter = csv.writer(fid)
+                csvWriter.writerows(val_data)
             
+            WriteBinaryData(train_file, varnames, train_data)
+            WriteBinaryData(test_file, varnames, test_data)
+            WriteBinaryData(val_file, varnames, val_data)
         return 
     
     def GetStateData(self):
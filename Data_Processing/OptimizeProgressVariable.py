@@ -32,6 +32,9 @@ from tqdm import tqdm
 import matplotlib.pyplot as plt 
 from scipy.optimize import differential_evolution, Bounds, LinearConstraint, minimize
 from sklearn.decomposition import PCA
+from multiprocessing import Pool
+
+from Common.CommonMethods import SplitCPUs, InitializeWorkerResources
 
 from Common.Properties import FGMVars, DefaultProperties
 from Common.DataDrivenConfig import Config_FGM
@@ -67,6 +70,7 @@ class PVOptimizer:
     _min_fitness = 1.0  # Current minimum fitness value.
 
     _n_workers:int=1   # Number of CPUs used to compute the population merit in parallel.
+    _cpu_subsets:list[list[int]] = None # CPU cores assigned to each worker.
 
     __CurveStepTolerance:float = 1e-4       # Progress vector increment threshold.
     __SpeciesRangeTolerance:float = 1e-5    # Species range threshold.
@@ -179,8 +183,23 @@ class PVOptimizer:
         if n_workers < 1:
             raise Exception("The number of workers used during the optimization process should be at least one.")
         self._n_workers = n_workers
+        if self._n_workers > 1:
+            self._cpu_subsets = SplitCPUs(self._n_workers)
+        else:
+            self._cpu_subsets = None
         return
     
+    def _GetWorkerPool(self):
+        """Start a pool of worker processes for the population merit computation. Each worker is pinned to its own 
+        subset of the CPU cores and its BLAS thread pool is limited to the size of the subset.
+
+        :return: worker pool, None if no parallel processing is used.
+        :rtype: multiprocessing.Pool
+        """
+        if self._n_workers > 1:
+            return Pool(self._n_workers, initializer=InitializeWorkerResources, initargs=(self._cpu_subsets,))
+        return None
+    
     def SetAdditionalProgressVariables(self, additional_vars:list[str]):
         """Add additional variables to the progress vector.
 
@@ -459,16 +478,23 @@ class PVOptimizer:
 
         # Initiate evolutionary algorithm.
         print("Generation,Penalty," + ",".join(s for s in self._pv_definition_optim))
-        result = differential_evolution(func = self.penalty_function,\
-                                        callback=self._Optimization_Callback,\
-                                        maxiter=self._N_generations,\
-                                        popsize=self._population_size,\
-                                        bounds=bounds,\
-                                        workers=self._n_workers,\
-                                        updating=update_strategy,\
-                                        strategy='best1exp',\
-                                        seed=1,\
-                                        tol=1e-3)
+        pool = self._GetWorkerPool()
+        try:
+            result = differential_evolution(func = self.penalty_function,\
+                                            callback=self._Optimization_Callback,\
+                                            maxiter=self._N_generations,\
+                                            popsize=self._population_size,\
+                                            bounds=bounds,\
+                                            workers=(pool.map if pool is not None else 1),\
+                                            updating=update_strategy,\
+                                            strategy='best1exp',\
+                                            seed=1,\
+                                            tol=1e-3)
+        finally:
+            # Worker processes are stopped also when the optimization is interrupted.
+            if pool is not None:
+                pool.terminate()
+                pool.join()
         
         # Initiate simplex search algorithm.
         result = minimize(self.penalty_function, \
@@ -906,16 +932,23 @@ class PVOptimizer_Niu(PVOptimizer):
         #self._monotonicity_full = LinearConstraint(A_constr, lb=-1e-4,keep_feasible=True)
         # Initiate evolutionary algorithm.
         print("Generation,Penalty," + ",".join(s for s in self._pv_definition_optim))
-        result = differential_evolution(func = self.penalty_function,\
-                                        callback=self._Optimization_Callback,\
-                                        maxiter=self._N_generations,\
-                                        popsize=self._population_size,\
-                                        bounds=bounds,\
-                                        workers=self._n_workers,\
-                                        updating=update_strategy,\
-                                        strategy='best1exp',\
-                                        seed=1,\
-                                        tol=1e-3)
+        pool = self._GetWorkerPool()
+        try:
+            result = differential_evolution(func = self.penalty_function,\
+                                            callback=self._Optimization_Callback,\
+                                            maxiter=self._N_generations,\
+                                            popsize=self._population_size,\
+                                            bounds=bounds,\
+                                            workers=(pool.map if pool is not None else 1),\
+                                            updating=update_strategy,\
+                                            strategy='best1exp',\
+                                            seed=1,\
+                                            tol=1e-3)
+        finally:
+            # Worker processes are stopped also when the optimization is interrupted.
+            if pool is not None:
+                pool.terminate()
+                pool.join()
         
         # Initiate simplex search algorithm.
         result = minimize(self.penalty_function, \
@@ -39,6 +39,7 @@ colors = prop_cycle.by_key()['color']
 
 from Common.DataDrivenConfig import Config_FGM
 from Common.Properties import DefaultSettings_FGM, FGMVars
+from Common.CommonMethods import WriteBinaryData, WriteDataSplit
 
 class FlameletConcatenator:
     """Read, regularize, and concatenate flamelet data for MLP training or LUT generation.
@@ -57,6 +58,8 @@ class FlameletConcatenator:
 
     __f_train:float = DefaultSettings_FGM.train_fraction   # Fraction of the flamelet data used for training.
     __f_test:float = DefaultSettings_FGM.test_fraction    # Fraction of the flamelet data used for testing.
+    __write_split_files:bool = True     # Write separate train, test, and validation data files.
+    __split_seed:int = None     # Random seed for shuffling the concatenated flamelet data.
 
     __output_file_header:str = DefaultSettings_FGM.output_file_header   # File header for the concatenated flamelet data file.
     __boundary_file_header:str = DefaultSettings_FGM.boundary_file_header
@@ -322,6 +325,41 @@ class FlameletConcatenator:
             raise Exception("Test fraction should be between zero and one.")
         self.__f_test = input 
         return
+    
+    def SetWriteSplitFiles(self, write_split_files:bool=True):
+        """Write separate train, test, and validation data files in addition to the full data set and split index. 
+        Split files are written by default for tools reading them directly, and can be disabled to save disk space.
+
+        :param write_split_files: write train, test, and validation data files, defaults to True
+        :type write_split_files: bool, optional
+        """
+        self.__write_split_files = write_split_files
+        return 
+    
+    def SetSplitSeed(self, seed:int=None):
+        """Define the random seed with which the concatenated flamelet data is shuffled before splitting.
+
+        :param seed: random seed. If None, the global numpy random state is used.
+        :type seed: int
+        """
+        self.__split_seed = seed
+        return
+
+    def GetWriteSplitFiles(self):
+        """Get whether separate train, test, and validation data files are written.
+
+        :return: whether split data files are written.
+        :rtype: bool
+        """
+        return self.__write_split_files
+
+    def GetSplitSeed(self):
+        """Get the random seed with which the concatenated flamelet data is shuffled.
+
+        :return: random seed.
+        :rtype: int
+        """
+        return self.__split_seed
 
     def ConcatenateFlameletData(self):
         """Read flamelets and concatenate relevant flamelet data in the appropriate resolution.
@@ -433,7 +471,7 @@ class FlameletConcatenator:
         return 
     
     def __WriteOutputFiles(self):
-        """Collect all flamelet data arrays, split into train, test, and validation portions, and write to appropriately named files.
+        """Collect all flamelet data arrays, define the train, test, and validation split, and write to appropriately named files.
         """
 
         # Collect all variable names in the manifold.
@@ -460,43 +498,59 @@ class FlameletConcatenator:
         # Remove any empty rows.
         total_data = total_data[~np.all(total_data == 0, axis=1)]
 
-        # Shuffle flamelet data to remove bias.
-        np.random.shuffle(total_data)
+        # Shuffle flamelet data to remove bias. The splits are stored as consecutive blocks of the shuffled data set.
+        if self.__split_seed is None:
+            total_data = total_data[np.random.permutation(len(total_data)), :]
+        else:
+            total_data = total_data[np.random.RandomState(self.__split_seed).permutation(len(total_data)), :]
+        split_index = np.arange(len(total_data))
 
         # Number of data points for training and testing.
         np_train = int(self.__f_train*len(total_data))
         np_val = int(self.__f_test*len(total_data))
+        np_test = len(total_data) - np_train - np_val
 
-        train_data = total_data[:np_train, :]
-        val_data = total_data[np_train:np_train+np_val, :]
-        test_data = total_data[np_train+np_val:, :]
-
-        # Write full, train, validation, and test data files.
+        # Write full data file and split index.
         if self.__verbose > 0:
             print("Writing output files with header " + self.__output_file_header)
-        fid = open(self.__flameletdata_dir +"/"+ self.__output_file_header + "_full.csv", "w+")
+        varnames = [v for v in total_variables.split(",") if len(v) > 0]
+        file_header = self.__flameletdata_dir +"/"+ self.__output_file_header
+        WriteDataSplit(file_header, split_index, ["train","val","test"], [np_train, np_val, np_test], self.__split_seed)
+
+        fid = open(file_header + "_full.csv", "w+")
         fid.write(total_variables + "\n")
         csvwriter = csv.writer(fid)
         csvwriter.writerows(total_data)
         fid.close()
+        WriteBinaryData(file_header + "_full.csv", varnames, total_data)
+
+        # Optionally write separate train, validation, and test data files.
+        if self.__write_split_files:
+            train_data = total_data[:np_train, :]
+            val_data = total_data[np_train:np_train+np_val, :]
+            test_data = total_data[np_train+np_val:, :]
+
+            fid = open(file_header + "_train.csv", "w+")
+            fid.write(total_variables + "\n")
+            csvwriter = csv.writer(fid)
+            csvwriter.writerows(train_data)
+            fid.close()
 
-        fid = open(self.__flameletdata_dir +"/"+ self.__output_file_header + "_train.csv", "w+")
-        fid.write(total_variables + "\n")
-        csvwriter = csv.writer(fid)
-        csvwriter.writerows(train_data)
-        fid.close()
+            fid = open(file_header + "_val.csv", "w+")
+            fid.write(total_variables + "\n")
+            csvwriter = csv.writer(fid)
+            csvwriter.writerows(val_data)
+            fid.close()
 
-        fid = open(self.__flameletdata_dir +"/"+ self.__output_file_header + "_val.csv", "w+")
-        fid.write(total_variables + "\n")
-        csvwriter = csv.writer(fid)
-        csvwriter.writerows(val_data)
-        fid.close()
+            fid = open(file_header + "_test.csv", "w+")
+            fid.write(total_variables + "\n")
+            csvwriter = csv.writer(fid)
+            csvwriter.writerows(test_data)
+            fid.close()
 
-        fid = open(self.__flameletdata_dir +"/"+ self.__output_file_header + "_test.csv", "w+")
-        fid.write(total_variables + "\n")
-        csvwriter = csv.writer(fid)
-        csvwriter.writerows(test_data)
-        fid.close()
+            WriteBinaryData(file_header + "_train.csv", varnames, train_data)
+            WriteBinaryData(file_header + "_val.csv", varnames, val_data)
+            WriteBinaryData(file_header + "_test.csv", varnames, test_data)
         if self.__verbose > 0:
             print("Done!")
         return 
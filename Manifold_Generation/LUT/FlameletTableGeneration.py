@@ -29,7 +29,7 @@ import matplotlib.pyplot as plt
 from tqdm import tqdm
 import sys,os
 from Common.DataDrivenConfig import Config_FGM, Config
-from Common.CommonMethods import GetReferenceData 
+from Common.CommonMethods import GetReferenceData, GetReferenceDataSplits, SplitCPUs, InitializeWorkerResources
 from Common.Properties import DefaultSettings_FGM
 import cantera as ct
 import gmsh 
@@ -132,11 +132,10 @@ class SU2TableGenerator_Base:
         CV_full_scaled = self._control_var_scaler.fit_transform(CV_full)
 
         # Exctract train and test data
-        train_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_train.csv"
-        test_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_test.csv"
+        file_header = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()
         
-        CV_train, D_train = GetReferenceData(train_data_file, self._controlling_variables, self._manifold_variables)
-        CV_test, D_test = GetReferenceData(test_data_file, self._controlling_variables, self._manifold_variables)
+        (CV_train, D_train), (CV_test, D_test) = GetReferenceDataSplits(file_header, \
+                                                                        self._controlling_variables, self._manifold_variables, ["train","test"])
         
         CV_train_scaled = self._control_var_scaler.transform(CV_train)
         CV_test_scaled = self._control_var_scaler.transform(CV_test)
@@ -201,6 +200,7 @@ class SU2TableGenerator:
 
     __run_parallel:bool = False 
     __Np_cores:int = 1 
+    __cpu_subsets:list[list[int]] = None    # CPU cores assigned to each table level worker.
 
     _N_table_levels:int = 100   # Number of table levels.
     _mixfrac_range_table:np.ndarray[float] = None   # Mixture fraction values of the table levels.
@@ -345,7 +345,8 @@ class SU2TableGenerator:
         return
     
     def SetNCores(self, n_cores:int):
-        """Set the number of cores and enable parallel computing of the table level connectivity generation.
+        """Set the number of cores and enable parallel computing of the table level connectivity generation. Each 
+        worker is pinned to its own subset of the available CPU cores and its BLAS thread pool is limited accordingly.
 
         :param n_cores: number of cores to distribute tasks over.
         :type n_cores: int
@@ -354,6 +355,7 @@ class SU2TableGenerator:
         if n_cores < 1:
             raise Exception("Number of cores should be at least one.")
         self.__Np_cores = n_cores 
+        self.__cpu_subsets = SplitCPUs(n_cores)
         self.__run_parallel = True 
         return 
     
@@ -380,13 +382,12 @@ class SU2TableGenerator:
         CV_full_scaled = self._scaler.fit_transform(CV_full)
 
         # Exctract train and test data
-        train_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_train.csv"
-        test_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_test.csv"
+        file_header = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()
         
         var_to_test_for = "ProdRateTot_PV"
         
-        D_train = np.loadtxt(train_data_file,delimiter=',',skiprows=1)
-        D_test = np.loadtxt(test_data_file,delimiter=',',skiprows=1)
+        (_, D_train), (_, D_test) = GetReferenceDataSplits(file_header, \
+                                                           [], self._Flamelet_Variables, ["train","test"], dtype=np.float64)
         
         CV_train = np.vstack(tuple(D_train[:, self._Flamelet_Variables.index(c)] for c in self._controlling_variables)).T 
         CV_test = np.vstack(tuple(D_test[:, self._Flamelet_Variables.index(c)] for c in self._controlling_variables)).T 
@@ -488,7 +489,7 @@ class SU2TableGenerator:
         NHull = 0
         NNodes = 0
         if self.__run_parallel:
-            pool = Pool(self.__Np_cores)
+            pool = Pool(self.__Np_cores, initializer=InitializeWorkerResources, initargs=(self.__cpu_subsets,))
             results = pool.map(self.ComputeTableNodes, [i for i in range(self._N_table_levels)])
             pool.close()
             for iLevel in range(self._N_table_levels):
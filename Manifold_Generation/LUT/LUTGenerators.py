@@ -29,6 +29,7 @@ import matplotlib.pyplot as plt
 from tqdm import tqdm
 import sys,os
 from Common.DataDrivenConfig import Config_NICFD
+from Common.CommonMethods import GetReferenceDataSplits
 import cantera as ct
 import gmsh 
 import pickle
@@ -116,26 +117,23 @@ class SU2TableGenerator:
 
         print("Loading fluid data...")
         # Define scaler for FGM controlling variables.
-        full_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_full.csv"
-        with open(full_data_file,'r') as fid:
+        file_header = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()
+        with open(file_header + "_full.csv",'r') as fid:
             self._Fluid_Variables = fid.readline().strip().split(',')
-        D_full = np.loadtxt(full_data_file,delimiter=',',skiprows=1)
+
+        # Exctract full and test data. The full data set is used for training the lookup tree.
+        var_to_test_for = "d2sdrho2"
+        
+        (_, D_train), (_, D_test) = GetReferenceDataSplits(file_header, \
+                                                           [], self._Fluid_Variables, ["full","test"], dtype=np.float64)
+        
         self._scaler = MinMaxScaler()
-        self.CV_full = np.vstack(tuple(D_full[:, self._Fluid_Variables.index(c)] for c in self._controlling_variables)).T
+        self.CV_full = np.vstack(tuple(D_train[:, self._Fluid_Variables.index(c)] for c in self._controlling_variables)).T
         self.__min_CV, self.__max_CV = np.min(self.CV_full,axis=0), np.max(self.CV_full,axis=0)
 
         CV_full_scaled = self._scaler.fit_transform(self.CV_full)
 
-        # Exctract train and test data
-        train_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_full.csv"
-        test_data_file = self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader()+"_test.csv"
-        
-        var_to_test_for = "d2sdrho2"
-        
-        D_train = np.loadtxt(train_data_file,delimiter=',',skiprows=1)
-        D_test = np.loadtxt(test_data_file,delimiter=',',skiprows=1)
-        
-        CV_train = np.vstack(tuple(D_train[:, self._Fluid_Variables.index(c)] for c in self._controlling_variables)).T 
+        CV_train = self.CV_full
         CV_test = np.vstack(tuple(D_test[:, self._Fluid_Variables.index(c)] for c in self._controlling_variables)).T 
 
         CV_train_scaled = self._scaler.transform(CV_train)
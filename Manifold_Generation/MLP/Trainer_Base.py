@@ -46,10 +46,16 @@ from sklearn.metrics import r2_score
 from sklearn.preprocessing import MinMaxScaler, RobustScaler, StandardScaler
 from keras.initializers import HeUniform,RandomUniform
 import csv 
+import hashlib
+import pickle
+import shutil
+import copy
+import types
 
 from Common.Config_base import Config
 from Common.Properties import DefaultProperties 
-from Common.CommonMethods import GetReferenceData, write_SU2_MLP
+from Common.CommonMethods import GetReferenceData, write_SU2_MLP, DataSplitExists, GetDataSplitIndices, GetDataSetFingerprint,\
+                                 BinaryDataExists, GetBinaryDataLength, ReadBinaryDataRows
 
 # Activation function options
 activation_function_names_options:list[str] = ["linear","elu","relu","tanh","exponential","gelu","sigmoid", "swish"]
@@ -65,6 +71,119 @@ activation_function_options = [tf.keras.activations.linear,
 scaler_functions = {"robust":RobustScaler,\
                     "standard":StandardScaler,\
                     "minmax":MinMaxScaler}
+
+_worker_configuration:tuple = None  # Data-parallel worker configuration applied to the TensorFlow runtime of the current process.
+
+def GetCodeFingerprint(code:types.CodeType):
+    """Get a fingerprint of a compiled function, covering its byte code, constants, and referenced names. Constants 
+    which are code objects themselves (e.g. nested functions) are fingerprinted recursively.
+
+    :param code: compiled function code.
+    :type code: types.CodeType
+    :return: code fingerprint.
+    :rtype: str
+    """
+    entries = [code.co_code.hex(), ",".join(code.co_names)]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            entries.append(GetCodeFingerprint(const))
+        else:
+            entries.append(repr(const))
+    return hashlib.sha1("|".join(entries).encode()).hexdigest()
+
+class SharedTrainData:
+    """Reference data storage shared among MLP trainers that train on the same data set. Data set columns are read 
+    only once and input scalers are fitted only once for all trainers.
+    """
+    __columns:dict = None   # Loaded data columns per data file.
+    __scalers:dict = None   # Fitted scalers per data file, scaler type, and variables.
+    __arrays:dict = None    # Pre-processed arrays shared among trainers.
+
+    def __init__(self):
+        self.__columns = {}
+        self.__scalers = {}
+        self.__arrays = {}
+        return 
+    
+    def LoadData(self, dataset_file:str, variables:list[str]):
+        """Read the columns of the requested variables from a data file. Columns which were loaded previously are not read again.
+        Columns are stored in double precision, such that trainers with different precision settings can share them.
+
+        :param dataset_file: file path name of the data set.
+        :type dataset_file: str
+        :param variables: variables to load.
+        :type variables: list[str]
+        """
+        if dataset_file not in self.__columns.keys():
+            self.__columns[dataset_file] = {}
+        vars_to_load = [v for v in variables if v not in self.__columns[dataset_file].keys()]
+        if len(vars_to_load) > 0:
+            D, _ = GetReferenceData(dataset_file, vars_to_load, [], np.float64)
+            for iVar, var in enumerate(vars_to_load):
+                self.__columns[dataset_file][var] = D[:, iVar]
+        return 
+    
+    def HasData(self, dataset_file:str, variables:list[str]):
+        """Check whether the columns of the requested variables are loaded for a data file.
+
+        :return: whether all requested columns are available.
+        :rtype: bool
+        """
+        return (dataset_file in self.__columns.keys()) and all([v in self.__columns[dataset_file].keys() for v in variables])
+    
+    def GetData(self, dataset_file:str, x_vars:list[str], train_variables:list[str], dtype=np.float32):
+        """Collect input-output pairs from the loaded data columns, analogous to GetReferenceData. The stored 
+        double precision columns are cast to the requested data type.
+
+        :return: data arrays for controlling variable and dependent variable data.
+        :rtype: np.ndarray[float],np.ndarray[float]
+        """
+        columns = self.__columns[dataset_file]
+        n_rows = len(next(iter(columns.values())))
+        def stack_columns(variables):
+            if len(variables) == 0:
+                return np.zeros([n_rows, 0], dtype=dtype)
+            return np.stack([columns[v] for v in variables], axis=1).astype(dtype, copy=False)
+        return stack_columns(x_vars), stack_columns(train_variables)
+    
+    def FitScaler(self, scaler, dataset_file:str, variables:list[str], data:np.ndarray):
+        """Fit a scaler to data, or copy the fitted parameters if an equivalent scaler was fitted before.
+
+        :param scaler: scaler to fit.
+        :param dataset_file: file path name of the data set from which the data was read.
+        :type dataset_file: str
+        :param variables: variables in the data array.
+        :type variables: list[str]
+        :param data: data to fit the scaler to.
+        :type data: np.ndarray
+        """
+        key = (dataset_file, type(scaler).__name__, tuple(variables), np.dtype(data.dtype).name)
+        if key in self.__scalers.keys():
+            scaler.__dict__.update(copy.deepcopy(self.__scalers[key].__dict__))
+        else:
+            scaler.fit(data)
+            self.__scalers[key] = copy.deepcopy(scaler)
+        return 
+    
+    def SetArrays(self, name:str, arrays):
+        """Store pre-processed arrays to share among trainers.
+
+        :param name: name under which the arrays are stored.
+        :type name: str
+        :param arrays: arrays to share.
+        """
+        self.__arrays[name] = arrays 
+        return 
+    
+    def GetArrays(self, name:str):
+        """Retrieve shared pre-processed arrays.
+
+        :param name: name under which the arrays are stored.
+        :type name: str
+        :return: shared arrays, None if not available.
+        """
+        return self.__arrays.get(name, None)
+    
 class MLPTrainer:
     # Base class for flamelet MLP trainer
     _dt = tf.float32
@@ -139,6 +258,8 @@ class MLPTrainer:
 
     _stagnation_tolerance:float = 1e-11 
     _stagnation_patience:int = 200
+    _epoch_callback = None      # Function of the epoch index and validation loss. Training stops if it returns False.
+    _pruned:bool = False        # Training was stopped by the epoch callback.
     _verbose:int = 1
 
     callback_every:int = 20 
@@ -152,11 +273,488 @@ class MLPTrainer:
     _loaded_custom_weights:bool = False
     _custom_weights:list[np.ndarray[float]] = None 
     _custom_biases:list[np.ndarray[float]] = None 
+
+    _use_data_cache:bool = False    # Re-use normalized train, test, and validation data from previous trainings.
+    _data_cache_dir:str = None      # Directory in which normalized data is cached.
+
+    _streaming:bool = False         # Stream train data from disk instead of loading it into memory.
+    _stream_chunk_size:int = 2**16  # Number of train data points read from disk at once in streaming mode.
+    _stream_scaler_samples:int = 2**20  # Number of data points used to fit robust scalers in streaming mode.
+    _stream_scaler_seed:int = 0         # Random seed for selecting the data points used to fit robust scalers.
+
+    # Train data input pipeline settings.
+    _shuffle_train_data:bool = False    # Reshuffle the train data every epoch.
+    _shuffle_seed:int = None            # Random seed for reshuffling the train data.
+    _prefetch_train_data:bool = True    # Prepare the next batches while the current batch is being trained on.
+    _cache_train_data:bool = False      # Cache streamed and normalized train data after the first epoch.
+    _cache_train_file:str = ""          # File to cache streamed train data in. Data is cached in memory if empty.
+    _n_parallel_calls:int = tf.data.AUTOTUNE    # Number of parallel calls used for batch preparation.
+    _log_throughput:bool = False        # Print train data throughput every epoch.
+    throughput_history:list = []        # Train data throughput (samples per second) for every epoch.
+    _graph_epoch:bool = False           # Run the batch loop of each epoch in a single compiled function.
+    _drop_remainder:bool = False        # Skip the incomplete last train batch of each epoch.
+    trace_history:list = []             # Number of function (re-)traces for every epoch.
+
+    _jit_compile:bool = False               # Compile training kernels with XLA.
+    _jit_compile_functions:list[str] = []   # Names of the compiled functions which are recompiled with XLA.
+
+    _eval_chunk_size:int = 2**18    # Number of data points evaluated at once for validation and test loss computation.
+    _validate_every:int = 1         # Number of epochs between validation loss evaluations.
+    _val_subsample_size:int = None  # Size of the validation subsample used between checkpoints. Full set is used if None.
+    _val_subsample_seed:int = 0     # Random seed for selecting the validation subsample.
+
+    _precision_policy:str = "float32"   # Floating point precision policy used for training.
+    _precision_policy_options:list[str] = ["float32", "float64", "mixed_float16", "mixed_bfloat16"]
+
+    _shared_data:SharedTrainData = None # Reference data shared with other trainers on the same data set.
+
+    # Data-parallel training settings.
+    _n_workers:int = 1              # Number of data-parallel workers among which each batch is sharded.
+    _intra_op_threads:int = None    # Number of threads used to run a single operation, per worker.
+    _inter_op_threads:int = None    # Number of operations run concurrently, per worker.
     
     def __init__(self):
         """Initiate MLP trainer object.
         """
         return    
+    
+    def SetDataCache(self, use_cache:bool=True, cache_dir:str=None):
+        """Store the normalized train, test, and validation data and scaler parameters on disk such that subsequent 
+        trainings on the same data set skip reading and normalizing the data files. The cache is only used by trainers 
+        which do not override GetTrainTestValData, as any side effects of reading the data are skipped on a cache hit.
+
+        :param use_cache: use cached normalized data, defaults to True
+        :type use_cache: bool, optional
+        :param cache_dir: directory in which to store cached data, defaults to a "data_cache" folder next to the train data files.
+        :type cache_dir: str, optional
+        """
+        self._use_data_cache = use_cache
+        self._data_cache_dir = cache_dir
+        return 
+    
+    def SetStreamingMode(self, streaming:bool=True, chunk_size:int=2**16):
+        """Stream the train data from disk in shuffled chunks during training instead of loading the complete train 
+        set into memory. Requires binary column storage and a split index of the data set.
+
+        :param streaming: enable streaming mode, defaults to True
+        :type streaming: bool, optional
+        :param chunk_size: number of data points read from disk at once, defaults to 2**16
+        :type chunk_size: int, optional
+        :raises Exception: if the chunk size is lower than one.
+        """
+        if chunk_size < 1:
+            raise Exception("Streaming chunk size should be at least one.")
+        self._streaming = streaming 
+        self._stream_chunk_size = chunk_size
+        return 
+    
+    def SetShuffleTrainData(self, shuffle:bool=True, seed:int=None):
+        """Reshuffle the train data every epoch.
+
+        :param shuffle: reshuffle train data every epoch, defaults to True
+        :type shuffle: bool, optional
+        :param seed: random seed for reshuffling, defaults to None
+        :type seed: int, optional
+        """
+        self._shuffle_train_data = shuffle 
+        self._shuffle_seed = seed 
+        return 
+    
+    def SetPrefetchTrainData(self, prefetch:bool=True):
+        """Prepare the next train data batches while training on the current batch.
+
+        :param prefetch: prefetch train data batches, defaults to True
+        :type prefetch: bool, optional
+        """
+        self._prefetch_train_data = prefetch 
+        return 
+    
+    def SetCacheTrainData(self, cache:bool=True, cache_file:str=""):
+        """Cache the streamed and normalized train data after the first epoch, such that subsequent epochs skip reading
+        from disk. Only applies to streaming mode.
+
+        :param cache: cache streamed train data, defaults to True
+        :type cache: bool, optional
+        :param cache_file: file in which to cache the train data. Data is cached in memory if empty, defaults to ""
+        :type cache_file: str, optional
+        """
+        self._cache_train_data = cache 
+        self._cache_train_file = cache_file
+        return 
+    
+    def SetParallelCalls(self, n_parallel_calls:int=None):
+        """Set the number of parallel calls used to prepare train data batches.
+
+        :param n_parallel_calls: number of parallel calls. Tuned automatically if None, defaults to None
+        :type n_parallel_calls: int, optional
+        :raises Exception: if the number of parallel calls is lower than one.
+        """
+        if n_parallel_calls is None:
+            self._n_parallel_calls = tf.data.AUTOTUNE
+        else:
+            if n_parallel_calls < 1:
+                raise Exception("Number of parallel calls should be at least one.")
+            self._n_parallel_calls = n_parallel_calls
+        return 
+    
+    def SetLogThroughput(self, log_throughput:bool=True):
+        """Print the train data throughput in samples per second every epoch.
+
+        :param log_throughput: print train data throughput, defaults to True
+        :type log_throughput: bool, optional
+        """
+        self._log_throughput = log_throughput
+        return 
+    
+    def SetGraphEpoch(self, graph_epoch:bool=True):
+        """Run the complete batch loop of each epoch inside a single compiled function rather than calling the 
+        train step from Python for every batch. Only applies to custom training loops.
+
+        :param graph_epoch: compile the batch loop of each epoch, defaults to True
+        :type graph_epoch: bool, optional
+        """
+        self._graph_epoch = graph_epoch
+        return 
+    
+    def SetDropRemainder(self, drop_remainder:bool=True):
+        """Skip the incomplete last train batch of each epoch, such that all train batches have the same shape. 
+        This prevents re-compilation of XLA-compiled train steps for the last batch.
+
+        :param drop_remainder: skip the incomplete last train batch, defaults to True
+        :type drop_remainder: bool, optional
+        """
+        self._drop_remainder = drop_remainder
+        return 
+    
+    def SetJITCompile(self, jit_compile:bool=True):
+        """Compile the train step, validation, and derivative kernels with XLA.
+
+        :param jit_compile: compile training kernels with XLA, defaults to True
+        :type jit_compile: bool, optional
+        """
+        self._jit_compile = jit_compile
+        return 
+    
+    def SetEvaluationChunkSize(self, chunk_size:int=2**18):
+        """Set the number of data points for which the validation and test loss are evaluated at once.
+
+        :param chunk_size: number of data points per evaluation chunk, defaults to 2**18
+        :type chunk_size: int, optional
+        :raises Exception: if the chunk size is lower than one.
+        """
+        if chunk_size < 1:
+            raise Exception("Evaluation chunk size should be at least one.")
+        self._eval_chunk_size = chunk_size
+        return 
+    
+    def SetValidationFrequency(self, validate_every:int=1):
+        """Set the number of epochs between validation loss evaluations. The validation loss is always evaluated 
+        at checkpoints and at the final epoch. Only applies to custom training loops.
+
+        :param validate_every: number of epochs between validation loss evaluations, defaults to 1
+        :type validate_every: int, optional
+        :raises Exception: if the validation frequency is lower than one.
+        """
+        if validate_every < 1:
+            raise Exception("Number of epochs between validation should be at least one.")
+        self._validate_every = validate_every
+        return 
+    
+    def SetValidationSubsample(self, n_samples:int=None, seed:int=0):
+        """Evaluate the validation loss between checkpoints on a stratified subsample of the validation data. 
+        The full validation set is evaluated at checkpoints and at the end of training. Only applies to custom 
+        training loops.
+
+        :param n_samples: validation subsample size. The full validation set is used if None, defaults to None
+        :type n_samples: int, optional
+        :param seed: random seed for selecting the subsample, defaults to 0
+        :type seed: int, optional
+        :raises Exception: if the subsample size is lower than one.
+        """
+        if n_samples is not None and n_samples < 1:
+            raise Exception("Validation subsample size should be at least one.")
+        self._val_subsample_size = n_samples
+        self._val_subsample_seed = seed
+        return 
+    
+    def SetPrecisionPolicy(self, policy:str="float32"):
+        """Set the floating point precision policy used for training. Mixed precision policies compute the 
+        hidden layers in 16-bit floating point while storing the weights and computing the loss in float32.
+
+        :param policy: precision policy ("float32", "float64", "mixed_float16", or "mixed_bfloat16"), defaults to "float32"
+        :type policy: str, optional
+        :raises Exception: if the precision policy is not supported.
+        """
+        if policy not in self._precision_policy_options:
+            raise Exception("Precision policy \"%s\" not supported. Options are: %s" % (policy, ", ".join(self._precision_policy_options)))
+        self._precision_policy = policy
+        if policy == "float64":
+            self._dt = tf.float64
+            self._dt_np = np.float64
+        else:
+            self._dt = tf.float32
+            self._dt_np = np.float32
+        return 
+    
+    def GetPrecisionPolicy(self):
+        """Get the floating point precision policy used for training.
+
+        :return: precision policy name.
+        :rtype: str
+        """
+        return self._precision_policy
+    
+    def MixedPrecision(self):
+        """Check whether the hidden layers are computed in reduced precision.
+
+        :return: whether a mixed precision policy is used.
+        :rtype: bool
+        """
+        return self._precision_policy.startswith("mixed")
+    
+    def SetSharedData(self, shared_data:SharedTrainData=None):
+        """Read reference data and fitted input scalers from a data storage shared with other trainers.
+
+        :param shared_data: shared data storage. Data is read from file if None, defaults to None
+        :type shared_data: SharedTrainData, optional
+        """
+        self._shared_data = shared_data 
+        return 
+    
+    def LoadSharedData(self, shared_data:SharedTrainData):
+        """Load the reference data required for training into a shared data storage and fit the input scaler.
+
+        :param shared_data: shared data storage.
+        :type shared_data: SharedTrainData
+        """
+        full_file = self._filedata_train + "_full.csv"
+        shared_data.LoadData(full_file, self._controlling_vars + self._train_vars)
+        if not DataSplitExists(self._filedata_train):
+            for split_name in ["train", "test", "val"]:
+                shared_data.LoadData(self._filedata_train + "_" + split_name + ".csv", self._controlling_vars + self._train_vars)
+        X_full, _ = shared_data.GetData(full_file, self._controlling_vars, [], self._dt_np)
+        shared_data.FitScaler(scaler_functions[self.scaler_function_name](), full_file, self._controlling_vars, X_full)
+        self.SetSharedData(shared_data)
+        return 
+    
+    def ReadReferenceData(self, dataset_file:str, x_vars:list[str], y_vars:list[str]):
+        """Read input-output pairs from the shared data storage if available, otherwise from file.
+
+        :return: data arrays for controlling variable and dependent variable data.
+        :rtype: np.ndarray[float],np.ndarray[float]
+        """
+        if self._shared_data is not None and self._shared_data.HasData(dataset_file, x_vars + y_vars):
+            return self._shared_data.GetData(dataset_file, x_vars, y_vars, self._dt_np)
+        return GetReferenceData(dataset_file, x_vars, y_vars, dtype=self._dt_np)
+    
+    def FitInputScaler(self, scaler_x, dataset_file:str, x_vars:list[str], X_full:np.ndarray):
+        """Fit the controlling variable scaler, re-using the fitted scaler from the shared data storage if available.
+        """
+        if self._shared_data is not None:
+            self._shared_data.FitScaler(scaler_x, dataset_file, x_vars, X_full)
+        else:
+            scaler_x.fit(X_full)
+        return 
+    
+    def SetDataParallel(self, n_workers:int=1, intra_op_threads:int=None, inter_op_threads:int=None):
+        """Shard each train batch among multiple workers, which evaluate the loss sensitivities of their shard 
+        concurrently. The sensitivities are averaged over the workers before updating the weights. CPU workers 
+        are mapped to logical CPU devices, GPU workers to consecutive GPU cards starting from the device index. 
+        Only applies to custom training loops.
+
+        :param n_workers: number of data-parallel workers, defaults to 1
+        :type n_workers: int, optional
+        :param intra_op_threads: number of threads used to run a single operation per worker. TensorFlow default is used if None, defaults to None
+        :type intra_op_threads: int, optional
+        :param inter_op_threads: number of operations run concurrently per worker. TensorFlow default is used if None, defaults to None
+        :type inter_op_threads: int, optional
+        :raises Exception: if the number of workers or threads is lower than one.
+        """
+        if n_workers < 1:
+            raise Exception("Number of data-parallel workers should be at least one.")
+        if (intra_op_threads is not None and intra_op_threads < 1) or (inter_op_threads is not None and inter_op_threads < 1):
+            raise Exception("Number of threads per worker should be at least one.")
+        self._n_workers = n_workers
+        self._intra_op_threads = intra_op_threads
+        self._inter_op_threads = inter_op_threads
+        self.ConfigureWorkers()
+        return 
+    
+    def ConfigureWorkers(self):
+        """Configure the TensorFlow runtime for the data-parallel workers. Logical CPU devices and thread pools 
+        can only be configured before the TensorFlow runtime is initialized. Worker threads share the process 
+        thread pools, which are therefore sized to the per-worker thread count times the number of workers. The 
+        runtime is configured once per process, repeated calls with the same configuration are skipped.
+
+        :raises Exception: if the runtime was initialized with a different configuration or if insufficient GPUs are available.
+        """
+        global _worker_configuration
+        worker_configuration = (self._kind_device, self._device_index, self._n_workers, self._intra_op_threads, self._inter_op_threads)
+        if worker_configuration == _worker_configuration:
+            return 
+        try:
+            if self._n_workers > 1:
+                if self._kind_device == "CPU":
+                    cpu = tf.config.list_physical_devices("CPU")[0]
+                    logical_cpus = tf.config.get_logical_device_configuration(cpu)
+                    if logical_cpus is None or len(logical_cpus) < self._n_workers:
+                        tf.config.set_logical_device_configuration(cpu, [tf.config.LogicalDeviceConfiguration() for _ in range(self._n_workers)])
+                elif len(tf.config.list_physical_devices("GPU")) < self._device_index + self._n_workers:
+                    raise Exception("Insufficient GPUs available for %i data-parallel workers." % self._n_workers)
+            if self._intra_op_threads is not None:
+                n_intra_op_threads = self._n_workers * self._intra_op_threads
+                if tf.config.threading.get_intra_op_parallelism_threads() != n_intra_op_threads:
+                    tf.config.threading.set_intra_op_parallelism_threads(n_intra_op_threads)
+            if self._inter_op_threads is not None:
+                n_inter_op_threads = self._n_workers * self._inter_op_threads
+                if tf.config.threading.get_inter_op_parallelism_threads() != n_inter_op_threads:
+                    tf.config.threading.set_inter_op_parallelism_threads(n_inter_op_threads)
+        except RuntimeError:
+            raise Exception("Data-parallel workers and thread counts should be set before TensorFlow is initialized.")
+        _worker_configuration = worker_configuration
+        return 
+    
+    def GetWorkerDevices(self):
+        """Get the devices on which the data-parallel workers are run.
+
+        :return: list of device names, one per worker.
+        :rtype: list[str]
+        """
+        if self._kind_device == "CPU":
+            return ["/CPU:%i" % iWorker for iWorker in range(self._n_workers)]
+        return ["/GPU:%i" % (self._device_index + iWorker) for iWorker in range(self._n_workers)]
+    
+    def CompileKernels(self, element_spec=None):
+        """Re-define the training kernels listed for the trainer as XLA-compiled functions, or restore the 
+        default compiled functions if XLA compilation is disabled. If the train batch specification is provided, the 
+        train step kernels are compiled with a fixed input signature, such that incomplete batches and changing 
+        flag values do not trigger retracing.
+
+        :param element_spec: specification of the train data set elements, defaults to None
+        :type element_spec: tf.TensorSpec, optional
+        """
+        kernel_signatures = {} if element_spec is None else self.GetKernelSignatures(element_spec)
+        for kernel_name in list(dict.fromkeys(self._jit_compile_functions + list(kernel_signatures.keys()))):
+            self.__dict__.pop(kernel_name, None)
+            jit_compile = self._jit_compile and (kernel_name in self._jit_compile_functions)
+            if jit_compile or (kernel_name in kernel_signatures):
+                kernel = getattr(type(self), kernel_name).python_function
+                setattr(self, kernel_name, tf.function(kernel.__get__(self, type(self)), jit_compile=jit_compile, \
+                                                       input_signature=kernel_signatures.get(kernel_name)))
+        return 
+    
+    def GetKernelSignatures(self, element_spec):
+        """Get the input signatures of the train step kernels.
+
+        :param element_spec: specification of the train data set elements.
+        :type element_spec: tf.TensorSpec
+        :return: input signature for each train step kernel name.
+        :rtype: dict
+        """
+        return {}
+    
+    def GetTracingCount(self):
+        """Get the total number of times the compiled functions of the trainer have been traced.
+
+        :return: number of function traces.
+        :rtype: int
+        """
+        n_traces = 0
+        for function_name in dir(type(self)):
+            if isinstance(getattr(type(self), function_name, None), tf.types.experimental.GenericFunction):
+                n_traces += getattr(self, function_name).experimental_get_tracing_count()
+        return n_traces
+    
+    def GetDataCacheDir(self):
+        """Get the directory in which normalized train data is cached.
+
+        :return: data cache directory.
+        :rtype: str
+        """
+        if self._data_cache_dir is None:
+            return os.path.dirname(os.path.abspath(self._filedata_train)) + "/data_cache"
+        return self._data_cache_dir
+    
+    def GetProblemSettings(self):
+        """Get the trainer settings which affect the outcome of a training, other than the network 
+        hyper-parameters and the data set.
+
+        :return: training problem settings.
+        :rtype: list[str]
+        """
+        return [",".join(self._controlling_vars),\
+                ",".join(self._train_vars),\
+                self.scaler_function_name,\
+                self._precision_policy,\
+                "%i,%s" % (self._drop_remainder, str(self._shuffle_seed)),\
+                "%s,%i" % (str(self._val_subsample_size), self._val_subsample_seed)]
+    
+    def GetDataCacheKey(self):
+        """Get the key under which the normalized train data is cached. The key depends on the data set files, 
+        the controlling and train variables, the scaler function, the data type, and the data transformation.
+
+        :return: data cache key.
+        :rtype: str
+        """
+        transform_function = type(self).TransformData
+        cache_entries = [GetDataSetFingerprint(self._filedata_train),\
+                         ",".join(self._controlling_vars),\
+                         ",".join(self._train_vars),\
+                         self.scaler_function_name,\
+                         np.dtype(self._dt_np).name,\
+                         transform_function.__module__ + "." + transform_function.__qualname__,\
+                         GetCodeFingerprint(transform_function.__code__)]
+        return hashlib.sha1("|".join(cache_entries).encode()).hexdigest()
+    
+    def __LoadCachedTrainData(self):
+        """Load normalized train, test, and validation data and scalers from the data cache.
+
+        :return: whether cached data was found.
+        :rtype: bool
+        """
+        cache_dir = self.GetDataCacheDir() + "/" + self.GetDataCacheKey()
+        if not os.path.isdir(cache_dir):
+            return False 
+        
+        if self._verbose > 0:
+            print("Loading cached train, test, and validation data from " + cache_dir)
+        with open(cache_dir + "/scalers.pkl", "rb") as fid:
+            self.scaler_function_x, self.scaler_function_y = pickle.load(fid)
+
+        # Copy-on-write mapping, such that in-place modifications do not affect the cached data.
+        self._X_train_norm = np.load(cache_dir + "/X_train_norm.npy", mmap_mode='c')
+        self._X_test_norm = np.load(cache_dir + "/X_test_norm.npy", mmap_mode='c')
+        self._X_val_norm = np.load(cache_dir + "/X_val_norm.npy", mmap_mode='c')
+        self._Y_train_norm = np.load(cache_dir + "/Y_train_norm.npy", mmap_mode='c')
+        self._Y_test_norm = np.load(cache_dir + "/Y_test_norm.npy", mmap_mode='c')
+        self._Y_val_norm = np.load(cache_dir + "/Y_val_norm.npy", mmap_mode='c')
+        return True 
+    
+    def __WriteCachedTrainData(self):
+        """Store normalized train, test, and validation data and scalers in the data cache.
+        """
+        cache_dir = self.GetDataCacheDir() + "/" + self.GetDataCacheKey()
+        if os.path.isdir(cache_dir):
+            return 
+        os.makedirs(self.GetDataCacheDir(), exist_ok=True)
+
+        # Write to a temporary directory first such that concurrent trainings never load incomplete data.
+        tmp_dir = cache_dir + "_tmp_%i" % os.getpid()
+        os.makedirs(tmp_dir, exist_ok=True)
+        with open(tmp_dir + "/scalers.pkl", "wb") as fid:
+            pickle.dump((self.scaler_function_x, self.scaler_function_y), fid)
+        np.save(tmp_dir + "/X_train_norm.npy", self._X_train_norm)
+        np.save(tmp_dir + "/X_test_norm.npy", self._X_test_norm)
+        np.save(tmp_dir + "/X_val_norm.npy", self._X_val_norm)
+        np.save(tmp_dir + "/Y_train_norm.npy", self._Y_train_norm)
+        np.save(tmp_dir + "/Y_test_norm.npy", self._Y_test_norm)
+        np.save(tmp_dir + "/Y_val_norm.npy", self._Y_val_norm)
+        try:
+            os.rename(tmp_dir, cache_dir)
+        except OSError:
+            # Data was cached by another process in the mean time.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return 
         
     def SetVerbose(self, verbose_level:int=1):
         """Set the trainer output verbose level. 0 = no outputs, 1 = output per epoch, 2 = output for every batch.
@@ -170,6 +768,42 @@ class MLPTrainer:
         self._verbose = int(verbose_level)
         return 
     
+    def SetEpochCallback(self, epoch_callback=None):
+        """Set a function which is called with the epoch index and validation loss after each validation loss 
+        evaluation. Training is stopped if the function returns False, which allows hyper-parameter optimization 
+        schedulers to terminate unpromising trainings early.
+
+        :param epoch_callback: function of epoch index and validation loss, defaults to None
+        :type epoch_callback: callable, optional
+        """
+        self._epoch_callback = epoch_callback
+        return 
+    
+    def CheckEpochCallback(self, i_epoch:int, val_loss):
+        """Report the validation loss to the epoch callback, if any.
+
+        :param i_epoch: epoch index.
+        :type i_epoch: int
+        :param val_loss: validation loss.
+        :return: whether training should continue.
+        :rtype: bool
+        """
+        if self._epoch_callback is None:
+            return True 
+        if not self._epoch_callback(i_epoch, val_loss):
+            self._pruned = True 
+            if self._verbose > 0:
+                print("Training stopped by epoch callback at epoch %i" % i_epoch)
+        return not self._pruned
+    
+    def IsPruned(self):
+        """Check whether training was stopped by the epoch callback.
+
+        :return: training was stopped by the epoch callback.
+        :rtype: bool
+        """
+        return self._pruned
+    
     def SetFigFormat(self, fig_format:str="png"):
         """Set the format by which to save any generated images during training.
 
@@ -414,6 +1048,30 @@ class MLPTrainer:
         """
         return [b.numpy() for b in self._biases] 
     
+    def SetWeights(self, weights_input:list[np.ndarray]):
+        """Manually set the network weights values.
+
+        :param weights_input: list of network weights values.
+        :type weights_input: list[np.ndarray]
+        """
+
+        self._weights = []
+        for W in weights_input:
+            self._weights.append(tf.Variable(tf.cast(W, self._dt), self._dt))
+        return 
+    
+    def SetBiases(self, biases_input:list[np.ndarray]):
+        """Manually set the network biases values.
+
+        :param biases_input: list of network bias values.
+        :type biases_input: list[np.ndarray]
+        """
+
+        self._biases = []
+        for b in biases_input:
+            self._biases.append(tf.Variable(tf.cast(b,self._dt), self._dt))
+        return 
+    
     def PlotR2Data(self):
         """Plot the MLP prediction in the form of R2-plots w.r.t. the reference data, and along each of the 
         normalized controlling variables.
@@ -473,8 +1131,15 @@ class MLPTrainer:
         with a feature range of 0-1.
         """
 
-        self._X_train_norm, self._X_test_norm, self._X_val_norm,\
-        self._Y_train_norm, self._Y_test_norm, self._Y_val_norm = self.GetTrainTestValData()
+        cache_hit = False 
+        use_cache = self._use_data_cache and not self._streaming and (type(self).GetTrainTestValData is MLPTrainer.GetTrainTestValData)
+        if use_cache:
+            cache_hit = self.__LoadCachedTrainData()
+        if not cache_hit:
+            self._X_train_norm, self._X_test_norm, self._X_val_norm,\
+            self._Y_train_norm, self._Y_test_norm, self._Y_val_norm = self.GetTrainTestValData()
+            if use_cache:
+                self.__WriteCachedTrainData()
 
         if self.scaler_function_name == "minmax":
             X_min,X_max = self.scaler_function_x.data_min_, self.scaler_function_x.data_max_
@@ -494,14 +1159,17 @@ class MLPTrainer:
             self._X_offset = self.scaler_function_x.mean_
             self._Y_offset = self.scaler_function_y.mean_
 
-        self._Np_train = np.shape(self._X_train_norm)[0]
+        if self._streaming:
+            self._Np_train = len(GetDataSplitIndices(self._filedata_train, "train"))
+        else:
+            self._Np_train = np.shape(self._X_train_norm)[0]
         self._Np_test = np.shape(self._X_test_norm)[0]
         self._Np_val = np.shape(self._X_val_norm)[0]
         
         
         return 
     
-    def GetTrainTestValData(self, x_vars:list[str]=None, y_vars:list[str]=None, scaler_x=None, scaler_y=None):
+    def GetTrainTestValData(self, x_vars:list[str]=None, y_vars:list[str]=None, scaler_x=None, scaler_y=None, fit_scaler_x:bool=True):
 
         if x_vars == None:
             x_vars = [c for c in self._controlling_vars]
@@ -514,6 +1182,9 @@ class MLPTrainer:
         
         is_nullMLP = ("null" in y_vars)
         
+        if self._streaming and not is_nullMLP:
+            return self.__GetTrainTestValData_Streaming(x_vars, y_vars, scaler_x, scaler_y, fit_scaler_x)
+        
         if self._verbose > 0:
             print("Reading train, test, and validation data...")
         
@@ -521,22 +1192,36 @@ class MLPTrainer:
             X_full, _ = GetReferenceData(MLPData_filepath + "_full.csv", x_vars, [],dtype=self._dt_np)
             Y_full = np.zeros(np.shape(X_full)[0])
         else:
-            X_full, Y_full = GetReferenceData(MLPData_filepath + "_full.csv", x_vars, y_vars,dtype=self._dt_np)
-        Y_full = self.TransformData(Y_full)
-
-        scaler_x.fit(X_full)
-        scaler_y.fit(Y_full)
-
-        # Free up memory
-        del X_full
-        del Y_full
-
+            X_full, Y_full = self.ReadReferenceData(MLPData_filepath + "_full.csv", x_vars, y_vars)
+        
         if is_nullMLP:
+            Y_full = self.TransformData(Y_full)
+            scaler_x.fit(X_full)
+            scaler_y.fit(Y_full)
             return 
         else:
-            X_train, Y_train = GetReferenceData(MLPData_filepath + "_train.csv", x_vars, y_vars,dtype=self._dt_np)
-            X_test, Y_test = GetReferenceData(MLPData_filepath + "_test.csv", x_vars, y_vars,dtype=self._dt_np)
-            X_val, Y_val = GetReferenceData(MLPData_filepath + "_val.csv",x_vars, y_vars,dtype=self._dt_np)
+            if DataSplitExists(MLPData_filepath):
+                # Slice train, test, and validation data from the full data set.
+                idx_train = GetDataSplitIndices(MLPData_filepath, "train")
+                idx_test = GetDataSplitIndices(MLPData_filepath, "test")
+                idx_val = GetDataSplitIndices(MLPData_filepath, "val")
+                X_train, Y_train = X_full[idx_train, :], Y_full[idx_train, :]
+                X_test, Y_test = X_full[idx_test, :], Y_full[idx_test, :]
+                X_val, Y_val = X_full[idx_val, :], Y_full[idx_val, :]
+            else:
+                X_train, Y_train = self.ReadReferenceData(MLPData_filepath + "_train.csv", x_vars, y_vars)
+                X_test, Y_test = self.ReadReferenceData(MLPData_filepath + "_test.csv", x_vars, y_vars)
+                X_val, Y_val = self.ReadReferenceData(MLPData_filepath + "_val.csv",x_vars, y_vars)
+            
+            Y_full = self.TransformData(Y_full)
+            if fit_scaler_x:
+                self.FitInputScaler(scaler_x, MLPData_filepath + "_full.csv", x_vars, X_full)
+            scaler_y.fit(Y_full)
+
+            # Free up memory
+            del X_full
+            del Y_full
+
             if self._verbose > 0:
                 print("Done!")
 
@@ -556,6 +1241,141 @@ class MLPTrainer:
 
             return X_train_norm, X_test_norm, X_val_norm, Y_train_norm, Y_test_norm, Y_val_norm
     
+    def __GetTrainTestValData_Streaming(self, x_vars:list[str], y_vars:list[str], scaler_x, scaler_y, fit_scaler_x:bool=True):
+        """Fit scalers on the full data set and load the test and validation data from binary storage. The train data 
+        is not loaded, but streamed during training. Robust scalers are fitted on a seeded subset of the data, such 
+        that repeated calls yield the same normalization.
+
+        :raises Exception: if no binary column storage or split index is available for the data set.
+        """
+        full_file = self._filedata_train + "_full.csv"
+        if not BinaryDataExists(full_file) or not DataSplitExists(self._filedata_train):
+            raise Exception("Streaming train data requires binary data storage and a split index for " + self._filedata_train)
+        
+        if self._verbose > 0:
+            print("Fitting scalers on streamed data...")
+        Np_full = GetBinaryDataLength(full_file)
+        if isinstance(scaler_x, RobustScaler) or isinstance(scaler_y, RobustScaler):
+            # Robust scaling requires quantiles, which are approximated from a random subset.
+            rng = np.random.RandomState(self._stream_scaler_seed)
+            idx_fit = np.sort(rng.choice(Np_full, min(Np_full, self._stream_scaler_samples), replace=False))
+            if fit_scaler_x:
+                scaler_x.fit(ReadBinaryDataRows(full_file, x_vars, idx_fit, self._dt_np))
+            scaler_y.fit(self.TransformData(ReadBinaryDataRows(full_file, y_vars, idx_fit, self._dt_np)))
+        else:
+            for iStart in range(0, Np_full, self._stream_chunk_size):
+                rows_chunk = slice(iStart, min(iStart + self._stream_chunk_size, Np_full))
+                if fit_scaler_x:
+                    scaler_x.partial_fit(ReadBinaryDataRows(full_file, x_vars, rows_chunk, self._dt_np))
+                scaler_y.partial_fit(self.TransformData(ReadBinaryDataRows(full_file, y_vars, rows_chunk, self._dt_np)))
+        
+        if self._verbose > 0:
+            print("Reading test and validation data...")
+        idx_test = GetDataSplitIndices(self._filedata_train, "test")
+        idx_val = GetDataSplitIndices(self._filedata_train, "val")
+        X_test_norm = scaler_x.transform(ReadBinaryDataRows(full_file, x_vars, idx_test, self._dt_np))
+        X_val_norm = scaler_x.transform(ReadBinaryDataRows(full_file, x_vars, idx_val, self._dt_np))
+        Y_test_norm = scaler_y.transform(self.TransformData(ReadBinaryDataRows(full_file, y_vars, idx_test, self._dt_np)))
+        Y_val_norm = scaler_y.transform(self.TransformData(ReadBinaryDataRows(full_file, y_vars, idx_val, self._dt_np)))
+        if self._verbose > 0:
+            print("Done!")
+        return None, X_test_norm, X_val_norm, None, Y_test_norm, Y_val_norm
+    
+    def GetScalerAffineParams(self, scaler):
+        """Get the multiplier and offset with which a fitted scaler normalizes data as x_norm = a*x + b.
+
+        :param scaler: fitted data scaler.
+        :return: scaler multiplier and offset tensors.
+        :rtype: tf.Tensor, tf.Tensor
+        """
+        if isinstance(scaler, MinMaxScaler):
+            a, b = scaler.scale_, scaler.min_
+        elif isinstance(scaler, RobustScaler):
+            a, b = 1.0 / scaler.scale_, -scaler.center_ / scaler.scale_
+        else:
+            a, b = 1.0 / scaler.scale_, -scaler.mean_ / scaler.scale_
+        return tf.constant(a, dtype=self._dt), tf.constant(b, dtype=self._dt)
+    
+    def GetInMemoryDataset(self, X_train_norm:np.ndarray, Y_train_norm:np.ndarray):
+        """Define a data set yielding mini-batches from normalized train data stored in memory. Batches are gathered from
+        a (optionally reshuffled) index set, such that the train data is not copied into a shuffle buffer.
+
+        :param X_train_norm: normalized train input data.
+        :type X_train_norm: np.ndarray
+        :param Y_train_norm: normalized train output data.
+        :type Y_train_norm: np.ndarray
+        :return: train data set yielding normalized mini-batches.
+        :rtype: tf.data.Dataset
+        """
+        X_train_tf = tf.constant(X_train_norm, dtype=self._dt)
+        Y_train_tf = tf.constant(Y_train_norm, dtype=self._dt)
+        Np_train = np.shape(X_train_norm)[0]
+
+        train_indices = tf.data.Dataset.range(Np_train)
+        if self._shuffle_train_data:
+            train_indices = train_indices.shuffle(Np_train, seed=self._shuffle_seed, reshuffle_each_iteration=True)
+        drop_remainder = self._drop_remainder and (Np_train >= 2**self._batch_expo)
+        train_batches = train_indices.batch(2**self._batch_expo, drop_remainder=drop_remainder).map(lambda idx: (tf.gather(X_train_tf, idx), tf.gather(Y_train_tf, idx)),\
+                                                                     num_parallel_calls=self._n_parallel_calls)
+        if self._prefetch_train_data:
+            train_batches = train_batches.prefetch(tf.data.AUTOTUNE)
+        return train_batches
+    
+    def GetStreamingDataset(self, x_vars:list[str], y_vars:list[str], scaler_x, scaler_y):
+        """Define a data set which reads the train data from binary storage in chunks and normalizes each batch 
+        on the fly.
+
+        :param x_vars: input variables.
+        :type x_vars: list[str]
+        :param y_vars: output variables.
+        :type y_vars: list[str]
+        :param scaler_x: fitted input data scaler.
+        :param scaler_y: fitted output data scaler.
+        :return: train data set yielding normalized mini-batches.
+        :rtype: tf.data.Dataset
+        """
+        full_file = self._filedata_train + "_full.csv"
+        idx_train = GetDataSplitIndices(self._filedata_train, "train")
+
+        # Chunk size is a multiple of the batch size, such that only the last batch of each epoch is incomplete.
+        batch_size = 2**self._batch_expo
+        chunk_size = max(batch_size, batch_size * (self._stream_chunk_size // batch_size))
+        n_chunks = int(np.ceil(len(idx_train) / chunk_size))
+        shuffle_data = self._shuffle_train_data and not self._cache_train_data
+        rng = np.random.RandomState(self._shuffle_seed)
+        drop_remainder = self._drop_remainder and (len(idx_train) >= batch_size)
+
+        def chunk_batches():
+            # Split index is already shuffled, so reshuffling the chunk order and the data within each chunk suffices.
+            chunk_order = rng.permutation(n_chunks) if shuffle_data else range(n_chunks)
+            for iChunk in chunk_order:
+                idx_chunk = idx_train[iChunk*chunk_size:(iChunk+1)*chunk_size]
+                X_chunk = ReadBinaryDataRows(full_file, x_vars, idx_chunk, self._dt_np)
+                Y_chunk = self.TransformData(ReadBinaryDataRows(full_file, y_vars, idx_chunk, self._dt_np)).astype(self._dt_np)
+                idx_shuffle = rng.permutation(len(idx_chunk)) if shuffle_data else np.arange(len(idx_chunk))
+                for iBatch in range(0, len(idx_chunk), batch_size):
+                    idx_batch = idx_shuffle[iBatch:iBatch+batch_size]
+                    if drop_remainder and (len(idx_batch) < batch_size):
+                        continue
+                    yield X_chunk[idx_batch, :], Y_chunk[idx_batch, :]
+        
+        # Normalization is applied in parallel to the batches read from disk.
+        a_x, b_x = self.GetScalerAffineParams(scaler_x)
+        a_y, b_y = self.GetScalerAffineParams(scaler_y)
+        Np_batch = batch_size if drop_remainder else None
+        streaming_dataset = tf.data.Dataset.from_generator(chunk_batches, \
+                                                           output_signature=(tf.TensorSpec(shape=(Np_batch, len(x_vars)), dtype=self._dt),\
+                                                                             tf.TensorSpec(shape=(Np_batch, len(y_vars)), dtype=self._dt)))
+        streaming_dataset = streaming_dataset.map(lambda x, y: (a_x * x + b_x, a_y * y + b_y), num_parallel_calls=self._n_parallel_calls)
+        if self._cache_train_data:
+            # Cached batches are reshuffled as a whole after the first epoch.
+            streaming_dataset = streaming_dataset.cache(self._cache_train_file)
+            if self._shuffle_train_data:
+                streaming_dataset = streaming_dataset.shuffle(n_chunks * (chunk_size // batch_size), seed=self._shuffle_seed, reshuffle_each_iteration=True)
+        if self._prefetch_train_data:
+            streaming_dataset = streaming_dataset.prefetch(tf.data.AUTOTUNE)
+        return streaming_dataset
+    
     def GetScalerFunctionParams(self):
         if self.scaler_function_name == "minmax":
             scaler_function_vals_in = [[mi,ma] for mi, ma in zip(self.scaler_function_x.data_min_, self.scaler_function_x.data_max_)]
@@ -675,6 +1495,17 @@ class MLPTrainer:
     def add_additional_header_info(self, fid):
         return 
     
+    def WriteTrainingPerformance(self, fid):
+        """Write the precision policy and mean train data throughput to a performance file.
+
+        :param fid: opened performance file.
+        """
+        fid.write("Precision policy: %s\n" % self._precision_policy)
+        if len(self.throughput_history) > 1:
+            # First epoch includes tracing and compilation.
+            fid.write("Train data throughput[samples/s]: %+.3e\n" % np.mean(self.throughput_history[1:]))
+        return 
+    
     def Save_Relevant_Data(self):
         """Save network performance characteristics in text file and write SU2 MLP input file.
         """
@@ -691,6 +1522,7 @@ class MLPTrainer:
         fid.write("Activation function index: %i\n" % self._i_activation_function)
         fid.write("Number of hidden layers: %i\n" % len(self._hidden_layers))
         fid.write("Architecture: " + " ".join(str(n) for n in self._hidden_layers) + "\n")
+        self.WriteTrainingPerformance(fid)
         fid.close()
 
         self.write_SU2_MLP(self._save_dir + "/Model_"+str(self._model_index)+"/"+self._mlp_output_file_name)
@@ -742,16 +1574,16 @@ class TensorFlowFit(MLPTrainer):
             self.history = None 
 
             # Add input layer
-            self._model.add(keras.layers.Input([len(self._controlling_vars, )]))
+            self._model.add(keras.layers.Input([len(self._controlling_vars, )], dtype=self._dt.name))
 
-            # Add hidden layersSetTrainFileHeader
+            # Add hidden layers
             iLayer = 0
             while iLayer < len(self._hidden_layers):
-                self._model.add(keras.layers.Dense(self._hidden_layers[iLayer], activation=self._activation_function_name, kernel_initializer=self.weights_initializer))
+                self._model.add(keras.layers.Dense(self._hidden_layers[iLayer], activation=self._activation_function_name, kernel_initializer=self.weights_initializer, dtype=self._precision_policy))
                 iLayer += 1
             
-            # Add output layer
-            self._model.add(keras.layers.Dense(len(self._train_vars), activation='linear'))
+            # Add output layer, output is kept in float32 for mixed precision for a numerically stable loss.
+            self._model.add(keras.layers.Dense(len(self._train_vars), activation='linear', dtype=self._dt.name))
 
             if self._loaded_custom_weights:
                 weights_and_biases = []
@@ -766,9 +1598,12 @@ class TensorFlowFit(MLPTrainer):
             _lr_schedule = keras.optimizers.schedules.ExponentialDecay(10**self._alpha_expo, decay_steps=self._decay_steps,
                                                                     decay_rate=self._lr_decay, staircase=False)
             opt = keras.optimizers.Adam(learning_rate=_lr_schedule, beta_1=0.9, beta_2=0.999, epsilon=1e-8, amsgrad=False) 
+            if self._precision_policy == "mixed_float16":
+                # Dynamic loss scaling prevents gradient underflow in float16.
+                opt = keras.mixed_precision.LossScaleOptimizer(opt)
 
             # Compile model on device
-            self._model.compile(optimizer=opt, loss="mean_squared_error", metrics=["mape"])
+            self._model.compile(optimizer=opt, loss="mean_squared_error", metrics=["mape"], jit_compile=self._jit_compile)
         return 
     
     def EvaluateMLP(self,input_data_dim):
@@ -786,6 +1621,7 @@ class TensorFlowFit(MLPTrainer):
         self.history_epochs = []
         self.history_loss=[]
         self.history_val_loss=[]
+        self.throughput_history = []
         
         # Read train,test, and validation data.
         self.GetTrainData()
@@ -813,7 +1649,15 @@ class TensorFlowFit(MLPTrainer):
                                                       start_from_epoch=1,\
                                                       mode="min",\
                                                       verbose=self._verbose)
-            self.history = self._model.fit(self._X_train_norm, self._Y_train_norm, \
+            if self._streaming:
+                train_data = self.GetStreamingDataset(self._controlling_vars, self._train_vars, self.scaler_function_x, self.scaler_function_y)
+                self.history = self._model.fit(train_data, \
+                                          epochs=self._n_epochs, \
+                                          verbose=self._verbose, \
+                                          validation_data=(self._X_val_norm, self._Y_val_norm), \
+                                          callbacks=[StagnationStop, self.PlotCallback(self)])
+            else:
+                self.history = self._model.fit(self._X_train_norm, self._Y_train_norm, \
                                           epochs=self._n_epochs, \
                                           batch_size=2**self._batch_expo,\
                                           verbose=self._verbose, \
@@ -866,13 +1710,29 @@ class TensorFlowFit(MLPTrainer):
         
     class PlotCallback(tf.keras.callbacks.Callback):
             FitClass = None
+            t_start_epoch:float = 0
+            t_end_train:float = 0
             def __init__(self, TensorFlowFit:MLPTrainer):
                 self.FitClass = TensorFlowFit
 
+            def on_epoch_begin(self, epoch, logs=None):
+                self.t_start_epoch = time.time()
+                return super().on_epoch_begin(epoch, logs)
+            
+            def on_test_begin(self, logs=None):
+                # Validation is evaluated at the end of each epoch, which marks the end of the train batches.
+                self.t_end_train = time.time()
+                return super().on_test_begin(logs)
+            
             def on_epoch_end(self, epoch, logs=None):
+                self.FitClass.throughput_history.append(self.FitClass._Np_train / (self.t_end_train - self.t_start_epoch))
+                if self.FitClass._log_throughput:
+                    print("Epoch: ", str(epoch), " Train data throughput: %.3e samples/s" % self.FitClass.throughput_history[-1])
                 self.FitClass.history_epochs.append(epoch)
                 self.FitClass.history_loss.append(logs["loss"])
                 self.FitClass.history_val_loss.append(logs["val_loss"])
+                if not self.FitClass.CheckEpochCallback(epoch, logs["val_loss"]):
+                    self.model.stop_training = True 
                 
                 if (epoch+1) % self.FitClass.callback_every == 0:
                     self.FitClass.CustomCallback()
@@ -893,36 +1753,32 @@ class CustomTrainer(MLPTrainer):
     # Training stagnation parameters.
     __keep_training:bool = True 
     __stagnation_iter:int = 0
+    __i_epoch_best:int = 0      # Epoch at which the validation loss last improved.
+
+    val_epoch_history:list[int] = []    # Epoch index of each validation loss history entry.
 
     _include_regularization:bool = False
     _regularization_param:float = 1e-5
 
+    _jit_compile_functions:list[str] = ["Train_Step", "Compute_Direct_Error"]
+    _mixed_precision_fallback:str = "float32"   # Precision policy used instead of mixed precision policies.
+
     def __init__(self):
         MLPTrainer.__init__(self)
         return
     
-    def SetWeights(self, weights_input:list[np.ndarray]):
-        """Manually set the network weights values.
-
-        :param weights_input: list of network weights values.
-        :type weights_input: list[np.ndarray]
-        """
-
-        self._weights = []
-        for W in weights_input:
-            self._weights.append(tf.Variable(tf.cast(W, self._dt), self._dt))
-        return 
-    
-    def SetBiases(self, biases_input:list[np.ndarray]):
-        """Manually set the network biases values.
+    def SetPrecisionPolicy(self, policy:str="float32"):
+        """Set the floating point precision policy used for training. Custom training loops evaluate the 
+        network with a single data type, such that mixed precision policies fall back to full precision.
 
-        :param biases_input: list of network bias values.
-        :type biases_input: list[np.ndarray]
+        :param policy: precision policy ("float32", "float64", "mixed_float16", or "mixed_bfloat16"), defaults to "float32"
+        :type policy: str, optional
         """
-
-        self._biases = []
-        for b in biases_input:
-            self._biases.append(tf.Variable(tf.cast(b,self._dt), self._dt))
+        MLPTrainer.SetPrecisionPolicy(self, policy)
+        if self.MixedPrecision():
+            if self._verbose > 0:
+                print("Precision policy %s is not supported by %s, using %s instead." % (policy, type(self).__name__, self._mixed_precision_fallback))
+            MLPTrainer.SetPrecisionPolicy(self, self._mixed_precision_fallback)
         return 
     
     def InitializeWeights_and_Biases(self):
@@ -994,6 +1850,83 @@ class CustomTrainer(MLPTrainer):
         Y = self.ComputeLayerInput(Y, w[-1], b[-1])
         return Y 
     
+    @tf.function
+    def ComputeMLPJacobian(self, x_norm:tf.Tensor):
+        """Evaluate the MLP output together with its Jacobian with respect to the network inputs for all outputs in 
+        a single forward sweep. The Jacobian is propagated analytically layer by layer.
+
+        :param x_norm: normalized MLP input data.
+        :type x_norm: tf.Tensor
+        :return: MLP output [batch, output] and Jacobian [batch, output, input].
+        :rtype: tf.Tensor, tf.Tensor
+        """
+        w = self._weights
+        b = self._biases
+        n_in = w[0].shape[0]
+
+        # Layer output derivatives are stored as [batch, input, neuron].
+        Y = x_norm 
+        dY = tf.broadcast_to(tf.eye(n_in, dtype=self._dt), [tf.shape(x_norm)[0], n_in, n_in])
+        for iLayer in range(len(w)):
+            Z = self.ComputeLayerInput(Y, w[iLayer], b[iLayer])
+            dZ = tf.einsum("nik,kl->nil", dY, w[iLayer])
+            if iLayer < len(w) - 1:
+                with tf.autodiff.ForwardAccumulator(primals=Z, tangents=tf.ones_like(Z)) as acc:
+                    Y = self._activation_function(Z)
+                dY = acc.jvp(Y)[:, None, :] * dZ 
+            else:
+                Y, dY = Z, dZ 
+        return Y, tf.transpose(dY, [0, 2, 1])
+    
+    @tf.function
+    def ComputeActivationDerivatives(self, z:tf.Tensor):
+        """Evaluate the hidden layer activation function and its first and second derivatives through nested 
+        forward-mode differentiation.
+
+        :param z: hidden layer input.
+        :type z: tf.Tensor
+        :return: activation function value, first derivative, and second derivative.
+        :rtype: tf.Tensor, tf.Tensor, tf.Tensor
+        """
+        with tf.autodiff.ForwardAccumulator(primals=z, tangents=tf.ones_like(z)) as acc_2:
+            with tf.autodiff.ForwardAccumulator(primals=z, tangents=tf.ones_like(z)) as acc_1:
+                a = self._activation_function(z)
+            da = acc_1.jvp(a)
+        d2a = acc_2.jvp(da)
+        return a, da, d2a
+    
+    @tf.function
+    def ComputeMLPDerivatives(self, x_norm:tf.Tensor):
+        """Evaluate the MLP output together with its Jacobian and Hessian with respect to the network inputs in a 
+        single forward sweep. Derivatives are propagated analytically layer by layer instead of through nested 
+        gradient tapes.
+
+        :param x_norm: normalized MLP input data.
+        :type x_norm: tf.Tensor
+        :return: MLP output [batch, output], Jacobian [batch, output, input], and Hessian [batch, output, input, input].
+        :rtype: tf.Tensor, tf.Tensor, tf.Tensor
+        """
+        w = self._weights
+        b = self._biases
+        n_in = w[0].shape[0]
+        Np = tf.shape(x_norm)[0]
+
+        # Layer output derivatives are stored as [batch, input, (input,) neuron].
+        Y = x_norm 
+        dY = tf.broadcast_to(tf.eye(n_in, dtype=self._dt), [Np, n_in, n_in])
+        d2Y = tf.zeros([Np, n_in, n_in, n_in], dtype=self._dt)
+        for iLayer in range(len(w)):
+            Z = self.ComputeLayerInput(Y, w[iLayer], b[iLayer])
+            dZ = tf.einsum("nik,kl->nil", dY, w[iLayer])
+            d2Z = tf.einsum("nijk,kl->nijl", d2Y, w[iLayer])
+            if iLayer < len(w) - 1:
+                Y, da, d2a = self.ComputeActivationDerivatives(Z)
+                dY = da[:, None, :] * dZ 
+                d2Y = d2a[:, None, None, :] * dZ[:, :, None, :] * dZ[:, None, :, :] + da[:, None, None, :] * d2Z
+            else:
+                Y, dY, d2Y = Z, dZ, d2Z 
+        return Y, tf.transpose(dY, [0, 2, 1]), tf.transpose(d2Y, [0, 3, 1, 2])
+    
     def EvaluateMLP(self, input_data_dim:np.ndarray):
         """Evaluate MLP for a given set of normalized input data.
 
@@ -1049,9 +1982,45 @@ class CustomTrainer(MLPTrainer):
             jac = tape.jacobian(y_norm_loss, x_norm)
         return y_norm_loss, jac
     
+    def DataParallelEvaluation(self, function, sharded_inputs:list[tf.Tensor], *args):
+        """Evaluate a loss or sensitivity function in data-parallel fashion. The batch data are split into shards 
+        which differ in size by at most one sample, each of which is evaluated on a separate worker device. The 
+        worker results are averaged, weighted by the shard fraction. The sharded inputs should therefore be of equal 
+        length, data of a different length, such as boundary data, is passed to every worker through the remaining 
+        arguments.
+
+        :param function: function to evaluate, taking the sharded inputs followed by the remaining arguments.
+        :param sharded_inputs: batch data of equal length to be split among the workers along the first dimension.
+        :type sharded_inputs: list[tf.Tensor]
+        :return: function output averaged over all workers.
+        """
+        if self._n_workers == 1:
+            return function(*sharded_inputs, *args)
+        
+        n_x = tf.shape(sharded_inputs[0])[0]
+        for x in sharded_inputs[1:]:
+            tf.debugging.assert_equal(tf.shape(x)[0], n_x, message="Data-parallel inputs should be of equal length.")
+
+        worker_outputs = []
+        shard_weights = []
+        for iWorker, worker_device in enumerate(self.GetWorkerDevices()):
+            i_start, i_end = (iWorker * n_x) // self._n_workers, ((iWorker + 1) * n_x) // self._n_workers
+            shards = [x[i_start:i_end] for x in sharded_inputs]
+            with tf.device(worker_device):
+                worker_outputs.append(function(*shards, *args))
+            shard_weights.append(tf.cast(i_end - i_start, self._dt) / tf.cast(n_x, self._dt))
+
+        # All-reduce of the worker results. Empty shards do not contribute.
+        def reduce_workers(*outputs):
+            return tf.add_n([tf.math.multiply_no_nan(tf.convert_to_tensor(o, self._dt), w) for o, w in zip(outputs, shard_weights)])
+        return tf.nest.map_structure(reduce_workers, *worker_outputs)
+    
+    def GetKernelSignatures(self, element_spec):
+        return {"Train_Step": list(element_spec)}
+    
     @tf.function
     def Train_Step(self, x_norm_batch, y_label_norm_batch):
-        y_norm_loss, grads_loss = self.ComputeGradients_Direct_Error(x_norm_batch, y_label_norm_batch)
+        y_norm_loss, grads_loss = self.DataParallelEvaluation(self.ComputeGradients_Direct_Error, [x_norm_batch, y_label_norm_batch])
         self._optimizer.apply_gradients(zip(grads_loss, self._trainable_hyperparams))
         
         return y_norm_loss 
@@ -1082,8 +2051,12 @@ class CustomTrainer(MLPTrainer):
         self.CollectVariables()
 
         # Pre-process model before training.
+        self.ConfigureWorkers()
         self.SetOptimizer()
 
+        # Store validation and test data as tensors for re-use during training.
+        self.PrepareEvaluationData()
+
         self.PrepareValidationHistory()
         return 
     
@@ -1093,45 +2066,164 @@ class CustomTrainer(MLPTrainer):
             self.val_loss_history.append([])
         return 
     
+    def PrepareEvaluationData(self):
+        """Convert the normalized validation and test data to tensors of the trainer data type.
+        """
+        self._X_val_norm_tf = tf.constant(self._X_val_norm, dtype=self._dt)
+        self._Y_val_norm_tf = tf.constant(self._Y_val_norm, dtype=self._dt)
+        self._X_test_norm_tf = tf.constant(self._X_test_norm, dtype=self._dt)
+        self._Y_test_norm_tf = tf.constant(self._Y_test_norm, dtype=self._dt)
+
+        self._idx_val_sub = self.GetValidationSubsample()
+        self._X_val_sub_tf = tf.gather(self._X_val_norm_tf, self._idx_val_sub)
+        self._Y_val_sub_tf = tf.gather(self._Y_val_norm_tf, self._idx_val_sub)
+        return 
+    
+    def GetValidationSubsample(self):
+        """Select a stratified subsample of the validation data. Validation data points are assigned to cells 
+        of a grid of quantile bins of the controlling variables. The data points, sorted by cell, are divided into 
+        equally sized strata from each of which one data point is drawn.
+
+        :return: indices of the validation subsample.
+        :rtype: np.ndarray
+        """
+        Np_val = np.shape(self._X_val_norm)[0]
+        if self._val_subsample_size is None or self._val_subsample_size >= Np_val:
+            return np.arange(Np_val)
+        
+        n_bins = 4
+        cell_index = np.zeros(Np_val, dtype=np.int64)
+        for iX in range(np.shape(self._X_val_norm)[1]):
+            bin_edges = np.quantile(self._X_val_norm[:, iX], np.linspace(0, 1, n_bins+1)[1:-1])
+            cell_index = cell_index * n_bins + np.digitize(self._X_val_norm[:, iX], bin_edges)
+        
+        rng = np.random.RandomState(self._val_subsample_seed)
+        strata = np.array_split(np.argsort(cell_index, kind="stable"), self._val_subsample_size)
+        idx_sub = np.array([stratum[rng.randint(len(stratum))] for stratum in strata])
+        return np.sort(idx_sub)
+    
+    def EvaluateInChunks(self, error_function, X_norm:tf.Tensor, Y_norm:tf.Tensor):
+        """Evaluate a mean error function on a data set in chunks of fixed size to bound memory usage.
+
+        :param error_function: function returning the mean error per output for a set of inputs and labels.
+        :param X_norm: normalized input data.
+        :type X_norm: tf.Tensor
+        :param Y_norm: normalized label data.
+        :type Y_norm: tf.Tensor
+        :return: mean error per output over the complete data set.
+        :rtype: np.ndarray
+        """
+        Np = X_norm.shape[0]
+        if Np <= self._eval_chunk_size:
+            return error_function(X_norm, Y_norm).numpy()
+        error = 0.0
+        for iStart in range(0, Np, self._eval_chunk_size):
+            X_chunk = X_norm[iStart:iStart+self._eval_chunk_size, :]
+            Y_chunk = Y_norm[iStart:iStart+self._eval_chunk_size, :]
+            error += error_function(X_chunk, Y_chunk).numpy() * X_chunk.shape[0]
+        return error / Np
+    
     def SetTrainBatches(self):
-        train_batches = tf.data.Dataset.from_tensor_slices((self._X_train_norm, self._Y_train_norm)).batch(2**self._batch_expo)
-        return train_batches
+        if self._streaming:
+            return self.GetStreamingDataset(self._controlling_vars, self._train_vars, self.scaler_function_x, self.scaler_function_y)
+        return self.GetInMemoryDataset(self._X_train_norm, self._Y_train_norm)
     
     def LoopEpochs(self):
         t_start = time.time()
         worst_error = 1e32
         self._i_epoch = 0
         train_batches = self.SetTrainBatches()
+        self.CompileKernels(train_batches.element_spec)
+        self.throughput_history = []
+        self.trace_history = []
+        n_traces = self.GetTracingCount()
+        self._full_validation = True
+        self.val_epoch_history = []
+        self.__stagnation_iter = 0
+        self.__i_epoch_best = 0
         while (self._i_epoch < self._n_epochs) and self.__keep_training:
+            t_start_epoch = time.time()
             self.LoopBatches(train_batches=train_batches)
-
-            val_loss = self.ValidationLoss()
-            
-            if (self._i_epoch + 1) % self.callback_every == 0:
-                self.TestLoss()
-                self.CustomCallback()
-            
-            worst_error = self.__CheckEarlyStopping(val_loss, worst_error)
-
-            self.PrintEpochInfo(self._i_epoch, val_loss)
+            self.throughput_history.append(self._Np_train / (time.time() - t_start_epoch))
+            self.trace_history.append(self.GetTracingCount() - n_traces)
+            n_traces += self.trace_history[-1]
+
+            # Validation subsample is used between checkpoints, the full validation set at checkpoints and at the end.
+            checkpoint = (self._i_epoch + 1) % self.callback_every == 0
+            final_epoch = (self._i_epoch + 1) == self._n_epochs
+            if checkpoint or final_epoch or ((self._i_epoch + 1) % self._validate_every == 0):
+                self._full_validation = checkpoint or final_epoch or (self._val_subsample_size is None)
+                val_loss = self.ValidationLoss()
+                self.val_epoch_history.append(self._i_epoch)
+                
+                if checkpoint:
+                    self.TestLoss()
+                    self.CustomCallback()
+                
+                # Stagnation is tracked on the validation subsample if used, such that successive losses are comparable.
+                if self._full_validation and (self._val_subsample_size is not None):
+                    stopping_loss = self.EvaluateValidationLoss(full_validation=False)
+                else:
+                    stopping_loss = val_loss
+                worst_error = self.__CheckEarlyStopping(stopping_loss, worst_error)
+                if not self.CheckEpochCallback(self._i_epoch, stopping_loss):
+                    self.__keep_training = False 
+
+                self.PrintEpochInfo(self._i_epoch, val_loss)
+            if self._log_throughput:
+                print("Epoch: ", str(self._i_epoch), " Train data throughput: %.3e samples/s" % self.throughput_history[-1])
             self._i_epoch += 1
+        
+        # Evaluate the full validation set if training was stopped early on a subsample validation.
+        if not self._full_validation:
+            self._full_validation = True 
+            self.ValidationLoss()
+            self.val_epoch_history.append(self._i_epoch - 1)
         t_end = time.time()
         self._train_time = (t_end - t_start)/60
         return 
     
     def PrintEpochInfo(self, i_epoch, val_loss):
         if self._verbose > 0:
-            print("Epoch: ", str(i_epoch), " Validation loss: ", ", ".join("%s : %.8e" % (s, v) for s, v in zip(self._train_vars, val_loss)))
+            print("Epoch: ", str(i_epoch), " Validation loss: ", ", ".join("%s : %.8e" % (s, v) for s, v in zip(self._train_vars, val_loss)), \
+                  " Function traces: %i" % self.trace_history[-1])
         return 
     
     def LoopBatches(self, train_batches):
+        if self._graph_epoch:
+            self.GraphLoopBatches(train_batches)
+            return 
         for x_norm_batch, y_norm_batch in train_batches:
             self.Train_Step(x_norm_batch, y_norm_batch)
         return
     
+    @tf.function
+    def GraphLoopBatches(self, train_batches:tf.data.Dataset):
+        """Loop over all train batches of an epoch in graph mode. The loop over the data set iterator is converted 
+        into a tf.while_loop, such that the train step is not dispatched from Python for every batch.
+
+        :param train_batches: data set of normalized train batches.
+        :type train_batches: tf.data.Dataset
+        """
+        for x_norm_batch, y_norm_batch in iter(train_batches):
+            self.Train_Step(x_norm_batch, y_norm_batch)
+        return 
+    
+    def EvaluateValidationLoss(self, full_validation:bool=True):
+        """Evaluate the validation loss per output on the complete validation set or on the validation subsample.
+
+        :param full_validation: evaluate the complete validation set, defaults to True
+        :type full_validation: bool, optional
+        :return: validation loss per output.
+        :rtype: np.ndarray
+        """
+        if full_validation:
+            return self.EvaluateInChunks(self.Compute_Direct_Error, self._X_val_norm_tf, self._Y_val_norm_tf)
+        return self.EvaluateInChunks(self.Compute_Direct_Error, self._X_val_sub_tf, self._Y_val_sub_tf)
+    
     def ValidationLoss(self):
-        val_loss = self.Compute_Direct_Error(tf.constant(self._X_val_norm, self._dt), tf.constant(self._Y_val_norm, self._dt))
-        for iVar in range(len(self._train_vars)):
+        val_loss = self.EvaluateValidationLoss(self._full_validation)
+        for iVar in range(len(val_loss)):
             self.val_loss_history[iVar].append(val_loss[iVar])
         return val_loss
     
@@ -1146,7 +2238,7 @@ class CustomTrainer(MLPTrainer):
     def TestLoss(self):
 
         t_start = time.time()
-        self._test_score = tf.reduce_mean(self.Compute_Direct_Error(tf.constant(self._X_test_norm, self._dt), tf.constant(self._Y_test_norm, self._dt))).numpy()
+        self._test_score = np.mean(self.EvaluateInChunks(self.Compute_Direct_Error, self._X_test_norm_tf, self._Y_test_norm_tf))
         t_end = time.time()
         self._test_time = (t_end - t_start)/60
         return 
@@ -1163,12 +2255,13 @@ class CustomTrainer(MLPTrainer):
         fig = plt.figure(figsize=[10,10])
         ax = plt.axes()
         H = np.array(self.val_loss_history)
+        epochs = np.array(self.val_epoch_history)
         for i in range(len(vars_to_plot)):
-            ax.plot(H[i,:], label=r"Validation score "+vars_to_plot[i])
+            ax.plot(epochs, H[i,:], label=r"Validation score "+vars_to_plot[i])
         ax.grid()
         ax.set_yscale('log')
         ax.legend(fontsize=20)
-        ax.set_xlabel(r"Iteration[-]", fontsize=20)
+        ax.set_xlabel(r"Epoch[-]", fontsize=20)
         ax.set_ylabel(r"Training loss function [-]", fontsize=20)
         ax.set_title(r""+self._train_name+r" Training History", fontsize=22)
         ax.tick_params(axis='both', which='major', labelsize=18)
@@ -1177,7 +2270,6 @@ class CustomTrainer(MLPTrainer):
 
         with open(self._save_dir + "/Model_"+str(self._model_index)+"/TrainingHistory.csv", "w+") as fid:
             fid.write("epoch,"+ ",".join(("validation_loss_"+var for var in vars_to_plot))+"\n")
-            epochs = np.arange(np.shape(H)[1])
             H_concat = np.vstack((epochs, H)).T 
             csvWriter = csv.writer(fid, delimiter=',')
             csvWriter.writerows(H_concat)
@@ -1189,10 +2281,12 @@ class CustomTrainer(MLPTrainer):
         if current_error < worst_error - self._stagnation_tolerance:
             self.__keep_training = True 
             self.__stagnation_iter = 0
+            self.__i_epoch_best = self._i_epoch
             
             worst_error = current_error
         else:
-            self.__stagnation_iter += 1
+            # Number of epochs since the last improvement, independent of the validation frequency.
+            self.__stagnation_iter = self._i_epoch - self.__i_epoch_best
             if self.__stagnation_iter > self._stagnation_patience and self._verbose > 0:
                 self.__keep_training = False 
                 print("Early stopping due to stagnation")
@@ -1238,10 +2332,15 @@ class PhysicsInformedTrainer(CustomTrainer):
     _N_bc:int=None 
 
     _train_step_type:str="Jacobi"
-    __train_step_type_options:list[str] = ["Gauss-Seidel","Jacobi"]
+    __train_step_type_options:list[str] = ["Gauss-Seidel","Jacobi","Block-Jacobi"]
     j_gradient_update:int = 0
     lambda_history:list = []
     update_lambda_every_iter:int = 10
+    _reuse_lambda_gradients:bool = False    # Update boundary penalty values from the train step sensitivities.
+
+    _jit_compile_functions:list[str] = ["Train_Step", "Train_Step_Gauss_Seidel", "Train_Step_Block_Jacobi", "Train_Step_Lambda_Update", "ComputeStateError"]
+    _mixed_precision_fallback:str = "float64"   # Physics-informed losses rely on network derivatives, which require full precision.
+
     def __init__(self):
         CustomTrainer.__init__(self)
         return 
@@ -1256,7 +2355,8 @@ class PhysicsInformedTrainer(CustomTrainer):
             self._Y_state_test_norm, self._Y_state_val_norm = self.GetTrainTestValData(self._controlling_vars, \
                                                                                        self._state_vars, \
                                                                                        self.scaler_function_x, \
-                                                                                       self._scaler_state)
+                                                                                       self._scaler_state, \
+                                                                                       fit_scaler_x=False)
         if self.scaler_function_name == "minmax":
             Y_state_max, Y_state_min = self._scaler_state.data_max_, self._scaler_state.data_min_
             self._Y_state_scale = Y_state_max - Y_state_min
@@ -1270,6 +2370,21 @@ class PhysicsInformedTrainer(CustomTrainer):
 
         return 
     
+    def LoadSharedData(self, shared_data:SharedTrainData):
+        """Load the domain state data and boundary data required for training into a shared data storage.
+
+        :param shared_data: shared data storage.
+        :type shared_data: SharedTrainData
+        """
+        super().LoadSharedData(shared_data)
+        shared_data.LoadData(self._filedata_train + "_full.csv", self._state_vars)
+        if not DataSplitExists(self._filedata_train):
+            for split_name in ["train", "test", "val"]:
+                shared_data.LoadData(self._filedata_train + "_" + split_name + ".csv", self._state_vars)
+        if self._boundary_data_file is not None:
+            shared_data.LoadData(self._boundary_data_file, self._controlling_vars + self._train_vars)
+        return 
+    
     def SetBoundaryDataFile(self, boundary_file_name:str):
         self._boundary_data_file = boundary_file_name
         return 
@@ -1280,7 +2395,7 @@ class PhysicsInformedTrainer(CustomTrainer):
         if y_vars == None:
             y_vars = self._train_vars
         # Load controlling and train variables from boundary data.
-        X_boundary, Y_boundary = GetReferenceData(self._boundary_data_file, x_vars=self._controlling_vars, train_variables=y_vars,dtype=self._dt_np)
+        X_boundary, Y_boundary = self.ReadReferenceData(self._boundary_data_file, self._controlling_vars, y_vars)
         
         
         # Normalize controlling and labeled data with respect to domain data.
@@ -1290,14 +2405,50 @@ class PhysicsInformedTrainer(CustomTrainer):
         return 
     
     def SetTrainStepType(self, train_step_type:str="Jacobi"):
+        """Set the weights update step type. "Jacobi" updates the weights once per batch for the total loss, 
+        "Gauss-Seidel" updates the weights for each state variable in sequence, re-evaluating the state after every 
+        update, and "Block-Jacobi" applies the same sequence of updates with sensitivities from a single state evaluation.
+
+        :param train_step_type: weights update step type, defaults to "Jacobi"
+        :type train_step_type: str, optional
+        :raises Exception: if the step type is not supported.
+        """
         if train_step_type not in self.__train_step_type_options:
             raise Exception("Weights update step type should be one of the following : "+ ",".join(s for s in self.__train_step_type_options))
         self._train_step_type = train_step_type
         return 
     
+    def SetLambdaUpdate(self, update_every:int=10, reuse_gradients:bool=False):
+        """Set the boundary condition penalty value update settings.
+
+        :param update_every: number of train steps between penalty value updates, defaults to 10
+        :type update_every: int, optional
+        :param reuse_gradients: update penalty values from the sensitivities computed in the Jacobi train step 
+            instead of evaluating them separately, defaults to False
+        :type reuse_gradients: bool, optional
+        :raises Exception: if the update frequency is lower than one.
+        """
+        if update_every < 1:
+            raise Exception("Number of train steps between penalty value updates should be at least one.")
+        self.update_lambda_every_iter = update_every
+        self._reuse_lambda_gradients = reuse_gradients
+        return 
+    
+    def GetProblemSettings(self):
+        """Get the trainer settings which affect the outcome of a training, including the state variables, train 
+        step type, boundary loss, and penalty value update settings.
+
+        :return: training problem settings.
+        :rtype: list[str]
+        """
+        return super().GetProblemSettings() + [",".join(self._state_vars),\
+                self._train_step_type,\
+                "%i,%i,%s" % (self._enable_boundary_loss, self._boundary_loss_patience, str(self._boundary_data_file)),\
+                "%i,%i" % (self.update_lambda_every_iter, self._reuse_lambda_gradients)]
+    
     def SetDecaySteps(self):
         super().SetDecaySteps()
-        if self._train_step_type=="Gauss-Seidel":
+        if self._train_step_type in ["Gauss-Seidel", "Block-Jacobi"]:
             self._decay_steps *= len(self._state_vars)
         return 
     
@@ -1329,11 +2480,19 @@ class PhysicsInformedTrainer(CustomTrainer):
             self.val_loss_history.append([])
         return 
     
+    def PrepareEvaluationData(self):
+        super().PrepareEvaluationData()
+        self._Y_state_val_norm_tf = tf.constant(self._Y_state_val_norm, dtype=self._dt)
+        self._Y_state_test_norm_tf = tf.constant(self._Y_state_test_norm, dtype=self._dt)
+        self._Y_state_val_sub_tf = tf.gather(self._Y_state_val_norm_tf, self._idx_val_sub)
+        return 
+    
     def SetTrainBatches(self):
-        train_batches_domain = tf.data.Dataset.from_tensor_slices((self._X_train_norm, self._Y_state_train_norm)).batch(2**self._batch_expo)
-        domain_batches_list = [b for b in train_batches_domain]
-
         batch_size_train = 2**self._batch_expo
+        if self._streaming:
+            train_batches_domain = self.GetStreamingDataset(self._controlling_vars, self._state_vars, self.scaler_function_x, self._scaler_state)
+        else:
+            train_batches_domain = self.GetInMemoryDataset(self._X_train_norm, self._Y_state_train_norm)
 
         # Collect projection array data.
         p_concatenated = tf.stack([tf.constant(p, dtype=self._dt) for p in self.projection_arrays],axis=2)
@@ -1344,32 +2503,24 @@ class PhysicsInformedTrainer(CustomTrainer):
         # Collect boundary controlling variable data.
         X_boundary_tf = tf.constant(self._X_boundary_norm, dtype=self._dt)
 
-        # Forumulate batches.
-        batches_concat = tf.data.Dataset.from_tensor_slices((X_boundary_tf, p_concatenated, Y_target_concatenated)).batch(batch_size_train)
-        batches_concat_list = [b for b in batches_concat]
-
-        # Re-size boundary data batches to that of the domain batches such that both data can be evaluated simultaneously during training.
-        Nb_boundary = len(batches_concat_list)
-        batches_concat_list_resized = [batches_concat_list[i % Nb_boundary] for i in range(len(domain_batches_list))]
+        # Forumulate batches. Boundary data batches are repeated such that each domain batch is paired with a boundary batch.
+        batches_concat = tf.data.Dataset.from_tensor_slices((X_boundary_tf, p_concatenated, Y_target_concatenated))
+        if self._drop_remainder:
+            batches_concat = batches_concat.repeat().batch(batch_size_train, drop_remainder=True)
+        else:
+            batches_concat = batches_concat.batch(batch_size_train).repeat()
 
-        return (domain_batches_list, batches_concat_list_resized)
+        return tf.data.Dataset.zip((train_batches_domain, batches_concat))
     
     @tf.function
     def ComputeFirstOrderDerivatives(self, x_norm_input:tf.constant,idx_out:int=0):
-        x_var = x_norm_input
-        with tf.GradientTape(watch_accessed_variables=False) as tape_con:
-            tape_con.watch(x_var)
-            Y_norm = self._MLP_Evaluation(x_var)
-            dY_norm = tape_con.gradient(tf.gather(Y_norm, indices=idx_out, axis=1), x_var)
-        return Y_norm, dY_norm
+        Y_norm, dY_norm = self.ComputeMLPJacobian(x_norm_input)
+        return Y_norm, dY_norm[:, idx_out, :]
     
     @tf.function
     def ComputeSecondOrderDerivatives(self, x_norm_input:tf.constant,iVar:int=0, jVar:int=0):
-        with tf.GradientTape(watch_accessed_variables=False) as tape:
-            tape.watch(x_norm_input)
-            Y_norm, dY_norm = self.ComputeFirstOrderDerivatives(x_norm_input, iVar)
-            d2Y_norm = tape.gradient(tf.gather(dY_norm, indices=jVar, axis=1), x_norm_input)
-        return Y_norm, dY_norm, d2Y_norm
+        Y_norm, dY_norm, d2Y_norm = self.ComputeMLPDerivatives(x_norm_input)
+        return Y_norm, dY_norm[:, iVar, :], d2Y_norm[:, iVar, jVar, :]
     
     @tf.function
     def update_lambda(self, grads_direct, grads_ub, val_lambda_old):
@@ -1402,16 +2553,60 @@ class PhysicsInformedTrainer(CustomTrainer):
         self.lambda_history.clear()
         return super().LoopEpochs()
     
+    def GetKernelSignatures(self, element_spec):
+        """Get the input signatures of the train step kernels. Boundary condition penalty values and the boundary 
+        loss flag are passed as tensors, such that updating them does not trigger retracing.
+
+        :param element_spec: specification of the paired domain and boundary data batches.
+        :type element_spec: tuple
+        :return: input signature for each train step kernel name.
+        :rtype: dict
+        """
+        batch_spec = list(element_spec[0]) + list(element_spec[1])
+        vals_lambda_spec = [tf.TensorSpec(shape=[], dtype=self._dt) for _ in self.vals_lambda]
+        include_boundary_spec = tf.TensorSpec(shape=[], dtype=tf.bool)
+        train_step_signature = batch_spec + [vals_lambda_spec, include_boundary_spec]
+        return {"Train_Step": train_step_signature, \
+                "Train_Step_Gauss_Seidel": train_step_signature,\
+                "Train_Step_Block_Jacobi": train_step_signature,\
+                "Train_Step_Lambda_Update": batch_spec + [vals_lambda_spec]}
+    
     def LoopBatches(self, train_batches):
         """Loop over domain and boundary batches for each epoch.
 
-        :param train_batches: tuple of domain and boundary data batches.
-        :type train_batches: tuple
+        :param train_batches: data set of paired domain and boundary data batches.
+        :type train_batches: tf.data.Dataset
         """
-        domain_batches = train_batches[0]
-        boundary_batches = train_batches[1]
         vals_lambda = self.vals_lambda.copy()
-        for batch_domain, batch_boundary in zip(domain_batches, boundary_batches):
+        if self._i_epoch > self._boundary_loss_patience and self._enable_boundary_loss:
+            self._include_boundary_loss = True
+        else:
+            self._include_boundary_loss = False
+        
+        if self._graph_epoch:
+            vals_lambda_updated, j_gradient_update = self.GraphLoopBatches(train_batches, vals_lambda, \
+                                                                           tf.constant(self.j_gradient_update, dtype=tf.int64), \
+                                                                           tf.constant(self._include_boundary_loss, dtype=tf.bool))
+            self.vals_lambda = [v for v in vals_lambda_updated]
+            self.j_gradient_update = int(j_gradient_update)
+        else:
+            self.PythonLoopBatches(train_batches, vals_lambda)
+
+        if self._enable_boundary_loss:  
+            self.lambda_history.append([lamb.numpy() for lamb in self.vals_lambda])
+
+        return 
+    
+    def PythonLoopBatches(self, train_batches:tf.data.Dataset, vals_lambda:list[tf.constant]):
+        """Loop over domain and boundary batches in Python, calling the compiled train step for each batch.
+
+        :param train_batches: data set of paired domain and boundary data batches.
+        :type train_batches: tf.data.Dataset
+        :param vals_lambda: boundary condition penalty values at the start of the epoch.
+        :type vals_lambda: list[tf.constant]
+        """
+        include_boundary = tf.constant(self._include_boundary_loss, dtype=tf.bool)
+        for batch_domain, batch_boundary in train_batches:
 
             # Extract domain batch data.
             X_domain_batch = batch_domain[0]
@@ -1421,33 +2616,131 @@ class PhysicsInformedTrainer(CustomTrainer):
             P_boundary_batch = batch_boundary[1]
             Yt_boundary_batch = batch_boundary[2]
 
-            if self._i_epoch > self._boundary_loss_patience and self._enable_boundary_loss:
-                self._include_boundary_loss = True
-            else:
-                self._include_boundary_loss = False
-            # Run train step and adjust weights.
-            if self._train_step_type == "Gauss-Seidel":
-                self.Train_Step_Gauss_Seidel(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, self._include_boundary_loss)
+            update_lambda = ((self.j_gradient_update + 1)%self.update_lambda_every_iter ==0) and self._include_boundary_loss
+            if update_lambda and self.ReuseLambdaGradients():
+                # Run train step and update boundary condition penalty values from the train step sensitivities.
+                _, vals_lambda_updated = self.Train_Step_Lambda_Update(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda)
+                self.vals_lambda = [v for v in vals_lambda_updated]
             else:
-                self.Train_Step(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, self._include_boundary_loss)
+                # Run train step and adjust weights.
+                self.RunTrainStep(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
 
-            # Update boundary condition penalty values.
-            if ((self.j_gradient_update + 1)%self.update_lambda_every_iter ==0) and self._include_boundary_loss:
-                vals_lambda_updated = self.UpdateLambdas(X_domain_batch, Y_domain_batch, X_boundary_batch, P_boundary_batch, Yt_boundary_batch, vals_lambda)
-                self.vals_lambda = [v for v in vals_lambda_updated]
+                # Update boundary condition penalty values.
+                if update_lambda:
+                    vals_lambda_updated = self.UpdateLambdas(X_domain_batch, Y_domain_batch, X_boundary_batch, P_boundary_batch, Yt_boundary_batch, vals_lambda)
+                    self.vals_lambda = [v for v in vals_lambda_updated]
 
             self.j_gradient_update += 1
-        if self._enable_boundary_loss:  
-            self.lambda_history.append([lamb.numpy() for lamb in self.vals_lambda])
-
         return 
     
+    @tf.function
+    def GraphLoopBatches(self, train_batches:tf.data.Dataset, vals_lambda:list[tf.constant], j_gradient_update:tf.Tensor, include_boundary:tf.Tensor):
+        """Loop over domain and boundary batches of an epoch in graph mode, including the periodic update of the 
+        boundary condition penalty values. The loop over the data set iterator is converted into a tf.while_loop.
+
+        :param train_batches: data set of paired domain and boundary data batches.
+        :type train_batches: tf.data.Dataset
+        :param vals_lambda: boundary condition penalty values at the start of the epoch.
+        :type vals_lambda: list[tf.constant]
+        :param j_gradient_update: gradient update counter at the start of the epoch.
+        :type j_gradient_update: tf.Tensor
+        :param include_boundary: include the boundary loss terms in the train step.
+        :type include_boundary: tf.Tensor
+        :return: updated penalty values and gradient update counter.
+        :rtype: list[tf.Tensor], tf.Tensor
+        """
+        vals_lambda_updated = vals_lambda
+        for batch_domain, batch_boundary in iter(train_batches):
+            X_domain_batch, Y_domain_batch = batch_domain[0], batch_domain[1]
+            X_boundary_batch, P_boundary_batch, Yt_boundary_batch = batch_boundary[0], batch_boundary[1], batch_boundary[2]
+
+            # Train step type is resolved while tracing, boundary loss inclusion is evaluated in the graph.
+            if self.ReuseLambdaGradients() and include_boundary:
+                if (j_gradient_update + 1) % self.update_lambda_every_iter == 0:
+                    vals_lambda_updated = self.Train_Step_Lambda_Update(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda)[1]
+                else:
+                    self.RunTrainStep(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
+            else:
+                self.RunTrainStep(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
+                if include_boundary:
+                    if (j_gradient_update + 1) % self.update_lambda_every_iter == 0:
+                        vals_lambda_updated = self.UpdateLambdas(X_domain_batch, Y_domain_batch, X_boundary_batch, P_boundary_batch, Yt_boundary_batch, vals_lambda)
+            j_gradient_update += 1
+        return vals_lambda_updated, j_gradient_update
+    
+    def RunTrainStep(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, \
+                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant], include_boundary:tf.Tensor):
+        """Run the train step according to the selected weights update step type.
+        """
+        if self._train_step_type == "Gauss-Seidel":
+            return self.Train_Step_Gauss_Seidel(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
+        elif self._train_step_type == "Block-Jacobi":
+            return self.Train_Step_Block_Jacobi(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
+        else:
+            return self.Train_Step(X_domain_batch, Y_domain_batch, X_boundary_batch,P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
+    
+    def ReuseLambdaGradients(self):
+        """Check whether boundary condition penalty values are updated from the train step sensitivities. This is 
+        supported for the Jacobi train step only.
+
+        :return: whether penalty value updates re-use the train step sensitivities.
+        :rtype: bool
+        """
+        return self._reuse_lambda_gradients and (self._train_step_type == "Jacobi")
+    
+    @tf.function
+    def Train_Step_Lambda_Update(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, \
+                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant]):
+        """Jacobi train step which also updates the boundary condition penalty values. The sensitivities of the domain 
+        loss and of each boundary penalty are obtained from one Jacobian call and are used for both the weights update 
+        and the penalty value update.
+
+        :return: batch loss and updated penalty values.
+        :rtype: tf.Tensor, list[tf.Tensor]
+        """
+        loss_terms, jac_loss_terms = self.DataParallelEvaluation(self.ComputeJacobian_Loss_Terms, [X_domain_batch, Y_domain_batch], X_boundary_batch, P_boundary_batch, Yt_boundary_batch)
+        domain_loss = loss_terms[0]
+        neumann_penalties = loss_terms[1:]
+
+        # Assemble the total loss sensitivity from the per-term sensitivities.
+        grads_domain = [j[0] for j in jac_loss_terms]
+        grads_bc_list = [[j[iBc+1] for j in jac_loss_terms] for iBc in range(self._N_bc)]
+        grads_total = []
+        for iParam, g_domain in enumerate(grads_domain):
+            g_total = g_domain
+            for iBc in range(self._N_bc):
+                g_total += vals_lambda[iBc] * grads_bc_list[iBc][iParam]
+            grads_total.append(g_total)
+        self.UpdateWeights(grads_total)
+
+        batch_loss = domain_loss
+        vals_lambda_new = []
+        for iBc in range(self._N_bc):
+            batch_loss += vals_lambda[iBc] * neumann_penalties[iBc]
+            vals_lambda_new.append(self.update_lambda(grads_domain, grads_bc_list[iBc], vals_lambda[iBc]))
+        return batch_loss, vals_lambda_new
+    
+    @tf.function
+    def ComputeJacobian_Loss_Terms(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, \
+                                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant):
+        """Compute the domain loss and boundary penalty values and their sensitivities from one Jacobian call.
+
+        :return: domain loss and boundary penalty values, and their sensitivities.
+        :rtype: tf.Tensor, list[tf.Tensor]
+        """
+        with tf.GradientTape() as tape:
+            tape.watch(self._trainable_hyperparams)
+            domain_loss = self.TrainingLoss_error(X_domain_batch, Y_domain_batch)
+            neumann_penalties = self.ComputeNeumannPenalties(X_boundary_batch, Yt_boundary_batch, P_boundary_batch)
+            loss_terms = tf.concat([tf.reshape(domain_loss, [1]), neumann_penalties], axis=0)
+        return loss_terms, tape.jacobian(loss_terms, self._trainable_hyperparams)
+    
     @tf.function
     def Train_Step(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, \
-                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant], include_boundary:bool):
+                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant], include_boundary:tf.Tensor):
 
         # Compute training loss for the current batch and extract HP sensitivities.
-        batch_loss, sens_batch = self.Train_sensitivity_function(X_domain_batch, Y_domain_batch, X_boundary_batch, P_boundary_batch, Yt_boundary_batch, vals_lambda,include_boundary)
+        batch_loss, sens_batch = self.DataParallelEvaluation(self.Train_sensitivity_function, [X_domain_batch, Y_domain_batch], X_boundary_batch, P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary)
         
         # Update network weigths and biases.
         self.UpdateWeights(sens_batch)
@@ -1456,26 +2749,72 @@ class PhysicsInformedTrainer(CustomTrainer):
     
     @tf.function
     def Train_Step_Gauss_Seidel(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, \
-                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant], include_boundary:bool):
+                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant], include_boundary:tf.Tensor):
         for iVar in range(len(self._state_vars)):
-            with tf.GradientTape() as tape:
-                tape.watch(self._trainable_hyperparams)
-                Y_state_pred = self.EvaluateState(X_domain_batch)[:, iVar]
-                Y_state_pred_norm = (Y_state_pred - self._Y_state_offset[iVar]) / self._Y_state_scale[iVar]
-                Y_state_ref= Y_domain_batch[:, iVar]
-                state_error_norm = tf.reduce_mean(tf.pow((Y_state_pred_norm - Y_state_ref), 2))
-                grads_state_error = tape.gradient(state_error_norm, self._trainable_hyperparams)
+            grads_state_error = self.DataParallelEvaluation(self.ComputeGradients_State_Var_Error, [X_domain_batch, Y_domain_batch], iVar)
             self.UpdateWeights(grads_state_error)
             if include_boundary:
-                with tf.GradientTape() as tape:
-                    boundary_loss = 0.0
-                    for iBc in range(self._N_bc):
-                        bc_loss = self.ComputeNeumannPenalty(X_boundary_batch, Yt_boundary_batch, P_boundary_batch,iBc)
-                        boundary_loss += vals_lambda[iBc] * bc_loss
-                    grads_boundary_error = tape.gradient(boundary_loss, self._trainable_hyperparams)
-                    self.UpdateWeights(grads_boundary_error)
+                grads_boundary_error = self.DataParallelEvaluation(self.ComputeGradients_BC_Loss, [X_boundary_batch, Yt_boundary_batch, P_boundary_batch], vals_lambda)
+                self.UpdateWeights(grads_boundary_error)
+        return 
+    
+    @tf.function
+    def ComputeGradients_State_Var_Error(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, iVar:int):
+        """Compute the loss sensitivity of a single state variable for the Gauss-Seidel train step.
+
+        :return: state variable loss sensitivities.
+        :rtype: list[tf.Tensor]
+        """
+        with tf.GradientTape() as tape:
+            tape.watch(self._trainable_hyperparams)
+            Y_state_pred = self.EvaluateState(X_domain_batch)[:, iVar]
+            Y_state_pred_norm = (Y_state_pred - self._Y_state_offset[iVar]) / self._Y_state_scale[iVar]
+            Y_state_ref= Y_domain_batch[:, iVar]
+            state_error_norm = tf.reduce_mean(tf.pow((Y_state_pred_norm - Y_state_ref), 2))
+            grads_state_error = tape.gradient(state_error_norm, self._trainable_hyperparams)
+        return grads_state_error
+    
+    @tf.function
+    def ComputeGradients_BC_Loss(self, X_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, P_boundary_batch:tf.constant, vals_lambda:list[tf.constant]):
+        """Compute the sensitivity of the weighted boundary condition loss.
+
+        :return: boundary loss sensitivities.
+        :rtype: list[tf.Tensor]
+        """
+        with tf.GradientTape() as tape:
+            tape.watch(self._trainable_hyperparams)
+            boundary_loss = self.ComputeBCLoss(X_boundary_batch, Yt_boundary_batch, P_boundary_batch, vals_lambda)
+        return tape.gradient(boundary_loss, self._trainable_hyperparams)
+    
+    @tf.function
+    def Train_Step_Block_Jacobi(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant, \
+                   X_boundary_batch:tf.constant, P_boundary_batch:tf.constant, Yt_boundary_batch:tf.constant, vals_lambda:list[tf.constant], include_boundary:tf.Tensor):
+        """Block-Jacobi variant of the Gauss-Seidel train step. The sensitivities of all state variable losses are 
+        obtained from a single state evaluation and one Jacobian call, after which the weights are updated for each 
+        state variable in sequence. The boundary loss is applied once per batch, after the state variable updates.
+        """
+        jac_state_error = self.DataParallelEvaluation(self.ComputeJacobian_State_Error, [X_domain_batch, Y_domain_batch])
+
+        for iVar in range(len(self._state_vars)):
+            self.UpdateWeights([j[iVar] for j in jac_state_error])
+        
+        if include_boundary:
+            grads_boundary_error = self.DataParallelEvaluation(self.ComputeGradients_BC_Loss, [X_boundary_batch, Yt_boundary_batch, P_boundary_batch], vals_lambda)
+            self.UpdateWeights(grads_boundary_error)
         return 
     
+    @tf.function
+    def ComputeJacobian_State_Error(self, X_domain_batch:tf.constant, Y_domain_batch:tf.constant):
+        """Compute the sensitivities of the loss of each state variable from a single state evaluation.
+
+        :return: state loss sensitivities, with the state variable along the first dimension.
+        :rtype: list[tf.Tensor]
+        """
+        with tf.GradientTape() as tape:
+            tape.watch(self._trainable_hyperparams)
+            state_error_norm = self.ComputeStateError(X_domain_batch, Y_domain_batch)
+        return tape.jacobian(state_error_norm, self._trainable_hyperparams)
+    
     @tf.function
     def UpdateWeights(self, grads):
         self._optimizer.apply_gradients(zip(grads, self._trainable_hyperparams))
@@ -1491,7 +2830,7 @@ class PhysicsInformedTrainer(CustomTrainer):
         :rtype: list[tf.constant]
         """
 
-        _, grads_domain, _, grads_bc_list = self.ComputeGradients(X_domain_batch, Y_domain_batch, X_boundary_batch, P_boundary_batch, Yt_boundary_batch)
+        _, grads_domain, _, grads_bc_list = self.DataParallelEvaluation(self.ComputeGradients, [X_domain_batch, Y_domain_batch], X_boundary_batch, P_boundary_batch, Yt_boundary_batch)
         
         vals_lambda_new = []
         for iBc, lambda_old in enumerate(vals_lambda_old):
@@ -1524,13 +2863,12 @@ class PhysicsInformedTrainer(CustomTrainer):
     def ComputeGradients(self, X_domain_batch, Y_domain_batch, X_boundary_batch,  P_boundary_batch, Yt_boundary_batch):
         y_domain_loss, grads_domain = self.ComputeGradients_State_error(X_label_norm=X_domain_batch, Y_state_label_norm=Y_domain_batch)
 
-        grads_bc_list = []
-        loss_bc_list = []
-        for iBC in range(self._N_bc):
-            boundary_loss, grads_boundary_loss = self.ComputeGradients_Boundary_Error(X_boundary_batch, Yt_boundary_batch,P_boundary_batch,iBC)
-            
-            grads_bc_list.append(grads_boundary_loss)
-            loss_bc_list.append(boundary_loss)
+        # Boundary penalties share a single MLP Jacobian evaluation.
+        with tf.GradientTape(persistent=True) as tape:
+            tape.watch(self._trainable_hyperparams)
+            neumann_penalties = self.ComputeNeumannPenalties(X_boundary_batch, Yt_boundary_batch, P_boundary_batch)
+            loss_bc_list = [neumann_penalties[iBC] for iBC in range(self._N_bc)]
+        grads_bc_list = [tape.gradient(boundary_loss, self._trainable_hyperparams) for boundary_loss in loss_bc_list]
         return y_domain_loss, grads_domain, loss_bc_list, grads_bc_list
     
     @tf.function
@@ -1558,23 +2896,42 @@ class PhysicsInformedTrainer(CustomTrainer):
         :return: direct evaluation and Neumann penalty values.
         :rtype: tf.constant
         """
+        return self.ComputeNeumannPenalties(x_norm_boundary, dy_norm_boundary_target, precon_gradient)[iVar]
+    
+    @tf.function
+    def ComputeNeumannPenalties(self, x_norm_boundary:tf.constant, dy_norm_boundary_target:tf.constant,precon_gradient:tf.constant): 
+        """Neumann penalty functions for projected MLP Jacobians along boundary data for all boundary conditions, 
+        computed from a single evaluation of the MLP Jacobian.
+
+        :param x_norm_boundary: boundary data controlling variable values.
+        :type x_norm_boundary: tf.constant
+        :param dy_norm_boundary_target: target projected gradients.
+        :type dy_norm_boundary_target: tf.constant
+        :param precon_gradient: MLP Jacobian pre-conditioners.
+        :type precon_gradient: tf.constant
+        :return: Neumann penalty value for each boundary condition.
+        :rtype: tf.Tensor
+        """
 
-        # Evaluate MLP Jacobian on boundary data.
-        _, dy_pred_norm = self.ComputeFirstOrderDerivatives(x_norm_boundary, self.idx_PIvar[iVar])
+        # Evaluate MLP Jacobian on boundary data for all outputs.
+        _, dy_pred_norm = self.ComputeMLPJacobian(x_norm_boundary)
 
-        # Project Jacobian along boundary data according to penalty function.
-        project_dy_pred_norm = tf.reduce_sum(tf.multiply(precon_gradient[:,:,iVar], dy_pred_norm), axis=1)
+        # Select Jacobian of the constrained output for each boundary condition [batch, input, boundary condition].
+        dy_pred_bc = tf.transpose(tf.gather(dy_pred_norm, indices=self.idx_PIvar, axis=1), [0, 2, 1])
 
-        # Compute direct and Neumann penalty values.
-        penalty = tf.reduce_mean(tf.pow(project_dy_pred_norm - dy_norm_boundary_target[:, iVar], 2))
-        return penalty
+        # Project Jacobians along boundary data according to penalty functions.
+        project_dy_pred_norm = tf.reduce_sum(tf.multiply(precon_gradient, dy_pred_bc), axis=1)
+
+        # Compute Neumann penalty values.
+        penalties = tf.reduce_mean(tf.pow(project_dy_pred_norm - dy_norm_boundary_target, 2), axis=0)
+        return penalties
     
     @tf.function 
     def Train_loss_function(self, X_domain_batch, Y_domain_batch, X_boundary_batch, P_boundary_batch, Yt_boundary_batch, vals_lambda, include_boundary):
         
         domain_loss = self.TrainingLoss_error(X_domain_batch, Y_domain_batch)
         total_loss = domain_loss
-        bc_loss = 0.0
+        bc_loss = tf.constant(0.0, dtype=self._dt)
         if include_boundary:
             bc_loss = self.ComputeBCLoss(X_boundary_batch, Yt_boundary_batch, P_boundary_batch, vals_lambda)
 
@@ -1584,9 +2941,10 @@ class PhysicsInformedTrainer(CustomTrainer):
     
     @tf.function 
     def ComputeBCLoss(self, X_boundary_batch, Yt_boundary_batch, P_boundary_batch, vals_lambda):
-        boundary_loss = 0.0
+        neumann_penalties = self.ComputeNeumannPenalties(X_boundary_batch, Yt_boundary_batch, P_boundary_batch)
+        boundary_loss = tf.constant(0.0, dtype=self._dt)
         for iBc in range(self._N_bc):
-            boundary_loss += vals_lambda[iBc] * self.ComputeNeumannPenalty(X_boundary_batch, Yt_boundary_batch, P_boundary_batch,iBc)
+            boundary_loss += vals_lambda[iBc] * neumann_penalties[iBc]
         return boundary_loss 
     
     @tf.function 
@@ -1606,16 +2964,14 @@ class PhysicsInformedTrainer(CustomTrainer):
         mean_pred_error = tf.reduce_mean(pred_error_outputs)
         return mean_pred_error
     
-    def ValidationLoss(self):
-        val_error_state = self.ComputeStateError(tf.cast(self._X_val_norm, dtype=self._dt), tf.cast(self._Y_state_val_norm,dtype=self._dt))
-        val_error_state = val_error_state.numpy()
-        for iVar in range(len(self._state_vars)):
-            self.val_loss_history[iVar].append(val_error_state[iVar])
-        return val_error_state
+    def EvaluateValidationLoss(self, full_validation:bool=True):
+        if full_validation:
+            return self.EvaluateInChunks(self.ComputeStateError, self._X_val_norm_tf, self._Y_state_val_norm_tf)
+        return self.EvaluateInChunks(self.ComputeStateError, self._X_val_sub_tf, self._Y_state_val_sub_tf)
     
     def TestLoss(self):
-        test_error_state = self.ComputeStateError(tf.cast(self._X_test_norm, dtype=self._dt), tf.cast(self._Y_state_test_norm,dtype=self._dt))
-        self.state_test_loss = test_error_state.numpy()
+        test_error_state = self.EvaluateInChunks(self.ComputeStateError, self._X_test_norm_tf, self._Y_state_test_norm_tf)
+        self.state_test_loss = test_error_state
         self._test_score = np.average(self.state_test_loss)
         return test_error_state
     
@@ -1672,6 +3028,29 @@ class TrainMLP:
 
     _fig_format:str = "png"
     _scaler:str = "robust"
+    _use_data_cache:bool = False    # Re-use normalized train data from previous trainings.
+    _streaming:bool = False         # Stream train data from disk during training.
+    _stream_chunk_size:int = 2**16  # Number of data points read from disk at once in streaming mode.
+    _shuffle_train_data:bool = False    # Reshuffle the train data every epoch.
+    _shuffle_seed:int = None            # Random seed for reshuffling the train data.
+    _prefetch_train_data:bool = True    # Prefetch train data batches.
+    _cache_train_data:bool = False      # Cache streamed train data after the first epoch.
+    _cache_train_file:str = ""          # File to cache streamed train data in.
+    _n_parallel_calls:int = None        # Number of parallel calls used for batch preparation.
+    _log_throughput:bool = False        # Print train data throughput every epoch.
+    _graph_epoch:bool = False           # Run the batch loop of each epoch in a single compiled function.
+    _drop_remainder:bool = False        # Skip the incomplete last train batch of each epoch.
+    _jit_compile:bool = False           # Compile training kernels with XLA.
+    _eval_chunk_size:int = 2**18        # Number of data points evaluated at once for validation and test loss computation.
+    _validate_every:int = 1             # Number of epochs between validation loss evaluations.
+    _val_subsample_size:int = None      # Size of the validation subsample used between checkpoints.
+    _val_subsample_seed:int = 0         # Random seed for selecting the validation subsample.
+    _precision_policy:str = None        # Floating point precision policy. Trainer default is used if None.
+    _n_workers:int = 1                  # Number of data-parallel workers among which each batch is sharded.
+    _intra_op_threads:int = None        # Number of threads used to run a single operation, per worker.
+    _inter_op_threads:int = None        # Number of operations run concurrently, per worker.
+    _shared_data:SharedTrainData = None # Reference data shared with other trainers on the same data set.
+    _epoch_callback = None              # Function of the epoch index and validation loss. Training stops if it returns False.
     __set_custom_weights:bool = False
     __weights_custom:list[np.ndarray[float]] = None 
     __biases_custom:list[np.ndarray[float]] = None 
@@ -1692,6 +3071,7 @@ class TrainMLP:
         self.lr_decay = self._Config.GetLRDecay()
         self.batch_expo = self._Config.GetBatchExpo()
         self.activation_function = self._Config.GetActivationFunction()
+        self._jit_compile = self._Config.GetJITCompile()
         self.architecture = []
         for n in self._Config.GetHiddenLayerArchitecture():
             self.architecture.append(n)
@@ -1725,6 +3105,241 @@ class TrainMLP:
         self._trainer_direct.SetVerbose(self.verbose)
         self._trainer_direct.SetFigFormat(self._fig_format)
         self._trainer_direct.SetScaler(self._scaler)
+        self._trainer_direct.SetEpochCallback(self._epoch_callback)
+        self._SynchronizeDataSettings(self._trainer_direct)
+        return 
+    
+    def _SynchronizeDataSettings(self, trainer:MLPTrainer):
+        """Synchronize train data loading, input pipeline, and batch loop settings with an MLP trainer.
+
+        :param trainer: MLP trainer to synchronize.
+        :type trainer: MLPTrainer
+        """
+        trainer.SetDataCache(self._use_data_cache)
+        trainer.SetStreamingMode(self._streaming, self._stream_chunk_size)
+        trainer.SetShuffleTrainData(self._shuffle_train_data, self._shuffle_seed)
+        trainer.SetPrefetchTrainData(self._prefetch_train_data)
+        trainer.SetCacheTrainData(self._cache_train_data, self._cache_train_file)
+        trainer.SetParallelCalls(self._n_parallel_calls)
+        trainer.SetLogThroughput(self._log_throughput)
+        trainer.SetGraphEpoch(self._graph_epoch)
+        trainer.SetDropRemainder(self._drop_remainder)
+        trainer.SetJITCompile(self._jit_compile)
+        trainer.SetEvaluationChunkSize(self._eval_chunk_size)
+        trainer.SetValidationFrequency(self._validate_every)
+        trainer.SetValidationSubsample(self._val_subsample_size, self._val_subsample_seed)
+        if self._precision_policy is not None:
+            trainer.SetPrecisionPolicy(self._precision_policy)
+        if (trainer._n_workers, trainer._intra_op_threads, trainer._inter_op_threads) != (self._n_workers, self._intra_op_threads, self._inter_op_threads):
+            trainer.SetDataParallel(self._n_workers, self._intra_op_threads, self._inter_op_threads)
+        trainer.SetSharedData(self._shared_data)
+        return 
+    
+    def LoadSharedData(self, shared_data:SharedTrainData):
+        """Load the reference data required for training into a data storage shared with other trainers, and read 
+        the training data from the shared storage.
+
+        :param shared_data: shared data storage.
+        :type shared_data: SharedTrainData
+        """
+        self._shared_data = shared_data 
+        self.SynchronizeTrainer()
+        self._trainer_direct.LoadSharedData(shared_data)
+        return 
+    
+    def SetShuffleTrainData(self, shuffle:bool=True, seed:int=None):
+        """Reshuffle the train data every epoch.
+
+        :param shuffle: reshuffle train data every epoch, defaults to True
+        :type shuffle: bool, optional
+        :param seed: random seed for reshuffling, defaults to None
+        :type seed: int, optional
+        """
+        self._shuffle_train_data = shuffle 
+        self._shuffle_seed = seed 
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetPrefetchTrainData(self, prefetch:bool=True):
+        """Prepare the next train data batches while training on the current batch.
+
+        :param prefetch: prefetch train data batches, defaults to True
+        :type prefetch: bool, optional
+        """
+        self._prefetch_train_data = prefetch 
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetCacheTrainData(self, cache:bool=True, cache_file:str=""):
+        """Cache the streamed and normalized train data after the first epoch. Only applies to streaming mode.
+
+        :param cache: cache streamed train data, defaults to True
+        :type cache: bool, optional
+        :param cache_file: file in which to cache the train data. Data is cached in memory if empty, defaults to ""
+        :type cache_file: str, optional
+        """
+        self._cache_train_data = cache 
+        self._cache_train_file = cache_file
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetParallelCalls(self, n_parallel_calls:int=None):
+        """Set the number of parallel calls used to prepare train data batches.
+
+        :param n_parallel_calls: number of parallel calls. Tuned automatically if None, defaults to None
+        :type n_parallel_calls: int, optional
+        :raises Exception: if the number of parallel calls is lower than one.
+        """
+        if n_parallel_calls is not None and n_parallel_calls < 1:
+            raise Exception("Number of parallel calls should be at least one.")
+        self._n_parallel_calls = n_parallel_calls
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetLogThroughput(self, log_throughput:bool=True):
+        """Print the train data throughput in samples per second every epoch.
+
+        :param log_throughput: print train data throughput, defaults to True
+        :type log_throughput: bool, optional
+        """
+        self._log_throughput = log_throughput
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetGraphEpoch(self, graph_epoch:bool=True):
+        """Run the complete batch loop of each epoch inside a single compiled function. Only applies to custom 
+        training loops.
+
+        :param graph_epoch: compile the batch loop of each epoch, defaults to True
+        :type graph_epoch: bool, optional
+        """
+        self._graph_epoch = graph_epoch
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetDropRemainder(self, drop_remainder:bool=True):
+        """Skip the incomplete last train batch of each epoch, such that all train batches have the same shape.
+
+        :param drop_remainder: skip the incomplete last train batch, defaults to True
+        :type drop_remainder: bool, optional
+        """
+        self._drop_remainder = drop_remainder
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetJITCompile(self, jit_compile:bool=True):
+        """Compile the train step, validation, and derivative kernels with XLA.
+
+        :param jit_compile: compile training kernels with XLA, defaults to True
+        :type jit_compile: bool, optional
+        """
+        self._jit_compile = jit_compile
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetEvaluationChunkSize(self, chunk_size:int=2**18):
+        """Set the number of data points for which the validation and test loss are evaluated at once.
+
+        :param chunk_size: number of data points per evaluation chunk, defaults to 2**18
+        :type chunk_size: int, optional
+        :raises Exception: if the chunk size is lower than one.
+        """
+        if chunk_size < 1:
+            raise Exception("Evaluation chunk size should be at least one.")
+        self._eval_chunk_size = chunk_size
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetValidationFrequency(self, validate_every:int=1):
+        """Set the number of epochs between validation loss evaluations. The validation loss is always evaluated 
+        at checkpoints and at the final epoch.
+
+        :param validate_every: number of epochs between validation loss evaluations, defaults to 1
+        :type validate_every: int, optional
+        :raises Exception: if the validation frequency is lower than one.
+        """
+        if validate_every < 1:
+            raise Exception("Number of epochs between validation should be at least one.")
+        self._validate_every = validate_every
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetValidationSubsample(self, n_samples:int=None, seed:int=0):
+        """Evaluate the validation loss between checkpoints on a stratified subsample of the validation data.
+
+        :param n_samples: validation subsample size. The full validation set is used if None, defaults to None
+        :type n_samples: int, optional
+        :param seed: random seed for selecting the subsample, defaults to 0
+        :type seed: int, optional
+        :raises Exception: if the subsample size is lower than one.
+        """
+        if n_samples is not None and n_samples < 1:
+            raise Exception("Validation subsample size should be at least one.")
+        self._val_subsample_size = n_samples
+        self._val_subsample_seed = seed
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetPrecisionPolicy(self, policy:str="float32"):
+        """Set the floating point precision policy used for training. Mixed precision policies are only applied 
+        to direct fits, physics-informed trainers fall back to float64.
+
+        :param policy: precision policy ("float32", "float64", "mixed_float16", or "mixed_bfloat16"), defaults to "float32"
+        :type policy: str, optional
+        :raises Exception: if the precision policy is not supported.
+        """
+        if policy not in MLPTrainer._precision_policy_options:
+            raise Exception("Precision policy \"%s\" not supported. Options are: %s" % (policy, ", ".join(MLPTrainer._precision_policy_options)))
+        self._precision_policy = policy
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetDataParallel(self, n_workers:int=1, intra_op_threads:int=None, inter_op_threads:int=None):
+        """Shard each train batch among multiple workers which evaluate the loss sensitivities concurrently. Should 
+        be set before TensorFlow is initialized.
+
+        :param n_workers: number of data-parallel workers, defaults to 1
+        :type n_workers: int, optional
+        :param intra_op_threads: number of threads used to run a single operation per worker, defaults to None
+        :type intra_op_threads: int, optional
+        :param inter_op_threads: number of operations run concurrently per worker, defaults to None
+        :type inter_op_threads: int, optional
+        :raises Exception: if the number of workers or threads is lower than one.
+        """
+        if n_workers < 1:
+            raise Exception("Number of data-parallel workers should be at least one.")
+        if (intra_op_threads is not None and intra_op_threads < 1) or (inter_op_threads is not None and inter_op_threads < 1):
+            raise Exception("Number of threads per worker should be at least one.")
+        self._n_workers = n_workers
+        self._intra_op_threads = intra_op_threads
+        self._inter_op_threads = inter_op_threads
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetDataCache(self, use_cache:bool=True):
+        """Re-use normalized train, test, and validation data cached during previous trainings on the same data set.
+
+        :param use_cache: use cached normalized data, defaults to True
+        :type use_cache: bool, optional
+        """
+        self._use_data_cache = use_cache
+        self.SynchronizeTrainer()
+        return 
+    
+    def SetStreamingMode(self, streaming:bool=True, chunk_size:int=2**16):
+        """Stream the train data from disk in shuffled chunks instead of loading the complete train set into memory.
+
+        :param streaming: enable streaming mode, defaults to True
+        :type streaming: bool, optional
+        :param chunk_size: number of data points read from disk at once, defaults to 2**16
+        :type chunk_size: int, optional
+        :raises Exception: if the chunk size is lower than one.
+        """
+        if chunk_size < 1:
+            raise Exception("Streaming chunk size should be at least one.")
+        self._streaming = streaming
+        self._stream_chunk_size = chunk_size
+        self.SynchronizeTrainer()
         return 
     
     def SetSaveDir(self, save_dir:str):
@@ -1912,11 +3527,51 @@ class TrainMLP:
         """
         return self._test_score
     
+    def IsPruned(self):
+        """Check whether training was stopped by the epoch callback.
+
+        :return: training was stopped by the epoch callback.
+        :rtype: bool
+        """
+        return self._trainer_direct.IsPruned()
+    
+    def SetTrainResults(self, test_score:float, cost_parameter:float, weights:list[np.ndarray], biases:list[np.ndarray], model_index:int):
+        """Adopt the results of a training of the same MLP performed by a copy of this trainer, e.g. in a worker
+        process, such that the trained network and its scores are available from this trainer.
+
+        :param test_score: test set score of the trained MLP.
+        :type test_score: float
+        :param cost_parameter: evaluation cost parameter of the trained MLP.
+        :type cost_parameter: float
+        :param weights: trained weight arrays.
+        :type weights: list[np.ndarray]
+        :param biases: trained bias arrays.
+        :type biases: list[np.ndarray]
+        :param model_index: index of the model under which the trained MLP data were saved.
+        :type model_index: int
+        """
+        self.current_iter = model_index
+        self.SynchronizeTrainer()
+        self._trainer_direct.SetWeights(weights)
+        self._trainer_direct.SetBiases(biases)
+        self._test_score = test_score
+        self._cost_parameter = cost_parameter
+        return
+
+    def GetProblemSettings(self):
+        """Get the trainer settings which affect the outcome of a training, other than the network 
+        hyper-parameters and the data set.
+
+        :return: training problem settings.
+        :rtype: list[str]
+        """
+        return self._trainer_direct.GetProblemSettings()
+    
     def GetWeights(self):
         return self._trainer_direct.GetWeights()
     def GetBiases(self):
         return self._trainer_direct.GetBiases()
-    
+
     def GetScalerFunctionParams(self):
         return self._trainer_direct.GetScalerFunctionParams()
     def GetControlVars(self):
@@ -1924,6 +3579,14 @@ class TrainMLP:
     def GetTrainVars(self):
         return self._trainer_direct._train_vars
     
+    def GetModelDir(self):
+        """Get the directory in which the data of the current MLP are saved.
+
+        :return: model output directory.
+        :rtype: str
+        """
+        return self.worker_dir + "/Model_" + str(self.current_iter)
+    
     def SetTrainFileHeader(self, fileheader:str):
         """Set a custom training data file header.
 
@@ -1947,6 +3610,17 @@ class TrainMLP:
 
         return                
     
+    def SetEpochCallback(self, epoch_callback=None):
+        """Set a function which is called with the epoch index and validation loss during training. Training is 
+        stopped if the function returns False.
+
+        :param epoch_callback: function of epoch index and validation loss, defaults to None
+        :type epoch_callback: callable, optional
+        """
+        self._epoch_callback = epoch_callback
+        self.SynchronizeTrainer()
+        return 
+    
     def SetFigFormat(self, fig_format:str="png"):
         self._fig_format = fig_format
         return 
@@ -40,10 +40,13 @@ config = tf.compat.v1.ConfigProto()
 config.gpu_options.allow_growth = True
 import matplotlib.pyplot as plt 
 import cantera as ct 
+import multiprocessing
+import hashlib
+import pickle
 
 from Common.DataDrivenConfig import Config_FGM
-from Manifold_Generation.MLP.Trainer_Base import MLPTrainer, TensorFlowFit,PhysicsInformedTrainer,TrainMLP, CustomTrainer
-from Common.CommonMethods import GetReferenceData
+from Manifold_Generation.MLP.Trainer_Base import MLPTrainer, TensorFlowFit,PhysicsInformedTrainer,TrainMLP, CustomTrainer, SharedTrainData
+from Common.CommonMethods import GetReferenceData, SplitCPUs, InitializeWorkerResources
 from Common.Properties import DefaultSettings_FGM as DefaultProperties
 from Common.Properties import FGMVars
 
@@ -99,6 +102,10 @@ class Train_FGM_PINN(PhysicsInformedTrainer):
     """
 
     __Config:Config_FGM = None    # FlameletAI configuration class to read output variables and hyper-parameters from.
+    __is_unb:np.ndarray[bool] = None  # Reactant identification array of the boundary data.
+    __cantera_data:dict = None        # Boundary condition data computed with Cantera.
+    __cantera_data_key:str = None     # Configuration key of the Cantera boundary condition data.
+    __use_cantera_cache:bool = True   # Store the Cantera boundary condition data on disk for re-use by other trainings.
 
     def __init__(self, Config_in:Config_FGM, group_idx:int=0):
         """Class constructor. Initialize a physics-informed trainer object for a given output group.
@@ -139,6 +146,7 @@ class Train_FGM_PINN(PhysicsInformedTrainer):
     def GetTrainData(self):
         """Read domain and boundary training data and pre-process reactant-product matrices for visualization.
         """
+        self.__is_unb = None 
         super().GetTrainData()
         self.__GenerateBoundaryMatrices()
         return 
@@ -174,30 +182,16 @@ class Train_FGM_PINN(PhysicsInformedTrainer):
         """
         is_unb = self.__LocateUnbBoundaryNodes()
         
-        fuel_string = self.__Config.GetFuelString()
-        oxidizer_string = self.__Config.GetOxidizerString()
         mixfrac_boundary_norm = self._X_boundary_norm[:, self._controlling_vars.index(DefaultProperties.name_mixfrac)]
         
         # Compute the progress variable derivative w.r.t. mixture fraction for equilibrium conditions
+        cantera_data = self.GetCanteraBoundaryData()
 
-        self.__Config.gas.TP = self.__Config.GetUnbTempBounds()[0], DefaultProperties.pressure
+        # Progress variable values for pure oxidizer and pure fuel.
+        pv_ox, pv_f = cantera_data["pv_ox"], cantera_data["pv_f"]
 
-        # Compute progress variable values for pure oxidizer and pure fuel.
-        self.__Config.gas.set_mixture_fraction(0.0, fuel_string,oxidizer_string)
-        Y_ox = self.__Config.gas.Y 
-        self.__Config.gas.set_mixture_fraction(1.0,  fuel_string,oxidizer_string)
-        Y_f = self.__Config.gas.Y
-        
-        pv_ox = self.__Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=Y_ox[:, np.newaxis])[0]
-        pv_f = self.__Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=Y_f[:,np.newaxis])[0]
-
-        # Compute the progress variable and mixture fraction for the stochiometric equilibrium condition.
-        self.__Config.gas.set_equivalence_ratio(1.0,  fuel_string,oxidizer_string)
-        Z_st = self.__Config.gas.mixture_fraction( fuel_string,oxidizer_string)
-        self.__Config.gas.equilibrate("TP")
-        Y_b_st = self.__Config.gas.Y 
-        pv_st = self.__Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=Y_b_st[:,np.newaxis])[0]
-        h_st = self.__Config.gas.enthalpy_mass
+        # Progress variable, enthalpy, and mixture fraction for the stochiometric equilibrium condition.
+        Z_st, pv_st, h_st = cantera_data["Z_st"], cantera_data["pv_st"], cantera_data["h_st"]
         X_st_norm = self.scaler_function_x.transform(np.array([[pv_st, h_st, Z_st]]))[0,:]
         Z_st_norm = X_st_norm[2]
 
@@ -229,33 +223,87 @@ class Train_FGM_PINN(PhysicsInformedTrainer):
         
         return projection_array_pvz, is_unb, is_lean, is_stoch
     
+    def SetCanteraCache(self, use_cache:bool=True):
+        """Store the boundary condition data computed with Cantera in the data cache directory, such that subsequent 
+        trainings on the same manifold configuration skip the Cantera computations. The Cantera data are cached 
+        independently of the normalized train data cache.
+
+        :param use_cache: use cached Cantera boundary condition data, defaults to True
+        :type use_cache: bool, optional
+        """
+        self.__use_cantera_cache = use_cache
+        return 
+    
+    def GetCanteraBoundaryData(self):
+        """Get the boundary condition data computed with Cantera. These depend only on the reaction mechanism, 
+        reactants, temperature bounds, and progress variable definition. The data are re-used from previous 
+        trainings with the same configuration, from the shared data storage, or from the Cantera cache if enabled.
+
+        :return: boundary matrices and oxidizer, fuel, and stoichiometric equilibrium properties.
+        :rtype: dict
+        """
+        cantera_data_key = GetCanteraDataKey(self.__Config)
+        if self.__cantera_data is not None and self.__cantera_data_key == cantera_data_key:
+            return self.__cantera_data
+        
+        cantera_data = None 
+        if self._shared_data is not None:
+            cantera_data = self._shared_data.GetArrays("cantera_" + cantera_data_key)
+        
+        cache_file = self.GetDataCacheDir() + "/cantera_" + cantera_data_key + ".pkl"
+        if cantera_data is None and self.__use_cantera_cache and os.path.isfile(cache_file):
+            if self._verbose > 0:
+                print("Loading cached boundary condition data from " + cache_file)
+            with open(cache_file, "rb") as fid:
+                cantera_data = pickle.load(fid)
+        
+        if cantera_data is None:
+            if self._verbose > 0:
+                print("Generating boundary condition data...")
+            cantera_data = ComputeCanteraBoundaryData(self.__Config)
+            if self.__use_cantera_cache:
+                os.makedirs(self.GetDataCacheDir(), exist_ok=True)
+
+                # Write to a temporary file first such that concurrent trainings never load incomplete data.
+                tmp_file = cache_file + "_tmp_%i" % os.getpid()
+                with open(tmp_file, "wb") as fid:
+                    pickle.dump(cantera_data, fid)
+                os.replace(tmp_file, cache_file)
+            if self._verbose > 0:
+                print("Done!")
+
+        if self._shared_data is not None:
+            self._shared_data.SetArrays("cantera_" + cantera_data_key, cantera_data)
+        self.__cantera_data = cantera_data 
+        self.__cantera_data_key = cantera_data_key
+        return self.__cantera_data
+    
     def __LocateUnbBoundaryNodes(self):
-        """Locate the reactant and product nodes of the boundary data.
+        """Locate the reactant and product nodes of the boundary data. The reactant species mass fractions, and 
+        therefore the reactant progress variable, are linear in mixture fraction between pure oxidizer and pure 
+        fuel. The reactant progress variable is therefore evaluated in closed form for all boundary nodes at once. 
+        The result is stored until the boundary data is reloaded.
 
         :return: reactant identification array.
         :rtype: np.ndarray[bool]
         """
-
-        # Initiate default reactant identifier array.
-        is_unb = np.ones(np.shape(self._X_boundary_norm)[0],dtype=bool)
+        if self.__is_unb is not None:
+            return self.__is_unb
         
-        fuel_string = self.__Config.GetFuelString()
-        oxidizer_string = self.__Config.GetOxidizerString()
+        cantera_data = self.GetCanteraBoundaryData()
+        pv_ox, pv_f = cantera_data["pv_ox"], cantera_data["pv_f"]
         
-        # Loop over boundary nodes and locate indices where the progress variable is greater than the reactant progress variable.
+        # Reactant progress variable at the mixture fraction of each boundary node.
         X_boundary = self.scaler_function_x.inverse_transform(self._X_boundary_norm)
-        for iz in range(np.shape(self._X_boundary_norm)[0]):
-            z = X_boundary[iz,self._controlling_vars.index(DefaultProperties.name_mixfrac)]
-            pv_boundary = X_boundary[iz,self._controlling_vars.index(DefaultProperties.name_pv)]
-            self.__Config.gas.set_mixture_fraction(min(max(z,0),1.0), fuel_string, oxidizer_string)
-            self.__Config.gas.TP=self.__Config.GetUnbTempBounds()[0], DefaultProperties.pressure
-            Y = self.__Config.gas.Y 
-            pv_unb = self.__Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=Y[:,np.newaxis])
-            
-            if pv_boundary > (pv_unb+1e-3*self._X_scale[self._controlling_vars.index(DefaultProperties.name_pv)]):
-                is_unb[iz] = False 
+        z_boundary = np.clip(X_boundary[:, self._controlling_vars.index(DefaultProperties.name_mixfrac)], 0.0, 1.0)
+        pv_boundary = X_boundary[:, self._controlling_vars.index(DefaultProperties.name_pv)]
+        pv_unb = pv_ox + z_boundary * (pv_f - pv_ox)
+
+        # Nodes where the progress variable exceeds the reactant progress variable are product nodes.
+        pv_tolerance = 1e-3*self._X_scale[self._controlling_vars.index(DefaultProperties.name_pv)]
+        self.__is_unb = np.invert(pv_boundary > (pv_unb + pv_tolerance))
 
-        return is_unb
+        return self.__is_unb
     
     def __SetBeta_pv_projection(self):
         """Get boundary penalty gradient projection array and target projected gradient for the progress variable preferential diffusion scalar.
@@ -444,51 +492,17 @@ class Train_FGM_PINN(PhysicsInformedTrainer):
     def __GenerateBoundaryMatrices(self):
         """Generate controlling variable matrices for boundary conditions, where predicted quantities are visualized onto during convergence.
         """
+        self.pv_unb, self.h_unb, self.z_unb, self.pv_b, self.h_b, self.z_b = self.GetCanteraBoundaryData()["boundary_matrices"]
+        return 
+    
+    def LoadSharedData(self, shared_data:SharedTrainData):
+        """Load the reference data and Cantera boundary condition data required for training into a shared data storage.
 
-        if self._verbose > 0:
-            print("Generating boundary data matrix...")
-        mixfrac_range = np.linspace(0, 1, self.__Config.GetNpMix())
-        T_range = np.linspace(self.__Config.GetUnbTempBounds()[0], self.__Config.GetUnbTempBounds()[1], self.__Config.GetNpTemp())
-        self.pv_unb = np.zeros([len(mixfrac_range), len(T_range)])
-        self.h_unb = np.zeros([len(mixfrac_range), len(T_range)])
-        self.z_unb = np.zeros([len(mixfrac_range), len(T_range)])
-        self.pv_b = np.zeros([len(mixfrac_range), len(T_range)])
-        self.h_b = np.zeros([len(mixfrac_range), len(T_range)])
-        self.z_b = np.zeros([len(mixfrac_range), len(T_range)])
-
-        gas_unb = ct.Solution(self.__Config.GetReactionMechanism())
-        gas_b = ct.Solution(self.__Config.GetReactionMechanism())
-        gas_unb.set_equivalence_ratio(1.0, self.__Config.GetFuelString(), self.__Config.GetOxidizerString())
-        gas_b.set_equivalence_ratio(1.0, self.__Config.GetFuelString(), self.__Config.GetOxidizerString())
-        gas_unb.TP = T_range[0], DefaultProperties.pressure
-        gas_b.TP = T_range[0], DefaultProperties.pressure
-        
-        for iZ, Z in enumerate(mixfrac_range):
-            gas_unb.set_mixture_fraction(Z, self.__Config.GetFuelString(), self.__Config.GetOxidizerString())
-            gas_b.set_mixture_fraction(Z, self.__Config.GetFuelString(), self.__Config.GetOxidizerString())
-            gas_unb.TP = T_range[0], DefaultProperties.pressure
-            gas_b.TP = T_range[-1], DefaultProperties.pressure
-            pv_unb = self.__Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas_unb.Y[:,np.newaxis])[0]
-            gas_unb.TP = T_range[-1], DefaultProperties.pressure
-            H_max = gas_unb.enthalpy_mass
-            gas_b.TP = T_range[0], DefaultProperties.pressure
-            gas_b.equilibrate("HP")
-            gas_b.HP = H_max, DefaultProperties.pressure 
-            T_range_b = np.linspace(self.__Config.GetUnbTempBounds()[0], gas_b.T, self.__Config.GetNpTemp())
-            pv_b = self.__Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas_b.Y[:,np.newaxis])[0]
-            for iT, T in enumerate(T_range):
-                gas_unb.TP = T, DefaultProperties.pressure
-                self.pv_unb[iZ, iT] = pv_unb
-                self.h_unb[iZ, iT] = gas_unb.enthalpy_mass
-                self.z_unb[iZ, iT] = Z 
-
-                gas_b.TP = T_range_b[iT], DefaultProperties.pressure
-                self.pv_b[iZ, iT] = pv_b
-                self.h_b[iZ, iT] = gas_b.enthalpy_mass
-                self.z_b[iZ, iT] = Z 
-        if self._verbose > 0:
-            print("Done!")
-        
+        :param shared_data: shared data storage.
+        :type shared_data: SharedTrainData
+        """
+        super().LoadSharedData(shared_data)
+        self.GetCanteraBoundaryData()
         return 
     
     def __PlotUnbData(self):
@@ -748,6 +762,16 @@ class TrainMLP_FGM(TrainMLP):
             self.__trainer_PINN.EnableBCLoss(enable_bc_loss)
         return 
     
+    def SetLambdaUpdate(self, update_every:int=10, reuse_gradients:bool=False):
+        if self.__kind_trainer == "physicsinformed":
+            self.__trainer_PINN.SetLambdaUpdate(update_every, reuse_gradients)
+        return 
+    
+    def SetCanteraCache(self, use_cache:bool=True):
+        if self.__kind_trainer == "physicsinformed":
+            self.__trainer_PINN.SetCanteraCache(use_cache)
+        return 
+    
     def CheckPINNVars(self):
         """Check if any of the variables in the MLP output group contain physics-informed variables and 
         initiate trainer object accordingly.
@@ -794,6 +818,259 @@ class TrainMLP_FGM(TrainMLP):
 
         return super().TrainPostprocessing()
     
+class TrainMLP_FGM_Groups:
+    """Class for training the MLPs of multiple FGM output groups concurrently. The flamelet data, input scaler, 
+    and boundary matrices are loaded and computed once and shared among the group trainers. Each output group is 
+    trained in a separate worker process, which receives a copy of the shared data from the parent process.
+    """
+
+    __Config:Config_FGM = None  # FlameletAI configuration describing the manifold.
+    __output_groups:list[int] = []  # MLP output group indices for which to train MLPs.
+    __group_trainers:list[TrainMLP_FGM] = []    # Trainer objects for each of the output groups.
+    __shared_data:SharedTrainData = None    # Reference data shared among the group trainers.
+    __n_workers:int = 1     # Number of output groups trained concurrently.
+    __test_scores:list[float] = []  # Test set scores of the trained MLPs.
+    __cost_parameters:list[float] = []  # Evaluation cost parameters of the trained MLPs.
+    __weights:list[list[np.ndarray]] = []   # Trained weights of the MLPs.
+    __biases:list[list[np.ndarray]] = []    # Trained biases of the MLPs.
+
+    def __init__(self, Config:Config_FGM, output_groups:list[int]=None):
+        """Define group trainers for the MLP output groups with default settings.
+
+        :param Config: Config_FGM object describing the flamelet data manifold.
+        :type Config: Config_FGM
+        :param output_groups: MLP output group indices to train for. All groups are trained if None, defaults to None
+        :type output_groups: list[int], optional
+        """
+        self.__Config = Config 
+        if output_groups is None:
+            output_groups = [iGroup for iGroup in range(self.__Config.GetNMLPOutputGroups())]
+        self.__output_groups = output_groups.copy()
+        self.__group_trainers = [TrainMLP_FGM(self.__Config, iGroup) for iGroup in self.__output_groups]
+        self.__n_workers = len(self.__output_groups)
+        return 
+    
+    def GetGroupTrainer(self, iGroup:int):
+        """Get the trainer object of an output group to adjust its settings.
+
+        :param iGroup: MLP output group index.
+        :type iGroup: int
+        :raises Exception: if the output group is not trained for.
+        :return: output group trainer.
+        :rtype: TrainMLP_FGM
+        """
+        if iGroup not in self.__output_groups:
+            raise Exception("MLP output group %i is not included in the group training." % iGroup)
+        return self.__group_trainers[self.__output_groups.index(iGroup)]
+    
+    def SetNWorkers(self, n_workers:int):
+        """Set the number of output groups trained concurrently.
+
+        :param n_workers: number of worker processes.
+        :type n_workers: int
+        :raises Exception: if the number of workers is lower than one.
+        """
+        if n_workers < 1:
+            raise Exception("Number of workers should be at least one.")
+        self.__n_workers = n_workers 
+        return 
+    
+    def PrepareSharedData(self):
+        """Load the reference data of all output groups into the shared data storage and compute the boundary 
+        matrices for the physics-informed groups.
+        """
+        self.__shared_data = SharedTrainData()
+        for group_trainer in self.__group_trainers:
+            group_trainer.LoadSharedData(self.__shared_data)
+        return 
+    
+    def CommenceTraining(self):
+        """Train the MLPs of all output groups. The shared data is prepared once before training. When training 
+        with multiple workers, the group trainers are sent to worker processes started with the "spawn" method, 
+        each pinned to a subset of the CPU cores, such that no TensorFlow state of the parent process is inherited. 
+        The trained weights, biases, and scores are copied back into the group trainers of the parent process. 
+        Scripts training with multiple workers should therefore guard their entry point with 
+        if __name__ == "__main__".
+        """
+
+        self.PrepareSharedData()
+
+        n_workers = min(self.__n_workers, len(self.__group_trainers))
+        if n_workers == 1:
+            results = [_TrainOutputGroup(group_trainer) for group_trainer in self.__group_trainers]
+        else:
+            with multiprocessing.get_context("spawn").Pool(n_workers, initializer=InitializeWorkerResources, initargs=(SplitCPUs(n_workers),)) as pool:
+                results = pool.map(_TrainOutputGroup, self.__group_trainers)
+            for group_trainer, r in zip(self.__group_trainers, results):
+                group_trainer.SetTrainResults(*r)
+        self.__test_scores = [r[0] for r in results]
+        self.__cost_parameters = [r[1] for r in results]
+        self.__weights = [r[2] for r in results]
+        self.__biases = [r[3] for r in results]
+        return 
+    
+    def GetTestScores(self):
+        """Get the test set scores of the trained MLPs of each output group.
+
+        :return: test set score per output group.
+        :rtype: list[float]
+        """
+        return self.__test_scores
+    
+    def GetCostParameters(self):
+        """Get the evaluation cost parameters of the trained MLPs of each output group.
+
+        :return: evaluation cost parameter per output group.
+        :rtype: list[float]
+        """
+        return self.__cost_parameters
+    
+    def GetWeights(self, iGroup:int):
+        """Get the trained weights of the MLP of an output group.
+
+        :param iGroup: MLP output group index.
+        :type iGroup: int
+        :raises Exception: if the output group is not trained for.
+        :return: list of weight arrays.
+        :rtype: list[np.ndarray]
+        """
+        if iGroup not in self.__output_groups:
+            raise Exception("MLP output group %i is not included in the group training." % iGroup)
+        return self.__weights[self.__output_groups.index(iGroup)]
+    
+    def GetBiases(self, iGroup:int):
+        """Get the trained biases of the MLP of an output group.
+
+        :param iGroup: MLP output group index.
+        :type iGroup: int
+        :raises Exception: if the output group is not trained for.
+        :return: list of bias arrays.
+        :rtype: list[np.ndarray]
+        """
+        if iGroup not in self.__output_groups:
+            raise Exception("MLP output group %i is not included in the group training." % iGroup)
+        return self.__biases[self.__output_groups.index(iGroup)]
+    
+def _TrainOutputGroup(group_trainer:TrainMLP_FGM):
+    """Train the MLP of a single output group of a multi-group training.
+
+    :param group_trainer: trainer of the output group.
+    :type group_trainer: TrainMLP_FGM
+    :return: test set score, evaluation cost parameter, weights, biases, and model index of the trained MLP.
+    :rtype: tuple
+    """
+    group_trainer.CommenceTraining()
+    return group_trainer.GetTestScore(), group_trainer.GetCostParameter(), group_trainer.GetWeights(), group_trainer.GetBiases(), group_trainer.current_iter
+
+def GetCanteraDataKey(Config:Config_FGM):
+    """Get the key under which the Cantera boundary condition data of a manifold configuration is cached. The key 
+    depends on the reaction mechanism, reactants, temperature bounds, boundary matrix resolution, progress variable 
+    definition, and Cantera version.
+
+    :param Config: FlameletAI configuration describing the manifold.
+    :type Config: Config_FGM
+    :return: cache key.
+    :rtype: str
+    """
+    mechanism = Config.GetReactionMechanism()
+    if os.path.isfile(mechanism):
+        file_stats = os.stat(mechanism)
+        mechanism = "%s:%i:%i" % (os.path.abspath(mechanism), file_stats.st_size, file_stats.st_mtime_ns)
+    cache_entries = [mechanism,\
+                     Config.GetFuelString(),\
+                     Config.GetOxidizerString(),\
+                     ",".join("%+.16e" % T for T in Config.GetUnbTempBounds()),\
+                     "%i,%i" % (Config.GetNpMix(), Config.GetNpTemp()),\
+                     ",".join(Config.GetProgressVariableSpecies()),\
+                     ",".join("%+.16e" % w for w in Config.GetProgressVariableWeights()),\
+                     "%+.16e" % DefaultProperties.pressure,\
+                     ct.__version__]
+    return hashlib.sha1("|".join(cache_entries).encode()).hexdigest()
+
+def ComputeCanteraBoundaryData(Config:Config_FGM):
+    """Compute the boundary condition data which require Cantera: the reactant and product boundary matrices, the 
+    progress variable of pure oxidizer and pure fuel, and the stoichiometric equilibrium condition.
+
+    :param Config: FlameletAI configuration describing the manifold.
+    :type Config: Config_FGM
+    :return: boundary matrices and oxidizer, fuel, and stoichiometric equilibrium properties.
+    :rtype: dict
+    """
+    fuel_string = Config.GetFuelString()
+    oxidizer_string = Config.GetOxidizerString()
+    gas = ct.Solution(Config.GetReactionMechanism())
+    gas.TP = Config.GetUnbTempBounds()[0], DefaultProperties.pressure
+
+    # Compute progress variable values for pure oxidizer and pure fuel.
+    gas.set_mixture_fraction(0.0, fuel_string, oxidizer_string)
+    pv_ox = Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas.Y[:, np.newaxis])[0]
+    gas.set_mixture_fraction(1.0, fuel_string, oxidizer_string)
+    pv_f = Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas.Y[:, np.newaxis])[0]
+
+    # Compute the progress variable and mixture fraction for the stochiometric equilibrium condition.
+    gas.set_equivalence_ratio(1.0, fuel_string, oxidizer_string)
+    Z_st = gas.mixture_fraction(fuel_string, oxidizer_string)
+    gas.equilibrate("TP")
+    pv_st = Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas.Y[:, np.newaxis])[0]
+    h_st = gas.enthalpy_mass
+
+    cantera_data = {"boundary_matrices":ComputeBoundaryMatrices(Config),\
+                    "pv_ox":pv_ox,\
+                    "pv_f":pv_f,\
+                    "Z_st":Z_st,\
+                    "pv_st":pv_st,\
+                    "h_st":h_st}
+    return cantera_data 
+
+def ComputeBoundaryMatrices(Config:Config_FGM):
+    """Compute the controlling variable matrices of the reactants and the products along mixture fraction and temperature.
+
+    :param Config: FlameletAI configuration describing the manifold.
+    :type Config: Config_FGM
+    :return: progress variable, total enthalpy, and mixture fraction matrices for reactants and products.
+    :rtype: tuple[np.ndarray]
+    """
+    mixfrac_range = np.linspace(0, 1, Config.GetNpMix())
+    T_range = np.linspace(Config.GetUnbTempBounds()[0], Config.GetUnbTempBounds()[1], Config.GetNpTemp())
+    pv_unb_matrix = np.zeros([len(mixfrac_range), len(T_range)])
+    h_unb_matrix = np.zeros([len(mixfrac_range), len(T_range)])
+    z_unb_matrix = np.zeros([len(mixfrac_range), len(T_range)])
+    pv_b_matrix = np.zeros([len(mixfrac_range), len(T_range)])
+    h_b_matrix = np.zeros([len(mixfrac_range), len(T_range)])
+    z_b_matrix = np.zeros([len(mixfrac_range), len(T_range)])
+
+    gas_unb = ct.Solution(Config.GetReactionMechanism())
+    gas_b = ct.Solution(Config.GetReactionMechanism())
+    gas_unb.set_equivalence_ratio(1.0, Config.GetFuelString(), Config.GetOxidizerString())
+    gas_b.set_equivalence_ratio(1.0, Config.GetFuelString(), Config.GetOxidizerString())
+    gas_unb.TP = T_range[0], DefaultProperties.pressure
+    gas_b.TP = T_range[0], DefaultProperties.pressure
+    
+    for iZ, Z in enumerate(mixfrac_range):
+        gas_unb.set_mixture_fraction(Z, Config.GetFuelString(), Config.GetOxidizerString())
+        gas_b.set_mixture_fraction(Z, Config.GetFuelString(), Config.GetOxidizerString())
+        gas_unb.TP = T_range[0], DefaultProperties.pressure
+        gas_b.TP = T_range[-1], DefaultProperties.pressure
+        pv_unb = Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas_unb.Y[:,np.newaxis])[0]
+        gas_unb.TP = T_range[-1], DefaultProperties.pressure
+        H_max = gas_unb.enthalpy_mass
+        gas_b.TP = T_range[0], DefaultProperties.pressure
+        gas_b.equilibrate("HP")
+        gas_b.HP = H_max, DefaultProperties.pressure 
+        T_range_b = np.linspace(Config.GetUnbTempBounds()[0], gas_b.T, Config.GetNpTemp())
+        pv_b = Config.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas_b.Y[:,np.newaxis])[0]
+        for iT, T in enumerate(T_range):
+            gas_unb.TP = T, DefaultProperties.pressure
+            pv_unb_matrix[iZ, iT] = pv_unb
+            h_unb_matrix[iZ, iT] = gas_unb.enthalpy_mass
+            z_unb_matrix[iZ, iT] = Z 
+
+            gas_b.TP = T_range_b[iT], DefaultProperties.pressure
+            pv_b_matrix[iZ, iT] = pv_b
+            h_b_matrix[iZ, iT] = gas_b.enthalpy_mass
+            z_b_matrix[iZ, iT] = Z
+    return pv_unb_matrix, h_unb_matrix, z_unb_matrix, pv_b_matrix, h_b_matrix, z_b_matrix
+
 def PlotFlameletData(Trainer:MLPTrainer, Config:Config_FGM, train_name:str):
     N_plot = 3
 
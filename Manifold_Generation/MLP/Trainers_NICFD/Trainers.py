@@ -46,9 +46,9 @@ import CoolProp as CoolP
 import CoolProp.CoolProp as CP 
 
 from Common.DataDrivenConfig import Config_NICFD
-from Common.CommonMethods import GetReferenceData
+from Common.CommonMethods import GetReferenceData, GetReferenceDataSplits
 from Common.Properties import DefaultSettings_NICFD, EntropicVars
-from Manifold_Generation.MLP.Trainer_Base import MLPTrainer, TensorFlowFit,PhysicsInformedTrainer,TrainMLP
+from Manifold_Generation.MLP.Trainer_Base import MLPTrainer, TensorFlowFit,PhysicsInformedTrainer,TrainMLP,SharedTrainData
 
 LabelPairing = {EntropicVars.s.name:r"Entropy $(s)[J/kg]$",\
                 EntropicVars.T.name:r"Temperature $(T)[K]$",\
@@ -161,6 +161,8 @@ class Train_Entropic_Derivatives(PhysicsInformedTrainer):
     __e_max:float
     __TD_vars:list[float]
 
+    _jit_compile_functions:list[str] = ["Train_Step", "ComputeEntropyGradients", "EntropicEOS", "TD_Evaluation"]
+
     def __init__(self):
         PhysicsInformedTrainer.__init__(self)
         self._mlp_output_file_name = "SU2_MLP_segregated"
@@ -184,10 +186,8 @@ class Train_Entropic_Derivatives(PhysicsInformedTrainer):
         self.__rho_scale = self._X_max[0] - self._X_min[0]
         self.__e_scale = self._X_max[1] - self._X_min[1]
         
-        _, TD_data_full = GetReferenceData(self._filedata_train+"_full.csv", self._controlling_vars, self.__TD_vars)
-        _, TD_data_train = GetReferenceData(self._filedata_train+"_train.csv", self._controlling_vars, self.__TD_vars)
-        _, TD_data_test = GetReferenceData(self._filedata_train+"_test.csv", self._controlling_vars, self.__TD_vars)
-        _, TD_data_val = GetReferenceData(self._filedata_train+"_val.csv", self._controlling_vars, self.__TD_vars)
+        (_, TD_data_full), (_, TD_data_train), (_, TD_data_test), (_, TD_data_val) = \
+            GetReferenceDataSplits(self._filedata_train, self._controlling_vars, self.__TD_vars, ["full","train","test","val"])
         self.__TD_max, self.__TD_min = np.max(TD_data_full,axis=0),np.min(TD_data_full,axis=0)
 
         self.__TD_data_norm_train = tf.constant((TD_data_train - self.__TD_min)/(self.__TD_max - self.__TD_min),dtype=self._dt)
@@ -412,6 +412,26 @@ class Train_Entropic_Derivatives(PhysicsInformedTrainer):
             grads_C2 = tape.gradient(C2_loss, self._trainable_hyperparams)
         return C2_loss, grads_C2
     
+    def SetStreamingMode(self, streaming:bool=True, chunk_size:int=2**16):
+        """Streaming train data is not supported, as the thermodynamic state data is paired with the train data in memory.
+
+        :raises Exception: if streaming mode is enabled.
+        """
+        if streaming:
+            raise Exception("Streaming mode is not supported for training entropic derivatives, load the train data into memory instead.")
+        return super().SetStreamingMode(streaming, chunk_size)
+    
+    def GetKernelSignatures(self, element_spec):
+        """Get the input signature of the train step kernel. The train step is evaluated on the density-energy and 
+        thermodynamic state data batches only, no boundary data or penalty values are passed.
+
+        :param element_spec: specification of the density-energy and thermodynamic state data batches.
+        :type element_spec: tuple
+        :return: input signature for each train step kernel name.
+        :rtype: dict
+        """
+        return {"Train_Step": list(element_spec)}
+    
     @tf.function
     def Train_Step(self, X_batch_norm:tf.constant, Y_batch_norm:tf.constant):
         
@@ -442,48 +462,37 @@ class Train_Entropic_Derivatives(PhysicsInformedTrainer):
         train_batches = tf.data.Dataset.from_tensor_slices((self._X_train_norm, self.__TD_data_norm_train)).batch(2**self._batch_expo)
         return train_batches
     
-    def ValidationLoss(self):
-        rhoe_val_norm = tf.constant(self._X_val_norm, self._dt)
-
-        S_pred_val, T_pred_val, P_pred_val, C2_pred_val = self.TD_Evaluation(rhoe_val_norm)
-
-        S_pred_val_norm = (S_pred_val - self.__TD_min[0])/(self.__TD_max[0] - self.__TD_min[0])
-        T_pred_val_norm = (T_pred_val - self.__TD_min[1])/(self.__TD_max[1] - self.__TD_min[1])
-        P_pred_val_norm = (P_pred_val - self.__TD_min[2])/(self.__TD_max[2] - self.__TD_min[2])
-        C2_pred_val_norm = (C2_pred_val - self.__TD_min[3])/(self.__TD_max[3] - self.__TD_min[3])
-
-        s_val_error = self.mean_square_error(y_true=self.__TD_data_norm_val[0], y_pred=S_pred_val_norm).numpy()
-        T_val_error = self.mean_square_error(y_true=self.__TD_data_norm_val[1], y_pred=T_pred_val_norm).numpy()
-        p_val_error = self.mean_square_error(y_true=self.__TD_data_norm_val[2], y_pred=P_pred_val_norm).numpy()
-        c2_val_error = self.mean_square_error(y_true=self.__TD_data_norm_val[3], y_pred=C2_pred_val_norm).numpy()
-        self.val_loss_history[0].append(s_val_error)
-        self.val_loss_history[1].append(T_val_error)
-        self.val_loss_history[2].append(p_val_error)
-        self.val_loss_history[3].append(c2_val_error)
-
-        return s_val_error, T_val_error, p_val_error, c2_val_error
+    def PrepareEvaluationData(self):
+        super().PrepareEvaluationData()
+        self.__TD_data_norm_val_sub = tf.gather(self.__TD_data_norm_val, self._idx_val_sub)
+        self.__TD_min_tf = tf.constant(self.__TD_min, dtype=self._dt)
+        self.__TD_scale_tf = tf.constant(self.__TD_max - self.__TD_min, dtype=self._dt)
+        return 
     
-    def TestLoss(self):
-        rhoe_test_norm = tf.constant(self._X_test_norm, self._dt)
-
-        S_pred_test, T_pred_test, P_pred_test, C2_pred_test = self.TD_Evaluation(rhoe_test_norm)
-
-        S_pred_test_norm = (S_pred_test - self.__TD_min[0])/(self.__TD_max[0] - self.__TD_min[0])
-        T_pred_test_norm = (T_pred_test - self.__TD_min[1])/(self.__TD_max[1] - self.__TD_min[1])
-        P_pred_test_norm = (P_pred_test - self.__TD_min[2])/(self.__TD_max[2] - self.__TD_min[2])
-        C2_pred_test_norm = (C2_pred_test - self.__TD_min[3])/(self.__TD_max[3] - self.__TD_min[3])
-
-        s_test_error = self.mean_square_error(y_true=self.__TD_data_norm_test[0], y_pred=S_pred_test_norm).numpy()
-        T_test_error = self.mean_square_error(y_true=self.__TD_data_norm_test[1], y_pred=T_pred_test_norm).numpy()
-        p_test_error = self.mean_square_error(y_true=self.__TD_data_norm_test[2], y_pred=P_pred_test_norm).numpy()
-        c2_test_error = self.mean_square_error(y_true=self.__TD_data_norm_test[3], y_pred=C2_pred_test_norm).numpy()
-
-        self.s_test_loss = s_test_error
-        self.T_test_loss = T_test_error
-        self.P_test_loss = p_test_error
-        self.C2_test_loss = c2_test_error
+    @tf.function
+    def ComputeTDError(self, rhoe_norm:tf.Tensor, TD_label_norm:tf.Tensor):
+        """Compute the mean squared prediction error of the normalized entropy, temperature, pressure, and squared speed of sound.
 
-        return s_test_error, T_test_error, p_test_error, c2_test_error
+        :param rhoe_norm: normalized density and energy tensor.
+        :type rhoe_norm: tf.Tensor
+        :param TD_label_norm: normalized reference thermodynamic state data.
+        :type TD_label_norm: tf.Tensor
+        :return: mean squared prediction error per thermodynamic state variable.
+        :rtype: tf.Tensor
+        """
+        TD_pred = tf.stack(self.TD_Evaluation(rhoe_norm), axis=1)
+        TD_pred_norm = (TD_pred - self.__TD_min_tf)/self.__TD_scale_tf
+        return tf.reduce_mean(tf.pow(TD_pred_norm - TD_label_norm, 2), axis=0)
+    
+    def EvaluateValidationLoss(self, full_validation:bool=True):
+        if full_validation:
+            return self.EvaluateInChunks(self.ComputeTDError, self._X_val_norm_tf, self.__TD_data_norm_val)
+        return self.EvaluateInChunks(self.ComputeTDError, self._X_val_sub_tf, self.__TD_data_norm_val_sub)
+    
+    def TestLoss(self):
+        test_error = self.EvaluateInChunks(self.ComputeTDError, self._X_test_norm_tf, self.__TD_data_norm_test)
+        self.s_test_loss, self.T_test_loss, self.P_test_loss, self.C2_test_loss = test_error
+        return self.s_test_loss, self.T_test_loss, self.P_test_loss, self.C2_test_loss
     
     def PrintEpochInfo(self, i_epoch, val_loss):
         if self._verbose > 0:
@@ -491,7 +500,7 @@ class Train_Entropic_Derivatives(PhysicsInformedTrainer):
             T_val_loss = val_loss[1]
             P_val_loss = val_loss[2]
             C2_val_loss = val_loss[3]
-            print("Epoch %i Validation loss Entropy: %.4e, Temperature: %.4e, Pressure: %.4e, Speed of sound: %.4e" % (i_epoch, S_val_loss, T_val_loss, P_val_loss, C2_val_loss))
+            print("Epoch %i Validation loss Entropy: %.4e, Temperature: %.4e, Pressure: %.4e, Speed of sound: %.4e, Function traces: %i" % (i_epoch, S_val_loss, T_val_loss, P_val_loss, C2_val_loss, self.trace_history[-1]))
 
         return
     
@@ -526,6 +535,7 @@ class Train_Entropic_Derivatives(PhysicsInformedTrainer):
         fid.write("Activation function index: %i\n" % self._i_activation_function)
         fid.write("Number of hidden layers: %i\n" % len(self._hidden_layers))
         fid.write("Architecture: " + " ".join(str(n) for n in self._hidden_layers) + "\n")
+        self.WriteTrainingPerformance(fid)
         fid.close()
 
         self.write_SU2_MLP(self._save_dir + "/Model_"+str(self._model_index)+"/"+self._mlp_output_file_name)
@@ -680,6 +690,9 @@ class Train_Entropic_PINN(PhysicsInformedTrainer):
     __custom_state_grid:bool = False
     __state_grid_ref:np.ndarray[float] = None 
 
+    _jit_compile_functions:list[str] = PhysicsInformedTrainer._jit_compile_functions + \
+        ["ComputeEntropyGradients", "EntropicEOS", "TD_Evaluation"]
+
     def __init__(self):
         PhysicsInformedTrainer.__init__(self)
         self.callback_every = 10
@@ -702,6 +715,7 @@ class Train_Entropic_PINN(PhysicsInformedTrainer):
         
         self._include_regularization = False
 
+        self._precision_policy = "float64"
         self._dt = tf.float64
         self._dt_np = np.float64
         return 
@@ -801,22 +815,13 @@ class Train_Entropic_PINN(PhysicsInformedTrainer):
     
     @tf.function
     def ComputeEntropyGradients(self, rhoe_norm:tf.Tensor):
-        with tf.GradientTape(watch_accessed_variables=False, persistent=True) as tape_2:
-            tape_2.watch(rhoe_norm)
-            with tf.GradientTape(watch_accessed_variables=False) as tape_1:
-                tape_1.watch(rhoe_norm)
-                s_norm = self._MLP_Evaluation(rhoe_norm)
-            ds_norm = tape_1.gradient(s_norm, rhoe_norm)
-            ds_norm_rho = tf.gather(ds_norm, indices=0,axis=1)
-            ds_norm_e = tf.gather(ds_norm, indices=1,axis=1)
-        d2s_norm_rho = tape_2.gradient(ds_norm_rho, rhoe_norm)
-        d2s_norm_e = tape_2.gradient(ds_norm_e, rhoe_norm)
-
-        dsdrho_e_norm = tf.gather(ds_norm, indices=0,axis=1)
-        dsde_rho_norm = tf.gather(ds_norm, indices=1,axis=1)
-        d2sde2_norm = tf.gather(d2s_norm_e, indices=1,axis=1)
-        d2sdrho2_norm = tf.gather(d2s_norm_rho,indices=0,axis=1)
-        d2sdedrho_norm = tf.gather(d2s_norm_e, indices=0, axis=1)
+        s_norm, ds_norm, d2s_norm = self.ComputeMLPDerivatives(rhoe_norm)
+
+        dsdrho_e_norm = ds_norm[:, 0, 0]
+        dsde_rho_norm = ds_norm[:, 0, 1]
+        d2sde2_norm = d2s_norm[:, 0, 1, 1]
+        d2sdrho2_norm = d2s_norm[:, 0, 0, 0]
+        d2sdedrho_norm = d2s_norm[:, 0, 1, 0]
 
         s_dim = self._s_scale * s_norm + self._s_offset
         dsdrho_e = tf.math.multiply((self._s_scale / self._rho_scale), dsdrho_e_norm)
@@ -890,7 +895,8 @@ class Train_Entropic_PINN(PhysicsInformedTrainer):
     
     def PrintEpochInfo(self, i_epoch, val_loss):
         if self._verbose > 0:
-            print(("Epoch %i Validation loss " % i_epoch) + ", ".join((" %s: %.4e" % (self._state_vars[iVar], val_loss[iVar])) for iVar in range(len(self._state_vars))))
+            print(("Epoch %i Validation loss " % i_epoch) + ", ".join((" %s: %.4e" % (self._state_vars[iVar], val_loss[iVar])) for iVar in range(len(self._state_vars))) + \
+                  (", Function traces: %i" % self.trace_history[-1]))
         return 
     
     def CustomCallback(self):
@@ -922,6 +928,7 @@ class Train_Entropic_PINN(PhysicsInformedTrainer):
         fid.write("Activation function index: %i\n" % self._i_activation_function)
         fid.write("Number of hidden layers: %i\n" % len(self._hidden_layers))
         fid.write("Architecture: " + " ".join(str(n) for n in self._hidden_layers) + "\n")
+        self.WriteTrainingPerformance(fid)
         fid.close()
 
         self.write_SU2_MLP(self._save_dir + "/Model_"+str(self._model_index)+"/"+self._mlp_output_file_name)
@@ -1142,6 +1149,11 @@ class TrainMLP_NICFD(TrainMLP):
         self.__trainer_PINN.SetVerbose(self.verbose)
         self.__trainer_PINN.SetFigFormat(self._fig_format)
         self.__trainer_PINN.SetScaler(self._scaler)
+
+        # The test score is obtained from the physics-informed trainer, such that only its training is scheduled.
+        self._trainer_direct.SetEpochCallback(None)
+        self.__trainer_PINN.SetEpochCallback(self._epoch_callback)
+        self._SynchronizeDataSettings(self.__trainer_PINN)
         return 
     
     def CommenceTraining(self):
@@ -1185,6 +1197,13 @@ class TrainMLP_NICFD(TrainMLP):
     def SetTrainStepType(self, train_step_type:str="Gauss-Seidel"):
         self.__trainer_PINN.SetTrainStepType(train_step_type)
         return 
+    def SetLambdaUpdate(self, update_every:int=10, reuse_gradients:bool=False):
+        self.__trainer_PINN.SetLambdaUpdate(update_every, reuse_gradients)
+        return 
+    def IsPruned(self):
+        return self._trainer_direct.IsPruned() or self.__trainer_PINN.IsPruned()
+    def GetProblemSettings(self):
+        return super().GetProblemSettings() + self.__trainer_PINN.GetProblemSettings()
     def GetWeights(self):
         return self.__trainer_PINN.GetWeights()
     def GetBiases(self):
@@ -1194,6 +1213,16 @@ class TrainMLP_NICFD(TrainMLP):
         return self.__trainer_PINN.GetScalerFunctionParams()
     def GetControlVars(self):
         return self.__trainer_PINN._controlling_vars
+    
+    def LoadSharedData(self, shared_data:SharedTrainData):
+        """Load the reference data required by the direct and physics-informed trainers into a shared data storage.
+
+        :param shared_data: shared data storage.
+        :type shared_data: SharedTrainData
+        """
+        super().LoadSharedData(shared_data)
+        self.__trainer_PINN.LoadSharedData(shared_data)
+        return 
     def GetTrainVars(self):
         return self.__trainer_PINN._train_vars
     
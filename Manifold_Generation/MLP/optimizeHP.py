@@ -26,24 +26,307 @@
 
 import pygad
 import os 
+import copy
 import pickle 
 import csv
+import fcntl
+import hashlib
+import queue
 import numpy as np
+import tensorflow as tf
 import matplotlib.pyplot as plt 
 from paretoset import paretoset
+import multiprocessing
 from multiprocessing import current_process
 from pymoo.indicators.gd_plus import GDPlus
 from pymoo.indicators.hv import HV
 
 from Common.Properties import DefaultProperties, DefaultSettings_NICFD
 from Common.Config_base import Config 
+from Common.CommonMethods import GetDataSetFingerprint, SplitCPUs, LimitProcessResources
 from Common.DataDrivenConfig import Config_FGM, Config_NICFD
-from Manifold_Generation.MLP.Trainer_Base import TrainMLP
+from Manifold_Generation.MLP.Trainer_Base import TrainMLP, SharedTrainData
 from Manifold_Generation.MLP.Trainers_NICFD.Trainers import TrainMLP_NICFD
 from Manifold_Generation.MLP.Trainers_FGM.Trainers import TrainMLP_FGM
 
 from Common.Properties import ActivationFunctionOptions
 
+class SuccessiveHalvingScheduler:
+    """Asynchronous successive halving scheduler for terminating unpromising trainings during hyper-parameter 
+    optimization. Candidates are trained in rungs of increasing epoch budgets. At each rung, the validation loss of 
+    the candidate is compared to those of all candidates which previously reached the rung, and training is only 
+    continued if the candidate is among the best fraction of candidates. Rung records are stored in a file, such that 
+    they are shared among worker processes and across generations.
+    """
+
+    __record_file:str = None        # File in which the validation losses at each rung are recorded.
+    __rungs:list[int] = []          # Epoch budgets at which candidates are evaluated.
+    __reduction_factor:int = 3      # Inverse of the fraction of candidates continuing at each rung.
+    __i_rung:int = 0                # Index of the next rung reached by the current candidate.
+
+    def __init__(self, record_file:str, max_epochs:int, min_epochs:int=10, reduction_factor:int=3):
+        """Class constructor
+
+        :param record_file: file in which validation losses at each rung are recorded.
+        :type record_file: str
+        :param max_epochs: maximum number of epochs for which candidates are trained.
+        :type max_epochs: int
+        :param min_epochs: epoch budget of the first rung, defaults to 10
+        :type min_epochs: int, optional
+        :param reduction_factor: inverse of the fraction of candidates continuing at each rung, defaults to 3
+        :type reduction_factor: int, optional
+        """
+        self.__record_file = record_file 
+        self.__reduction_factor = reduction_factor
+        self.__rungs = []
+        rung = min_epochs
+        while rung < max_epochs:
+            self.__rungs.append(rung)
+            rung *= reduction_factor
+        self.__i_rung = 0
+        return 
+    
+    def GetRungs(self):
+        """Get the epoch budgets at which candidates are evaluated.
+
+        :return: list of epoch budgets.
+        :rtype: list[int]
+        """
+        return self.__rungs
+    
+    def __call__(self, i_epoch:int, val_loss):
+        """Report the validation loss of the current candidate after an epoch.
+
+        :param i_epoch: epoch index.
+        :type i_epoch: int
+        :param val_loss: validation loss of each of the network outputs.
+        :return: whether training of the candidate should continue.
+        :rtype: bool
+        """
+        # Rungs passed in between validation loss evaluations are all evaluated with the current loss.
+        loss = np.max(val_loss)
+        if np.isnan(loss):
+            loss = np.inf
+        keep_training = True
+        while self.__i_rung < len(self.__rungs) and (i_epoch + 1) >= self.__rungs[self.__i_rung]:
+            keep_training = self.ReportLoss(self.__rungs[self.__i_rung], loss)
+            self.__i_rung += 1
+            if not keep_training:
+                break
+        return keep_training
+    
+    def ReportLoss(self, rung:int, loss:float):
+        """Record the validation loss of a candidate at a rung and decide whether the candidate is promoted to the 
+        next rung.
+
+        :param rung: epoch budget of the rung.
+        :type rung: int
+        :param loss: validation loss of the candidate.
+        :type loss: float
+        :return: whether the candidate is among the best candidates at the rung.
+        :rtype: bool
+        """
+        with open(self.__record_file, "a+") as fid:
+            fcntl.flock(fid, fcntl.LOCK_EX)
+            fid.seek(0)
+            rung_losses = [float(line.strip().split(",")[1]) for line in fid.readlines() if int(line.split(",")[0]) == rung]
+            fid.write("%i,%+.16e\n" % (rung, loss))
+            fcntl.flock(fid, fcntl.LOCK_UN)
+        rung_losses.append(loss)
+
+        # Candidates are promoted until sufficient candidates reached the rung to make a comparison.
+        n_promoted = len(rung_losses) // self.__reduction_factor
+        if n_promoted == 0:
+            return True 
+        return loss <= np.sort(rung_losses)[n_promoted - 1]
+    
+identity_activation_functions:list[str] = ["linear", "relu"]  # Activation functions for which identity layers preserve the network output.
+
+def ExpandNetwork(weights:list[np.ndarray], biases:list[np.ndarray], architecture:list[int], activation_function:str, noise_level:float=1e-2):
+    """Expand the weights and biases of a trained network to a deeper and/or wider hidden layer architecture 
+    (Net2Net). Additional hidden layers are inserted as identity layers after the last hidden layer. Hidden layers 
+    are widened by replicating randomly selected neurons, of which the outgoing weights are divided by the number of 
+    replicas such that the network output is preserved. Identity layers only preserve the network output for 
+    activation functions which are idempotent on their range, such that networks with other activation functions 
+    are only widened.
+
+    :param weights: trained weights.
+    :type weights: list[np.ndarray]
+    :param biases: trained biases.
+    :type biases: list[np.ndarray]
+    :param architecture: target hidden layer architecture.
+    :type architecture: list[int]
+    :param activation_function: hidden layer activation function of the network.
+    :type activation_function: str
+    :param noise_level: relative magnitude of the noise added to replicated neurons to break symmetry, defaults to 1e-2
+    :type noise_level: float, optional
+    :raises Exception: if the target architecture is not an extension of the trained architecture.
+    :return: expanded weights and biases.
+    :rtype: list[np.ndarray], list[np.ndarray]
+    """
+    architecture_in = [np.shape(w)[1] for w in weights[:-1]]
+    if not IsNetworkExtension(architecture_in, architecture, activation_function):
+        raise Exception("Target architecture should be a width extension, or a depth extension for %s activation functions, of the trained architecture." % " and ".join(identity_activation_functions))
+    weights_out = [np.array(w) for w in weights]
+    biases_out = [np.array(b) for b in biases]
+
+    # Insert identity layers before the output layer.
+    for _ in range(len(architecture) - len(architecture_in)):
+        NN_last = np.shape(weights_out[-1])[0]
+        weights_out.insert(-1, np.eye(NN_last))
+        biases_out.insert(-1, np.zeros(NN_last))
+    
+    # Widen hidden layers by replicating neurons.
+    for iLayer, NN_target in enumerate(architecture):
+        NN = np.shape(weights_out[iLayer])[1]
+        idx_neurons = np.hstack((np.arange(NN), np.random.randint(0, NN, int(NN_target) - NN)))
+        n_replicas = np.bincount(idx_neurons, minlength=NN)[idx_neurons]
+        noise = noise_level * np.std(weights_out[iLayer]) * np.random.randn(np.shape(weights_out[iLayer])[0], int(NN_target) - NN)
+        weights_out[iLayer] = weights_out[iLayer][:, idx_neurons]
+        weights_out[iLayer][:, NN:] += noise
+        biases_out[iLayer] = biases_out[iLayer][idx_neurons]
+        weights_out[iLayer+1] = weights_out[iLayer+1][idx_neurons, :] / n_replicas[:, np.newaxis]
+    return weights_out, biases_out
+
+def IsNetworkExtension(architecture_in:list[int], architecture:list[int], activation_function:str):
+    """Check whether a hidden layer architecture can be obtained from another by inserting identity layers after 
+    the last hidden layer and widening hidden layers, without changing the network output. Identity layers are 
+    only inserted for activation functions which are idempotent on their range.
+
+    :param architecture_in: trained hidden layer architecture.
+    :type architecture_in: list[int]
+    :param architecture: target hidden layer architecture.
+    :type architecture: list[int]
+    :param activation_function: hidden layer activation function of the network.
+    :type activation_function: str
+    :return: whether the target architecture is an extension of the trained architecture.
+    :rtype: bool
+    """
+    if len(architecture_in) == 0 or len(architecture) < len(architecture_in):
+        return False 
+    if len(architecture) > len(architecture_in) and activation_function not in identity_activation_functions:
+        return False 
+    if any(NN < NN_in for NN_in, NN in zip(architecture_in, architecture)):
+        return False 
+    return all(NN >= architecture_in[-1] for NN in architecture[len(architecture_in):])
+
+def _InitializeHPOWorker(optimizer, worker_idx:int):
+    """Initialize a worker process of the persistent hyper-parameter optimization worker pool. The CPU affinity and 
+    thread pools are configured before any TensorFlow operation is run in the worker.
+
+    :param optimizer: hyper-parameter optimizer of which the fitness function is evaluated.
+    :type optimizer: MLPOptimizer
+    :param worker_idx: worker index.
+    :type worker_idx: int
+    :return: data storage shared among all individuals evaluated by the worker.
+    :rtype: SharedTrainData
+    """
+    optimizer.LimitWorkerResources(worker_idx)
+    return SharedTrainData()
+
+def _EvaluateIndividuals(optimizer, worker_idx:int, task_queue, result_queue):
+    """Worker process loop of the persistent hyper-parameter optimization worker pool. The worker is initialized 
+    once, after which the training data is read once and shared among all individuals evaluated by the worker.
+
+    :param optimizer: hyper-parameter optimizer of which the fitness function is evaluated.
+    :type optimizer: MLPOptimizer
+    :param worker_idx: worker index.
+    :type worker_idx: int
+    """
+    shared_data = _InitializeHPOWorker(optimizer, worker_idx)
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break 
+        idx_individual, x = task
+        try:
+            result_queue.put((idx_individual, optimizer.fitnessFunction(x, worker_idx=worker_idx, shared_data=shared_data), None))
+        except Exception as e:
+            result_queue.put((idx_individual, None, "%s: %s" % (type(e).__name__, str(e))))
+    return 
+
+class HPOWorkerPool:
+    """Pool of persistent worker processes evaluating the fitness of individuals during hyper-parameter optimization. 
+    Worker processes are started once per optimization, such that the training data is read once per worker rather 
+    than once per individual. Individuals are dispatched to the workers over a queue. Each individual is trained 
+    by a new trainer, compiled graphs are not re-used across individuals.
+    """
+
+    __workers:list[multiprocessing.Process] = []    # Worker processes.
+    __task_queue:multiprocessing.Queue = None       # Queue of individuals to be evaluated.
+    __result_queue:multiprocessing.Queue = None     # Queue of evaluated fitness values.
+    __poll_interval:float = 10.0    # Time in seconds between worker liveness checks while waiting for results.
+
+    def __init__(self, optimizer, n_workers:int):
+        """Start the worker processes. Workers are started with the "spawn" method, such that no TensorFlow state 
+        of the parent process is inherited, and receive a copy of the optimizer. Each worker pins itself to the CPU 
+        subset assigned to it by the optimizer. Scripts using the pool should therefore guard their entry point with 
+        if __name__ == "__main__".
+
+        :param optimizer: hyper-parameter optimizer of which the fitness function is evaluated.
+        :type optimizer: MLPOptimizer
+        :param n_workers: number of worker processes.
+        :type n_workers: int
+        """
+        context = multiprocessing.get_context("spawn")
+        self.__task_queue = context.Queue()
+        self.__result_queue = context.Queue()
+
+        self.__workers = []
+        for iWorker in range(n_workers):
+            worker = context.Process(target=_EvaluateIndividuals, args=(optimizer, iWorker, self.__task_queue, self.__result_queue), daemon=True)
+            worker.start()
+            self.__workers.append(worker)
+        return 
+    
+    def Evaluate(self, population:np.ndarray):
+        """Evaluate the fitness of a set of individuals.
+
+        :param population: genes of the individuals.
+        :type population: np.ndarray
+        :raises Exception: if the evaluation of any of the individuals failed or if a worker process died.
+        :return: fitness of each individual.
+        :rtype: list
+        """
+        for idx_individual, x in enumerate(population):
+            self.__task_queue.put((idx_individual, x))
+        fitness = [None]*len(population)
+        for _ in range(len(population)):
+            idx_individual, fitness_individual, error = self.__GetResult()
+            if error is not None:
+                raise Exception("Evaluation of individual %i failed with %s" % (idx_individual, error))
+            fitness[idx_individual] = fitness_individual
+        return fitness
+    
+    def __GetResult(self):
+        """Wait for the next evaluated individual. The worker processes are checked periodically, such that the 
+        optimization does not wait indefinitely for the result of a worker which was killed.
+
+        :raises Exception: if any of the worker processes died.
+        :return: individual index, fitness, and error message.
+        :rtype: tuple
+        """
+        while True:
+            try:
+                return self.__result_queue.get(timeout=self.__poll_interval)
+            except queue.Empty:
+                for iWorker, worker in enumerate(self.__workers):
+                    if not worker.is_alive():
+                        raise Exception("HPO worker %i died with exit code %s" % (iWorker, str(worker.exitcode)))
+    
+    def Stop(self):
+        """Terminate the worker processes.
+        """
+        for _ in self.__workers:
+            self.__task_queue.put(None)
+        for worker in self.__workers:
+            worker.join()
+        self.__workers = []
+        return 
+
+_active_worker_pool:HPOWorkerPool = None    # Worker pool of the running optimization, kept outside the optimizer such that it is not pickled with it.
+_worker_threads:int = None  # Number of threads of the current worker process, assigned once per process.
+
 class MLPOptimizer:
     """Class for hyper-parameter optimization of entropic fluid model multi-layer perceptrons.
     """
@@ -51,8 +334,17 @@ class MLPOptimizer:
     _Config:Config = None     # EntropicAI configuration.
     __optimizer:pygad.GA = None         # PyGaD optimization instance.
     _n_workers:int = 1                 # Number of CPU cores used for distributing the work per generation.
+    _cpu_subsets:list[list[int]] = None # CPU cores assigned to each worker.
     _n_epochs:int=DefaultProperties.N_epochs
+    _use_data_cache:bool = False       # Re-use normalized train data across individuals.
+    _use_fitness_cache:bool = False    # Re-use the test score and cost of previously trained hyper-parameter sets.
+    _warm_start:bool = False           # Initialize individuals from the nearest previously trained network.
+    _persistent_workers:bool = False   # Evaluate individuals on persistent worker processes with preloaded data.
 
+    # Successive halving scheduler settings.
+    _use_scheduler:bool = False         # Terminate unpromising trainings early.
+    _scheduler_min_epochs:int = 10      # Epoch budget of the first scheduler rung.
+    _scheduler_reduction_factor:int = 3 # Inverse of the fraction of candidates continuing at each rung.
 
     # Hyper-parameter default settings and bounds.
 
@@ -142,6 +434,101 @@ class MLPOptimizer:
         if n_workers < 1:
             raise Exception("Number of workers should be at least one.")
         self._n_workers = n_workers
+        if self._n_workers > 1:
+            self._cpu_subsets = SplitCPUs(self._n_workers)
+        else:
+            self._cpu_subsets = None
+        return 
+    
+    def LimitWorkerResources(self, worker_idx:int=None):
+        """Pin the current worker process to its CPU subset and limit the OpenMP, BLAS, and TensorFlow thread pools 
+        to the number of cores in the subset, such that concurrent workers do not compete for the same cores. The 
+        resources are configured once per process and should be limited before the worker runs any TensorFlow 
+        operation, subsequent calls return the number of threads assigned before.
+
+        :param worker_idx: worker index. Derived from the process identity if None, defaults to None
+        :type worker_idx: int, optional
+        :return: number of threads available to the worker, None if the workers are not budgeted.
+        :rtype: int
+        """
+        global _worker_threads
+        if self._cpu_subsets is None:
+            return None 
+        if _worker_threads is None:
+            if worker_idx is None:
+                identity = current_process()._identity
+                worker_idx = (identity[0] - 1) if len(identity) > 0 else 0
+            _worker_threads = LimitProcessResources(self._cpu_subsets[worker_idx % len(self._cpu_subsets)])
+            try:
+                tf.config.threading.set_intra_op_parallelism_threads(_worker_threads)
+                tf.config.threading.set_inter_op_parallelism_threads(1)
+            except RuntimeError:
+                raise Exception("HPO worker resources should be limited before TensorFlow is initialized.")
+        return _worker_threads
+    
+    def SetDataCache(self, use_cache:bool=True):
+        """Re-use the normalized train, test, and validation data across the evaluated individuals instead of reading
+        and normalizing the data files for every individual.
+
+        :param use_cache: use cached normalized data, defaults to True
+        :type use_cache: bool, optional
+        """
+        self._use_data_cache = use_cache
+        return 
+    
+    def SetFitnessCache(self, use_cache:bool=True):
+        """Store the test score and cost parameter of every trained hyper-parameter set, such that individuals with 
+        hyper-parameters which were evaluated before, also before restarting the optimization, are not trained 
+        again. The cache is cleared when a new optimization is started.
+
+        :param use_cache: re-use the performance of previously trained hyper-parameter sets, defaults to True
+        :type use_cache: bool, optional
+        """
+        self._use_fitness_cache = use_cache
+        return 
+    
+    def SetPersistentWorkers(self, persistent_workers:bool=True):
+        """Evaluate individuals on a pool of persistent worker processes, started once per optimization, which 
+        read the training data once and pin themselves to a subset of the CPU cores.
+
+        :param persistent_workers: use persistent worker processes, defaults to True
+        :type persistent_workers: bool, optional
+        """
+        self._persistent_workers = persistent_workers
+        return 
+    
+    def SetWarmStart(self, warm_start:bool=True):
+        """Initialize the weights and biases of individuals from the nearest previously trained network with the 
+        same activation function, if the architecture of the individual equals or extends that of the trained network. 
+        Deeper architectures are only warm-started for linear and ReLU activation functions, individuals without a 
+        compatible network are initialized randomly.
+
+        :param warm_start: initialize individuals from previously trained networks, defaults to True
+        :type warm_start: bool, optional
+        """
+        self._warm_start = warm_start
+        return 
+    
+    def SetSuccessiveHalving(self, use_scheduler:bool=True, min_epochs:int=10, reduction_factor:int=3):
+        """Train candidates in rungs of increasing epoch budgets and terminate the training of candidates which are 
+        not among the best fraction of candidates at each rung.
+
+        :param use_scheduler: terminate unpromising trainings early, defaults to True
+        :type use_scheduler: bool, optional
+        :param min_epochs: epoch budget of the first rung, defaults to 10
+        :type min_epochs: int, optional
+        :param reduction_factor: inverse of the fraction of candidates continuing at each rung, defaults to 3
+        :type reduction_factor: int, optional
+        :raises Exception: if the epoch budget of the first rung is lower than one.
+        :raises Exception: if the reduction factor is lower than two.
+        """
+        if min_epochs < 1:
+            raise Exception("Epoch budget of the first rung should be at least one.")
+        if reduction_factor < 2:
+            raise Exception("Reduction factor should be at least two.")
+        self._use_scheduler = use_scheduler
+        self._scheduler_min_epochs = min_epochs
+        self._scheduler_reduction_factor = reduction_factor
         return 
     
     def SetNEpochs(self, n_epochs:int=DefaultProperties.N_epochs):
@@ -478,7 +865,14 @@ class MLPOptimizer:
         self.opt_history_filepath = self.save_dir + "/history_opt_"+self._history_extension+".csv"
         return 
     
+    def _get_scheduler_record_file(self):
+        return os.path.splitext(self.opt_history_filepath)[0] + "_rungs.csv"
+    
     def _set_history_header(self):
+        if not self.__restart_optim and os.path.isfile(self._get_scheduler_record_file()):
+            os.remove(self._get_scheduler_record_file())
+        if not self.__restart_optim and os.path.isfile(self._get_fitness_cache_file()):
+            os.remove(self._get_fitness_cache_file())
         if not self.__restart_optim:
             with open(self.opt_history_filepath, "w+") as fid:
                 if self.__run_multiobj:
@@ -553,30 +947,63 @@ class MLPOptimizer:
             parent_selector = "nsga2"
         else:
             parent_selector = "sss"
+        if self._persistent_workers:
+            # The complete population is evaluated at once by the worker pool.
+            fitness_func = self.fitnessBatchGA
+            fitness_batch_size = popsize
+            parallel_processing = None 
+        else:
+            fitness_func = self.fitnessGA
+            fitness_batch_size = None 
+            parallel_processing = ["process",self._n_workers]
         if self.__restart_optim:
             self.__optimizer = self.LoadOptimizer()
-            self.__optimizer.parallel_processing=["process",self._n_workers]
+            self.__optimizer.fitness_func = fitness_func
+            self.__optimizer.fitness_batch_size = fitness_batch_size
+            self.__optimizer.parallel_processing=parallel_processing
         else:
             # Initiate pyGAD genetic algorithm
             self.__optimizer = pygad.GA(num_generations=n_gens,\
-                        fitness_func=self.fitnessGA,\
+                        fitness_func=fitness_func,\
+                        fitness_batch_size=fitness_batch_size,\
                         gene_type=gene_type,\
                         num_genes=n_genes,\
                         gene_space=bounds,\
                         sol_per_pop=popsize,\
                         initial_population=initial_pop,\
                         num_parents_mating=num_parents_mating,\
-                        parallel_processing=["process",self._n_workers],\
+                        parallel_processing=parallel_processing,\
                         random_seed=1,\
                         parent_selection_type=parent_selector,\
                         on_generation=self.saveGenerationInfo)
             
 
-        self.__optimizer.run()
+ 
+        if self._persistent_workers:
+            self.__RunWorkerPool()
+        else:
+            self.__optimizer.run()
 
         self.__x_optim, _, _ = self.__optimizer.best_solution()
         return 
     
+    def __RunWorkerPool(self):
+        """Run the genetic algorithm while evaluating individuals on the persistent worker pool.
+        """
+        global _active_worker_pool
+
+        # Workers receive a copy of the optimizer without the genetic algorithm instance, which is not needed for 
+        # evaluating individuals.
+        worker_optimizer = copy.copy(self)
+        worker_optimizer.__optimizer = None 
+        _active_worker_pool = HPOWorkerPool(worker_optimizer, self._n_workers)
+        try:
+            self.__optimizer.run()
+        finally:
+            _active_worker_pool.Stop()
+            _active_worker_pool = None 
+        return 
+    
     def __prepareGeneType(self):
         gene_type = []
         if self._optimizeLR:
@@ -629,51 +1056,197 @@ class MLPOptimizer:
         ga_instance = pygad.load(self.save_dir+"/optimizer_instance_"+self._history_extension)
         return ga_instance
     
-    def _translateGene(self, x:np.ndarray[float], Evaluator:TrainMLP):
-        """Translate gene to hyper-parameters
+    def _decodeGene(self, x:np.ndarray[float]):
+        """Decode gene into the hyper-parameters of the MLP. Hyper-parameters which are not optimized are set to 
+        their default values.
 
         :param x: gene as passed from genetic algorithm.
         :type x: np.ndarray[float]
-        :param Evaluator: MLP evaluation class instance.
-        :type Evaluator: TrainMLP
+        :return: initial learning rate exponent, learning rate decay parameter, batch size exponent, activation 
+        function name, and hidden layer architecture.
+        :rtype: dict
         """
 
-        # Set default hyper-parameters.
-        Evaluator.SetBatchExpo(self._batch_expo)
-        Evaluator.SetAlphaExpo(self._alpha_expo)
-        Evaluator.SetLRDecay(self._lr_decay)
-        Evaluator.SetHiddenLayers(self._architecture)
-        Evaluator.SetActivationFunction(self._activation_function)
+        # Default hyper-parameters.
+        hyper_parameters = {"alpha_expo":self._alpha_expo, \
+                            "lr_decay":self._lr_decay, \
+                            "batch_expo":self._batch_expo, \
+                            "activation_function":self._activation_function, \
+                            "architecture":self._architecture}
 
-        # Set hyper-parameter according to gene.
+        # Hyper-parameters according to gene.
         idx_x = 0
         if self._optimizeLR:
-            alpha_expo = x[idx_x]
-            Evaluator.SetAlphaExpo(alpha_expo)
+            hyper_parameters["alpha_expo"] = x[idx_x]
             idx_x += 1 
-            lr_decay = x[idx_x]
-            Evaluator.SetLRDecay(lr_decay)
+            hyper_parameters["lr_decay"] = x[idx_x]
             idx_x += 1 
         if self._optimizebatch:
-            batch_expo = int(x[idx_x])
-            Evaluator.SetBatchExpo(batch_expo)
+            hyper_parameters["batch_expo"] = int(x[idx_x])
             idx_x += 1 
         if self._optimizephi:
-            phi = self.__activation_function_options[int(x[idx_x])]
-            Evaluator.SetActivationFunction(phi)
+            hyper_parameters["activation_function"] = self.__activation_function_options[int(x[idx_x])]
             idx_x += 1
         if self._optimizeNN:
-            architecture = [int(x[idx_x])]
             architecture = []
             for i in range(idx_x, idx_x + self.NLayers_min):
                 architecture.append(x[i])
             for i in range(idx_x + self.NLayers_min, len(x)-1, 2):
                 if x[i] > 0:
                     architecture.append(x[i+1])
-            Evaluator.SetHiddenLayers(architecture)
+            hyper_parameters["architecture"] = architecture
             idx_x += 1 
 
+        return hyper_parameters
+    
+    def _translateGene(self, x:np.ndarray[float], Evaluator:TrainMLP):
+        """Translate gene to hyper-parameters
+
+        :param x: gene as passed from genetic algorithm.
+        :type x: np.ndarray[float]
+        :param Evaluator: MLP evaluation class instance.
+        :type Evaluator: TrainMLP
+        """
+        hyper_parameters = self._decodeGene(x)
+        Evaluator.SetBatchExpo(hyper_parameters["batch_expo"])
+        Evaluator.SetAlphaExpo(hyper_parameters["alpha_expo"])
+        Evaluator.SetLRDecay(hyper_parameters["lr_decay"])
+        Evaluator.SetHiddenLayers(hyper_parameters["architecture"])
+        Evaluator.SetActivationFunction(hyper_parameters["activation_function"])
         return
+    
+    def _get_fitness_cache_file(self):
+        return os.path.splitext(self.opt_history_filepath)[0] + "_fitness_cache.csv"
+    
+    def _get_fitness_cache_key(self, x:np.ndarray[float], MLP_evaluator:TrainMLP=None):
+        """Get the key under which the performance of an individual is cached. The key depends on the decoded 
+        hyper-parameters, the training settings, the data set files, the configuration settings which define 
+        the training problem, and the settings of the trainer evaluating the individual.
+
+        :param x: gene as passed from genetic algorithm.
+        :type x: np.ndarray[float]
+        :param MLP_evaluator: trainer evaluating the individual, a new one is prepared if None, defaults to None
+        :type MLP_evaluator: TrainMLP, optional
+        :return: fitness cache key.
+        :rtype: str
+        """
+        if MLP_evaluator is None:
+            MLP_evaluator = self._prepare_evaluator()
+        hyper_parameters = self._decodeGene(x)
+        cache_entries = [type(self).__name__,\
+                         "%+.16e" % hyper_parameters["alpha_expo"],\
+                         "%+.16e" % hyper_parameters["lr_decay"],\
+                         "%i" % hyper_parameters["batch_expo"],\
+                         hyper_parameters["activation_function"],\
+                         " ".join("%i" % n for n in hyper_parameters["architecture"]),\
+                         "%i" % self._n_epochs,\
+                         "%i,%i,%i" % (self._use_scheduler, self._scheduler_min_epochs, self._scheduler_reduction_factor),\
+                         "%i" % self._warm_start,\
+                         GetDataSetFingerprint(self._Config.GetOutputDir()+"/"+self._Config.GetConcatenationFileHeader())]
+        cache_entries += self._get_problem_cache_entries()
+        cache_entries += MLP_evaluator.GetProblemSettings()
+        return hashlib.sha1("|".join(cache_entries).encode()).hexdigest()
+    
+    def _get_problem_cache_entries(self):
+        """Get the configuration settings which define the training problem, to include in the fitness cache key.
+
+        :return: training problem settings.
+        :rtype: list[str]
+        """
+        return [" ".join(self._Config.GetControllingVariables()),\
+                "%+.16e,%+.16e" % (self._Config.GetTrainFraction(), self._Config.GetTestFraction())]
+    
+    def _read_fitness_cache(self, cache_key:str):
+        """Look up the performance of a previously trained individual.
+
+        :param cache_key: fitness cache key of the individual.
+        :type cache_key: str
+        :return: test score and cost parameter, or None if the individual was not trained before.
+        :rtype: tuple[float, float]
+        """
+        if not os.path.isfile(self._get_fitness_cache_file()):
+            return None 
+        with open(self._get_fitness_cache_file(), "r") as fid:
+            fcntl.flock(fid, fcntl.LOCK_SH)
+            lines = fid.readlines()
+            fcntl.flock(fid, fcntl.LOCK_UN)
+        for line in lines:
+            entries = line.strip().split(",")
+            if entries[0] == cache_key:
+                return float(entries[1]), float(entries[2])
+        return None 
+    
+    def _get_model_index_file(self):
+        return os.path.splitext(self.opt_history_filepath)[0] + "_models.csv"
+    
+    def _add_to_model_index(self, x:np.ndarray[float], MLP_evaluator:TrainMLP):
+        """Add a trained individual to the index of networks from which individuals can be warm-started.
+
+        :param x: gene as passed from genetic algorithm.
+        :type x: np.ndarray[float]
+        :param MLP_evaluator: MLP evaluation class instance after training.
+        :type MLP_evaluator: TrainMLP
+        """
+        hyper_parameters = self._decodeGene(x)
+        model_dir = os.path.abspath(MLP_evaluator.GetModelDir())
+        if np.isnan(MLP_evaluator.GetTestScore()) or not os.path.isfile(model_dir + "/W_0.npy"):
+            return 
+        with open(self._get_model_index_file(), "a+") as fid:
+            fcntl.flock(fid, fcntl.LOCK_EX)
+            fid.write("%s,%s,%s,%+.16e\n" % (model_dir, hyper_parameters["activation_function"], \
+                                             " ".join("%i" % n for n in hyper_parameters["architecture"]), MLP_evaluator.GetTestScore()))
+            fcntl.flock(fid, fcntl.LOCK_UN)
+        return 
+    
+    def _warm_start_evaluator(self, x:np.ndarray[float], MLP_evaluator:TrainMLP):
+        """Initialize the weights and biases of an individual from the nearest previously trained network. The 
+        nearest network is the compatible network with the smallest difference in cost parameter, and the lowest 
+        test score among networks of equal cost.
+
+        :param x: gene as passed from genetic algorithm.
+        :type x: np.ndarray[float]
+        :param MLP_evaluator: MLP evaluation class instance.
+        :type MLP_evaluator: TrainMLP
+        """
+        if not os.path.isfile(self._get_model_index_file()):
+            return 
+        with open(self._get_model_index_file(), "r") as fid:
+            fcntl.flock(fid, fcntl.LOCK_SH)
+            lines = fid.readlines()
+            fcntl.flock(fid, fcntl.LOCK_UN)
+        
+        hyper_parameters = self._decodeGene(x)
+        architecture = [int(n) for n in hyper_parameters["architecture"]]
+        NN = [len(MLP_evaluator.GetControlVars())] + architecture + [len(MLP_evaluator.GetTrainVars())]
+        cost_parameter = sum(NN[i]*NN[i+1] for i in range(len(NN)-1))
+
+        nearest_model, nearest_architecture, nearest_distance = None, None, None
+        for line in lines:
+            model_dir, activation_function, architecture_model, test_score = line.strip().split(",")
+            architecture_model = [int(n) for n in architecture_model.split()]
+            if activation_function != hyper_parameters["activation_function"] or not IsNetworkExtension(architecture_model, architecture, activation_function):
+                continue 
+            NN_model = [NN[0]] + architecture_model + [NN[-1]]
+            distance = (cost_parameter - sum(NN_model[i]*NN_model[i+1] for i in range(len(NN_model)-1)), float(test_score))
+            if nearest_distance is None or distance < nearest_distance:
+                nearest_model, nearest_architecture, nearest_distance = model_dir, architecture_model, distance
+        if nearest_model is None:
+            return 
+        
+        weights = [np.load(nearest_model + "/W_%i.npy" % i) for i in range(len(nearest_architecture)+1)]
+        biases = [np.load(nearest_model + "/b_%i.npy" % i) for i in range(len(nearest_architecture)+1)]
+        if np.shape(weights[0])[0] != NN[0] or np.shape(weights[-1])[1] != NN[-1]:
+            return 
+        weights, biases = ExpandNetwork(weights, biases, architecture, hyper_parameters["activation_function"])
+        MLP_evaluator.SetWeightsBiases(weights, biases)
+        return 
+    
+    def _write_fitness_cache(self, cache_key:str, test_score:float, cost_parameter:float):
+        with open(self._get_fitness_cache_file(), "a+") as fid:
+            fcntl.flock(fid, fcntl.LOCK_EX)
+            fid.write("%s,%+.16e,%+.16e\n" % (cache_key, test_score, cost_parameter))
+            fcntl.flock(fid, fcntl.LOCK_UN)
+        return 
 
     def __GenerateInitialPopulation(self, popsize:int):
         """Generate the initial population for the GA optimization.
@@ -767,8 +1340,14 @@ class MLPOptimizer:
         return architecture_array
     
     def fitnessGA(self, ga_instance:pygad.GA, x:np.ndarray, x_idx:int):
+        # Worker processes started by pyGAD have no initializer, resources are limited on their first evaluation.
+        if self._n_workers > 1:
+            self.LimitWorkerResources()
         return self.fitnessFunction(x, worker_idx=x_idx)
     
+    def fitnessBatchGA(self, ga_instance:pygad.GA, x_batch:np.ndarray, x_batch_idx:list[int]):
+        return _active_worker_pool.Evaluate(x_batch)
+    
     def transformTestScore(self, val_test_score:float):
         return -np.log10(val_test_score)
     
@@ -781,22 +1360,40 @@ class MLPOptimizer:
     def inv_transformCostParam(self, val_norm_cost_param:float):
         return self.transformCostParameter(val_norm_cost_param)
     
-    def fitnessFunction(self, x:np.ndarray, worker_idx:int=None):
+    def fitnessFunction(self, x:np.ndarray, worker_idx:int=None, shared_data:SharedTrainData=None):
         if worker_idx == None:
             if self._n_workers > 1:
                 p = current_process()
                 worker_idx = p._identity[0]
             else:
                 worker_idx = 0
+        
         Evaluator:TrainMLP = self._prepare_evaluator()
 
-        # Set CPU index.
+        # Individuals which were trained before are not trained again.
+        if self._use_fitness_cache:
+            cache_key = self._get_fitness_cache_key(x, Evaluator)
+            cached_performance = self._read_fitness_cache(cache_key)
+            if cached_performance is not None:
+                return self._compute_objective_function(*cached_performance)
+
+        # Set CPU index. Thread pools are limited once per worker process before the first individual is evaluated.
         Evaluator.SetTrainHardware("CPU", worker_idx)
+        Evaluator.SetDataCache(self._use_data_cache)
+        if shared_data is not None:
+            Evaluator.LoadSharedData(shared_data)
+        if self._use_scheduler:
+            Evaluator.SetEpochCallback(SuccessiveHalvingScheduler(self._get_scheduler_record_file(), self._n_epochs, \
+                                                                  self._scheduler_min_epochs, self._scheduler_reduction_factor))
 
         self._evaluate_MLP_performance(x, Evaluator)
 
         objective_function = self._extract_objective_function(Evaluator)
 
+        # Pruned individuals are not cached, as their performance does not reflect a complete training.
+        if self._use_fitness_cache and not Evaluator.IsPruned():
+            self._write_fitness_cache(cache_key, Evaluator.GetTestScore(), Evaluator.GetCostParameter())
+
         # Free up memory
         del Evaluator 
         return objective_function
@@ -807,6 +1404,8 @@ class MLPOptimizer:
     def _evaluate_MLP_performance(self, x:np.ndarray, MLP_evaluator:TrainMLP):
 
         self._translateGene(x, Evaluator=MLP_evaluator)
+        if self._warm_start:
+            self._warm_start_evaluator(x, MLP_evaluator)
 
         MLP_evaluator.SetVerbose(0)
 
@@ -821,11 +1420,14 @@ class MLPOptimizer:
 
         # Extract test set evaluation score.
         MLP_evaluator.TrainPostprocessing()
+        if self._warm_start:
+            self._add_to_model_index(x, MLP_evaluator)
         return 
     
     def _extract_objective_function(self, MLP_evaluator:TrainMLP):
-        test_score = MLP_evaluator.GetTestScore() 
-        cost_parameter = MLP_evaluator.GetCostParameter()
+        return self._compute_objective_function(MLP_evaluator.GetTestScore(), MLP_evaluator.GetCostParameter())
+    
+    def _compute_objective_function(self, test_score:float, cost_parameter:float):
 
         # Convert performance metrics (to be minimized) into fitness values (to be maximized).
         fitness_test_score = self.transformTestScore(test_score)
@@ -912,6 +1514,12 @@ class MLPOptimizer_FGM(MLPOptimizer):
     def _prepare_evaluator(self):
         return TrainMLP_FGM(self._Config, self.__output_group)
     
+    def _get_problem_cache_entries(self):
+        return super()._get_problem_cache_entries() + ["%i" % self.__output_group,\
+                " ".join(self._Config.GetMLPOutputGroup(self.__output_group)),\
+                " ".join(self._Config.GetProgressVariableSpecies()),\
+                " ".join("%+.16e" % w for w in self._Config.GetProgressVariableWeights())]
+    
     def _postprocess_optimization(self, x):
 
         Config:Config_FGM = Config_FGM(self._Config.GetConfigName() + ".cfg")
@@ -968,6 +1576,9 @@ class MLPOptimizer_NICFD(MLPOptimizer):
     def _prepare_evaluator(self):
         return TrainMLP_NICFD(self._Config)
     
+    def _get_problem_cache_entries(self):
+        return super()._get_problem_cache_entries() + [" ".join(self._Config.GetStateVars())]
+    
 class PlotHPOResults:
     _Config:Config = None 
     _optimizelearningrate:bool = True 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Regression test checking the binary column storage of data sets. Data read from binary storage should equal the
+# data read from the csv file, also when selecting a subset of the variables or data points. Column selection from
+# csv files should equal the corresponding columns of the full data set.
+
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+
+from Common.DataDrivenConfig import Config_NICFD
+from Common.CommonMethods import GetReferenceData, WriteBinaryData, ReadBinaryData, ReadBinaryDataRows, \
+    BinaryDataExists, GetBinaryDataLength
+
+C = Config_NICFD(sys.argv[-1])
+
+csv_file = os.getcwd()+"/../../FluidTraining/MM/"+C.GetConcatenationFileHeader()+"_full.csv"
+with open(csv_file, "r") as fid:
+    variables = fid.readline().strip().split(",")
+x_vars = ["Density", "Energy"]
+y_vars = ["T", "p"]
+
+_, D_csv = GetReferenceData(csv_file, [], variables, np.float64)
+X_csv, Y_csv = GetReferenceData(csv_file, x_vars, y_vars, np.float64)
+idx_rows = np.array([5, 1, 17, 1, 60])
+
+with tempfile.TemporaryDirectory() as data_dir:
+    bin_file = data_dir + "/" + C.GetConcatenationFileHeader() + "_full.csv"
+    WriteBinaryData(bin_file, variables, D_csv)
+
+    # Binary storage is used by GetReferenceData when the csv file is not present.
+    bin_exists = BinaryDataExists(bin_file)
+    D_bin = ReadBinaryData(bin_file, variables, np.float64)
+    X_bin, Y_bin = GetReferenceData(bin_file, x_vars, y_vars, np.float64)
+    X_bin_single, _ = GetReferenceData(bin_file, x_vars, y_vars, np.float32)
+    D_rows = ReadBinaryDataRows(bin_file, y_vars, idx_rows, np.float64)
+    D_slice = ReadBinaryDataRows(bin_file, y_vars, slice(10, 40, 3), np.float64)
+    Np_bin = GetBinaryDataLength(bin_file)
+
+    # Binary storage takes precedence over the csv file, incomplete storage falls back to the csv file.
+    shutil.copy(csv_file, bin_file)
+    WriteBinaryData(bin_file, variables, 2.0*D_csv)
+    _, Y_bin_precedence = GetReferenceData(bin_file, x_vars, y_vars, np.float64)
+    os.remove(data_dir + "/" + C.GetConcatenationFileHeader() + "_full_bin/variables.txt")
+    _, Y_bin_incomplete = GetReferenceData(bin_file, x_vars, y_vars, np.float64)
+
+    # Columns are selected from csv files with a quoted header, including the last column.
+    quoted_file = data_dir + "/quoted.csv"
+    with open(quoted_file, "w+") as fid:
+        fid.write(",".join("\"%s\"" % v for v in variables) + "\n")
+        np.savetxt(fid, D_csv, delimiter=",", fmt="%+.16e")
+    X_quoted, Y_quoted = GetReferenceData(quoted_file, [variables[-1]], [variables[0]], np.float64)
+
+def Columns(D:np.ndarray, selected_variables:list[str]):
+    return D[:, [variables.index(v) for v in selected_variables]]
+
+checks = {"binary_storage_exists": bin_exists,\
+          "binary_data_length": (Np_bin == np.shape(D_csv)[0]),\
+          "binary_columns": np.array_equal(D_bin, D_csv),\
+          "binary_reference_data": (np.array_equal(X_bin, X_csv) and np.array_equal(Y_bin, Y_csv)),\
+          "binary_reference_data_single": (X_bin_single.dtype == np.float32) and np.array_equal(X_bin_single, X_csv.astype(np.float32)),\
+          "binary_rows": np.array_equal(D_rows, Y_csv[idx_rows, :]),\
+          "binary_rows_slice": np.array_equal(D_slice, Y_csv[10:40:3, :]),\
+          "binary_precedence": np.array_equal(Y_bin_precedence, 2.0*Y_csv),\
+          "binary_incomplete_fallback": np.array_equal(Y_bin_incomplete, Y_csv),\
+          "csv_column_selection": (np.array_equal(X_csv, Columns(D_csv, x_vars)) and np.array_equal(Y_csv, Columns(D_csv, y_vars))),\
+          "csv_quoted_header": (np.array_equal(X_quoted, Columns(D_csv, [variables[-1]])) and np.array_equal(Y_quoted, Columns(D_csv, [variables[0]])))}
+
+with open("binary_storage_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Regression test checking the train, test, and validation split index of data sets. Split data retrieved through
+# the split index should equal the corresponding rows of the full data set, and data sets without split index
+# should be read from the split data files. The data set fingerprint should follow the data set content only.
+
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+
+from Common.DataDrivenConfig import Config_NICFD
+from Common.CommonMethods import GetReferenceData, GetReferenceDataSplits, WriteDataSplit, DataSplitExists, \
+    GetDataSplitNames, GetDataSplitIndices, GetDataSetFingerprint, WriteBinaryData
+
+C = Config_NICFD(sys.argv[-1])
+
+data_header = os.getcwd()+"/../../FluidTraining/MM/"+C.GetConcatenationFileHeader()
+x_vars = ["Density", "Energy"]
+y_vars = ["s", "T", "p", "c2"]
+split_names = ["train", "test", "val"]
+split_sizes = [70, 15, 15]
+
+X_full, Y_full = GetReferenceData(data_header + "_full.csv", x_vars, y_vars, np.float64)
+
+with tempfile.TemporaryDirectory() as data_dir:
+    file_header = data_dir + "/" + C.GetConcatenationFileHeader()
+    shutil.copy(data_header + "_full.csv", file_header + "_full.csv")
+    permutation = np.random.RandomState(0).permutation(np.shape(X_full)[0])
+    WriteDataSplit(file_header, permutation, split_names, split_sizes, seed=0)
+
+    split_exists = DataSplitExists(file_header)
+    split_names_read = GetDataSplitNames(file_header)
+    idx_splits = [GetDataSplitIndices(file_header, split_name) for split_name in split_names]
+
+    # Split files are not written, such that split data is retrieved through the split index.
+    data_file_splits = [GetReferenceData(file_header + "_" + split_name + ".csv", x_vars, y_vars, np.float64) for split_name in split_names]
+    data_splits = GetReferenceDataSplits(file_header, x_vars, y_vars, ["full"] + split_names, np.float64)
+
+    # The fingerprint is independent of file location and modification time, but follows the binary column data.
+    fingerprint = GetDataSetFingerprint(file_header)
+    os.utime(file_header + "_full.csv", (0, 0))
+    fingerprint_touched = GetDataSetFingerprint(file_header)
+    with tempfile.TemporaryDirectory() as copy_dir:
+        shutil.copytree(data_dir, copy_dir, dirs_exist_ok=True)
+        fingerprint_copied = GetDataSetFingerprint(copy_dir + "/" + C.GetConcatenationFileHeader())
+    WriteBinaryData(file_header + "_full.csv", x_vars, X_full)
+    fingerprint_binary = GetDataSetFingerprint(file_header)
+    WriteBinaryData(file_header + "_full.csv", x_vars, 2.0*X_full)
+    fingerprint_binary_changed = GetDataSetFingerprint(file_header)
+
+# Data sets without split index are read from the split data files.
+data_splits_files = GetReferenceDataSplits(data_header, x_vars, y_vars, split_names, np.float64)
+data_files = [GetReferenceData(data_header + "_" + split_name + ".csv", x_vars, y_vars, np.float64) for split_name in split_names]
+
+def SplitsEqual(splits_a, splits_b):
+    return all([np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1]) for a, b in zip(splits_a, splits_b)])
+
+data_splits_manual = [(X_full[idx, :], Y_full[idx, :]) for idx in idx_splits]
+
+checks = {"split_index_exists": split_exists,\
+          "split_names": (split_names_read == split_names),\
+          "split_sizes": ([len(idx) for idx in idx_splits] == split_sizes),\
+          "split_partition": np.array_equal(np.sort(np.hstack(idx_splits)), np.arange(np.shape(X_full)[0])),\
+          "split_reference_data": SplitsEqual(data_file_splits, data_splits_manual),\
+          "split_single_pass_full": SplitsEqual(data_splits[:1], [(X_full, Y_full)]),\
+          "split_single_pass": SplitsEqual(data_splits[1:], data_splits_manual),\
+          "split_files_fallback": SplitsEqual(data_splits_files, data_files),\
+          "fingerprint_content": (fingerprint == fingerprint_touched == fingerprint_copied),\
+          "fingerprint_binary": (len({fingerprint, fingerprint_binary, fingerprint_binary_changed}) == 3)}
+
+with open("data_split_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
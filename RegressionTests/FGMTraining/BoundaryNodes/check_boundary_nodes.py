@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Regression test checking the detection of reactant and product boundary nodes of the physics-informed FGM trainer.
+# The closed-form reactant progress variable should identify the same nodes as evaluating the reactant mixture with
+# Cantera for each boundary node separately, and the result should be stored for re-use.
+
+import tempfile
+import numpy as np
+import cantera as ct
+from Manifold_Generation.MLP.Trainers_FGM.Trainers import Train_FGM_PINN
+
+from Common.DataDrivenConfig import Config_FGM
+from Common.Properties import DefaultSettings_FGM
+
+idx_pv = DefaultSettings_FGM.controlling_variables.index(DefaultSettings_FGM.name_pv)
+idx_enth = DefaultSettings_FGM.controlling_variables.index(DefaultSettings_FGM.name_enth)
+idx_mixfrac = DefaultSettings_FGM.controlling_variables.index(DefaultSettings_FGM.name_mixfrac)
+
+def ReactantProgressVariable(C:Config_FGM, z:float):
+    """Evaluate the reactant progress variable at a given mixture fraction with Cantera."""
+    gas = ct.Solution(C.GetReactionMechanism())
+    gas.set_mixture_fraction(min(max(z, 0.0), 1.0), C.GetFuelString(), C.GetOxidizerString())
+    gas.TP = C.GetUnbTempBounds()[0], DefaultSettings_FGM.pressure
+    return C.ComputeProgressVariable(variables=None, flamelet_data=None, Y_flamelet=gas.Y[:, np.newaxis])[0]
+
+checks = {}
+with tempfile.TemporaryDirectory() as output_dir:
+    C = Config_FGM()
+    C.SetReactionMechanism("h2o2.yaml")
+    C.SetFuelDefinition(fuel_species=["H2"], fuel_weights=[1.0])
+    C.SetOutputDir(output_dir)
+    C.SetNpMix(5)
+    C.SetNpTemp(5)
+
+    M = Train_FGM_PINN(C)
+    M.SetCanteraCache(False)
+    M.SetScaler("minmax")
+
+    # Progress variable range of one, such that the reactant progress variable tolerance equals 1e-3.
+    X_fit = np.zeros([2, 3])
+    X_fit[:, idx_pv] = [0.0, 1.0]
+    X_fit[:, idx_enth] = [-1e6, 1e6]
+    X_fit[:, idx_mixfrac] = [0.0, 1.0]
+    M.scaler_function_x.fit(X_fit)
+    M._X_scale = M.scaler_function_x.data_max_ - M.scaler_function_x.data_min_
+    pv_tolerance = 1e-3*M._X_scale[idx_pv]
+
+    # Boundary nodes below, on, and above the reactant progress variable, including mixture fractions outside the unit range.
+    z_boundary = np.linspace(-0.05, 1.05, 23)
+    pv_offsets = np.array([-3.0, 0.0, 0.5, 2.0, 10.0])*pv_tolerance
+    X_boundary = np.zeros([len(z_boundary)*len(pv_offsets), 3])
+    is_unb_ref = np.ones(np.shape(X_boundary)[0], dtype=bool)
+    for iz, z in enumerate(z_boundary):
+        pv_unb = ReactantProgressVariable(C, z)
+        for iOffset, pv_offset in enumerate(pv_offsets):
+            iNode = iz*len(pv_offsets) + iOffset
+            X_boundary[iNode, idx_pv] = pv_unb + pv_offset
+            X_boundary[iNode, idx_enth] = 0.0
+            X_boundary[iNode, idx_mixfrac] = z
+            if X_boundary[iNode, idx_pv] > (pv_unb + pv_tolerance):
+                is_unb_ref[iNode] = False
+    M._X_boundary_norm = M.scaler_function_x.transform(X_boundary)
+
+    is_unb = M._Train_FGM_PINN__LocateUnbBoundaryNodes()
+    checks["boundary_nodes_equal"] = np.array_equal(is_unb, is_unb_ref)
+    checks["boundary_nodes_both_types"] = np.any(is_unb_ref) and not np.all(is_unb_ref)
+    checks["boundary_nodes_cached"] = (M._Train_FGM_PINN__LocateUnbBoundaryNodes() is is_unb)
+
+with open("boundary_node_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Regression test checking the concurrent training of multiple FGM output groups. Two output groups are trained on
+# synthetic flamelet data in separate worker processes, after which the trained networks should be available from
+# the group trainers of the parent process.
+
+import os
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainers_FGM.Trainers import TrainMLP_FGM_Groups
+
+from Common.DataDrivenConfig import Config_FGM
+from Common.Properties import DefaultSettings_FGM
+
+output_groups = [["ViscosityDyn"], ["Cp"]]
+hidden_layers = [[8], [6, 4]]
+
+def WriteSyntheticData(file_header:str):
+    """Write train, test, and validation data of smooth functions of the controlling variables."""
+    np.random.seed(0)
+    variables = DefaultSettings_FGM.controlling_variables + [v for group in output_groups for v in group]
+    for split_name, n_points in zip(["full", "train", "test", "val"], [400, 320, 40, 40]):
+        X = np.random.rand(n_points, 3)
+        Y = np.column_stack((np.sin(X[:, 0]) + X[:, 2], X[:, 1]**2 - X[:, 0]))
+        np.savetxt(file_header + "_" + split_name + ".csv", np.hstack((X, Y)), delimiter=",", header=",".join(variables), comments="")
+    return
+
+if __name__ == "__main__":
+    checks = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        C = Config_FGM()
+        C.SetReactionMechanism("h2o2.yaml")
+        C.SetFuelDefinition(fuel_species=["H2"], fuel_weights=[1.0])
+        C.SetOutputDir(output_dir)
+        C.SetConcatenationFileHeader("MLP_data")
+        C.ClearOutputGroups()
+        for iGroup, group in enumerate(output_groups):
+            C.AddOutputGroup(group)
+            C.SetHiddenLayerArchitecture(hidden_layers[iGroup], iGroup)
+        WriteSyntheticData(output_dir + "/MLP_data")
+
+        G = TrainMLP_FGM_Groups(C)
+        for iGroup in range(len(output_groups)):
+            G.GetGroupTrainer(iGroup).SetNEpochs(2)
+            G.GetGroupTrainer(iGroup).SetVerbose(0)
+        G.SetNWorkers(2)
+        G.CommenceTraining()
+
+        # The trained networks are copied back into the group trainers of the parent process.
+        checks["groups_trained"] = (len(G.GetTestScores()) == 2) and all(np.isfinite(G.GetTestScores()))
+        for iGroup in range(len(output_groups)):
+            group_trainer = G.GetGroupTrainer(iGroup)
+            NN = [3] + hidden_layers[iGroup] + [1]
+            checks["architecture_group_%i" % (iGroup+1)] = ([np.shape(w) for w in G.GetWeights(iGroup)] == [(NN[i], NN[i+1]) for i in range(len(NN)-1)])
+            checks["weights_group_%i" % (iGroup+1)] = all(np.array_equal(w_parent, w) for w_parent, w in zip(group_trainer.GetWeights(), G.GetWeights(iGroup))) and \
+                                                      all(np.array_equal(b_parent, b) for b_parent, b in zip(group_trainer.GetBiases(), G.GetBiases(iGroup)))
+            checks["scores_group_%i" % (iGroup+1)] = (group_trainer.GetTestScore() == G.GetTestScores()[iGroup])
+            checks["saved_group_%i" % (iGroup+1)] = os.path.isdir(group_trainer.GetModelDir())
+
+    with open("group_training_checks.txt", "w+") as fid:
+        for check, passed in checks.items():
+            fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
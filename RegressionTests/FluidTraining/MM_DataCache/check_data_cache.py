@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Regression test checking the cache of normalized train, test, and validation data. Data loaded from the cache
+# should equal the data read and normalized from the data files, and modifying loaded data should not affect the
+# cached data.
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_Direct
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+def LoadTrainData(cache_dir:str=None, scaler:str="minmax"):
+    M = Train_Entropic_Direct()
+    M.SetTrainFileHeader(os.getcwd()+"/../MM/"+C.GetConcatenationFileHeader())
+    M.SetScaler(scaler)
+    M.SetVerbose(0)
+    if cache_dir is not None:
+        M.SetDataCache(True, cache_dir)
+    M.GetTrainData()
+    return M
+
+def GetArrays(M:Train_Entropic_Direct):
+    return [M._X_train_norm, M._X_test_norm, M._X_val_norm, M._Y_train_norm, M._Y_test_norm, M._Y_val_norm, \
+            M._X_scale, M._X_offset, M._Y_scale, M._Y_offset]
+
+def ArraysEqual(arrays_a, arrays_b):
+    return all([np.array_equal(np.asarray(a), np.asarray(b)) for a, b in zip(arrays_a, arrays_b)])
+
+M_ref = LoadTrainData()
+with tempfile.TemporaryDirectory() as cache_dir:
+    # The first training fills the cache, the second one loads the data from it.
+    M_miss = LoadTrainData(cache_dir)
+    n_entries_miss = len(os.listdir(cache_dir))
+    M_hit = LoadTrainData(cache_dir)
+    n_entries_hit = len(os.listdir(cache_dir))
+    cache_miss_equal = ArraysEqual(GetArrays(M_miss), GetArrays(M_ref))
+    cache_hit_equal = ArraysEqual(GetArrays(M_hit), GetArrays(M_ref)) and isinstance(M_hit._X_train_norm, np.memmap)
+
+    # In-place modifications of loaded data are not written to the cache.
+    M_hit._X_train_norm[0, 0] += 1.0
+    M_reload = LoadTrainData(cache_dir)
+    cache_reload_equal = ArraysEqual(GetArrays(M_reload), GetArrays(M_ref))
+
+    # Data normalized with a different scaler is cached separately.
+    M_robust = LoadTrainData(cache_dir, "robust")
+    n_entries_robust = len(os.listdir(cache_dir))
+
+checks = {"cache_miss_data": cache_miss_equal,\
+          "cache_miss_written": (n_entries_miss == 1),\
+          "cache_hit_data": cache_hit_equal,\
+          "cache_hit_reused": (n_entries_hit == 1),\
+          "cache_copy_on_write": cache_reload_equal,\
+          "cache_scaler_key": (n_entries_robust == 2)}
+
+with open("data_cache_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
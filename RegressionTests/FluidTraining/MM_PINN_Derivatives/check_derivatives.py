@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Regression test checking the layer-wise propagation of the MLP Jacobian and Hessian. Derivatives evaluated in a
+# single forward sweep should equal those obtained with nested gradient tapes for each hidden layer activation
+# function.
+
+import os
+import sys
+import numpy as np
+import tensorflow as tf
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD
+from Common.CommonMethods import GetReferenceData
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-10
+activation_functions = ["exponential", "gelu", "tanh", "sigmoid", "swish", "elu"]
+
+# Normalized density and energy of the MM fluid data as network inputs.
+X, _ = GetReferenceData(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader()+"_full.csv", ["Density", "Energy"], [], np.float64)
+X_norm = (X - np.min(X, axis=0)) / (np.max(X, axis=0) - np.min(X, axis=0))
+
+def DerivativesTape(M:Train_Entropic_PINN, x:tf.Tensor):
+    with tf.GradientTape(watch_accessed_variables=False, persistent=True) as tape_2:
+        tape_2.watch(x)
+        with tf.GradientTape(watch_accessed_variables=False) as tape_1:
+            tape_1.watch(x)
+            y = M._MLP_Evaluation(x)
+        dy = tape_1.gradient(y, x)
+        dy_rho = dy[:, 0]
+        dy_e = dy[:, 1]
+    d2y_rho = tape_2.gradient(dy_rho, x)
+    d2y_e = tape_2.gradient(dy_e, x)
+    return y, dy, tf.stack([d2y_rho, d2y_e], axis=1)
+
+def RelativeError(val, val_ref):
+    return np.max(np.abs(val - val_ref)) / max(1.0, np.max(np.abs(val_ref)))
+
+checks = {}
+for activation_function in activation_functions:
+    M = Train_Entropic_PINN()
+    M.SetPrecisionPolicy("float64")
+    M.SetHiddenLayers([12, 8])
+    M.SetActivationFunction(activation_function)
+    M.SetVerbose(0)
+    M.InitializeWeights_and_Biases()
+    M.CollectVariables()
+
+    x_norm = tf.constant(X_norm, dtype=M._dt)
+    y_tape, dy_tape, d2y_tape = DerivativesTape(M, x_norm)
+    y_fwd, dy_fwd, d2y_fwd = M.ComputeMLPDerivatives(x_norm)
+
+    checks["output_" + activation_function] = RelativeError(y_fwd.numpy(), y_tape.numpy()) <= rel_tol
+    checks["jacobian_" + activation_function] = RelativeError(dy_fwd.numpy()[:, 0, :], dy_tape.numpy()) <= rel_tol
+    checks["hessian_" + activation_function] = RelativeError(d2y_fwd.numpy()[:, 0, :, :], d2y_tape.numpy()) <= rel_tol
+
+with open("derivative_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Regression test checking the evaluation of the validation and test loss of the entropic PINN. Losses
+# evaluated in chunks should equal those evaluated on the complete data set at once, and the stratified
+# validation subsample should be reproducible.
+
+import os 
+import sys 
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD 
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-10
+n_val_sub = 4
+
+with tempfile.TemporaryDirectory() as save_dir:
+    M = Train_Entropic_PINN()
+    M.SetTrainFileHeader(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader())
+    M.SetHiddenLayers([10])
+    M.SetActivationFunction("exponential")
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetDeviceIndex(0)
+    M.SetModelIndex(0)
+    M.InitializeWeights_and_Biases()
+    M.CollectVariables()
+    M.Preprocessing()
+
+    # Losses evaluated on the complete data sets.
+    M._full_validation = True 
+    val_loss_full = np.array(M.ValidationLoss())
+    test_loss_full = np.array(M.TestLoss())
+
+    # Losses evaluated in chunks which do not divide the data set size.
+    M.SetEvaluationChunkSize(3)
+    val_loss_chunked = np.array(M.ValidationLoss())
+    test_loss_chunked = np.array(M.TestLoss())
+
+    # Stratified validation subsample.
+    M.SetValidationSubsample(n_val_sub, seed=0)
+    idx_sub_1 = M.GetValidationSubsample()
+    idx_sub_2 = M.GetValidationSubsample()
+
+checks = {"validation_loss_chunked": np.all(np.abs(val_loss_chunked - val_loss_full) <= rel_tol * np.abs(val_loss_full)),\
+          "test_loss_chunked": np.all(np.abs(test_loss_chunked - test_loss_full) <= rel_tol * np.abs(test_loss_full)),\
+          "validation_subsample_size": (len(np.unique(idx_sub_1)) == n_val_sub),\
+          "validation_subsample_reproducible": np.array_equal(idx_sub_1, idx_sub_2)}
+
+with open("evaluation_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Regression test checking the Block-Jacobi train step. The sensitivities of all state variable losses should be
+# evaluated once per batch, after which the weights are updated once for each state variable, followed by a single
+# boundary loss update if the boundary loss is included. The Gauss-Seidel train step re-evaluates the state after
+# every update and should therefore yield a different network.
+
+import os
+import sys
+import tempfile
+import numpy as np
+import tensorflow as tf
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-10
+
+def PrepareTrainer(save_dir:str, weights=None, biases=None):
+    M = Train_Entropic_PINN()
+    M.SetTrainFileHeader(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader())
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([6])
+    M.SetActivationFunction("exponential")
+    M.SetBatchExpo(4)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetTrainStepType("Block-Jacobi")
+    M.EnableBCLoss(True)
+    if weights is not None:
+        M.SetWeightsBiases(weights, biases)
+    M.InitializeWeights_and_Biases()
+    M.Preprocessing()
+    return M
+
+def FirstBatch(M:Train_Entropic_PINN):
+    batch_domain, batch_boundary = next(iter(M.SetTrainBatches()))
+    return list(batch_domain) + list(batch_boundary)
+
+def NetworksEqual(M_a:Train_Entropic_PINN, M_b:Train_Entropic_PINN):
+    return all([np.allclose(a, b, rtol=rel_tol, atol=1e-14) for a, b in zip(M_a.GetWeights() + M_a.GetBiases(), M_b.GetWeights() + M_b.GetBiases())])
+
+def ManualBlockJacobi(M:Train_Entropic_PINN, X, Y, X_b, P_b, Yt_b, include_boundary:bool):
+    # Single state evaluation, followed by one weights update per state variable with the stale sensitivities.
+    jac_state_error = M.ComputeJacobian_State_Error(X, Y)
+    for iVar in range(len(M._state_vars)):
+        M.UpdateWeights([j[iVar] for j in jac_state_error])
+    if include_boundary:
+        M.UpdateWeights(M.ComputeGradients_BC_Loss(X_b, Yt_b, P_b, M.vals_lambda))
+    return
+
+checks = {}
+with tempfile.TemporaryDirectory() as save_dir:
+    for include_boundary, suffix in zip([False, True], ["", "_boundary"]):
+        M_block = PrepareTrainer(save_dir)
+        weights, biases = M_block.GetWeights(), M_block.GetBiases()
+        M_manual = PrepareTrainer(save_dir, weights, biases)
+        M_gauss_seidel = PrepareTrainer(save_dir, weights, biases)
+        X, Y, X_b, P_b, Yt_b = FirstBatch(M_block)
+        N_state = len(M_block._state_vars)
+
+        M_block.Train_Step_Block_Jacobi(X, Y, X_b, P_b, Yt_b, M_block.vals_lambda, tf.constant(include_boundary))
+        ManualBlockJacobi(M_manual, X, Y, X_b, P_b, Yt_b, include_boundary)
+        M_gauss_seidel.Train_Step_Gauss_Seidel(X, Y, X_b, P_b, Yt_b, M_gauss_seidel.vals_lambda, tf.constant(include_boundary))
+
+        checks["block_jacobi_updates" + suffix] = NetworksEqual(M_block, M_manual)
+        checks["block_jacobi_update_count" + suffix] = (int(M_block._optimizer.iterations) == N_state + int(include_boundary))
+        checks["block_jacobi_differs_gauss_seidel" + suffix] = not NetworksEqual(M_block, M_gauss_seidel)
+
+with open("block_jacobi_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Regression test checking the training of complete epochs in a single compiled function. Training with the batch
+# loop in graph mode should yield the same network, boundary penalty values, and gradient update count as training
+# with the batch loop in Python, without retracing after the first epoch.
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainer_Base import CustomTrainer
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-8
+
+def PrepareDirectTrainer(save_dir:str, graph_epoch:bool, weights=None, biases=None):
+    M = CustomTrainer()
+    M.SetPrecisionPolicy("float64")
+    M.SetTrainFileHeader(os.getcwd()+"/../MM/"+C.GetConcatenationFileHeader())
+    M.SetControllingVariables(["Density", "Energy"])
+    M.SetTrainVariables(["s", "T"])
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([8])
+    M.SetActivationFunction("gelu")
+    M.SetBatchExpo(4)
+    M.SetNEpochs(3)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetGraphEpoch(graph_epoch)
+    if weights is not None:
+        M.SetWeightsBiases(weights, biases)
+    M.InitializeWeights_and_Biases()
+    return M
+
+def PreparePINNTrainer(save_dir:str, graph_epoch:bool, weights=None, biases=None):
+    M = Train_Entropic_PINN()
+    M.SetTrainFileHeader(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader())
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([6])
+    M.SetActivationFunction("exponential")
+    M.SetBatchExpo(4)
+    M.SetNEpochs(3)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetTrainStepType("Jacobi")
+    M.EnableBCLoss(True)
+    M._boundary_loss_patience = 0
+    M.SetLambdaUpdate(update_every=2)
+    M.SetGraphEpoch(graph_epoch)
+    if weights is not None:
+        M.SetWeightsBiases(weights, biases)
+    M.InitializeWeights_and_Biases()
+    return M
+
+def Train(M:CustomTrainer):
+    M.Preprocessing()
+    M.LoopEpochs()
+    return M
+
+def NetworksEqual(M_a:CustomTrainer, M_b:CustomTrainer):
+    return all([np.allclose(a, b, rtol=rel_tol, atol=1e-12) for a, b in zip(M_a.GetWeights() + M_a.GetBiases(), M_b.GetWeights() + M_b.GetBiases())])
+
+checks = {}
+with tempfile.TemporaryDirectory() as save_dir:
+    M_python = PrepareDirectTrainer(save_dir, graph_epoch=False)
+    M_graph = PrepareDirectTrainer(save_dir, graph_epoch=True, weights=M_python.GetWeights(), biases=M_python.GetBiases())
+    Train(M_python)
+    Train(M_graph)
+checks["direct_network"] = NetworksEqual(M_graph, M_python)
+checks["direct_validation"] = np.allclose(np.array(M_graph.val_loss_history), np.array(M_python.val_loss_history), rtol=rel_tol)
+checks["direct_no_retracing"] = (M_graph.trace_history[0] > 0) and all([n == 0 for n in M_graph.trace_history[1:]])
+
+with tempfile.TemporaryDirectory() as save_dir:
+    M_PINN_python = PreparePINNTrainer(save_dir, graph_epoch=False)
+    M_PINN_graph = PreparePINNTrainer(save_dir, graph_epoch=True, weights=M_PINN_python.GetWeights(), biases=M_PINN_python.GetBiases())
+    Train(M_PINN_python)
+    Train(M_PINN_graph)
+checks["pinn_network"] = NetworksEqual(M_PINN_graph, M_PINN_python)
+checks["pinn_lambda"] = np.allclose([v.numpy() for v in M_PINN_graph.vals_lambda], [v.numpy() for v in M_PINN_python.vals_lambda], rtol=rel_tol) and \
+                        not np.allclose([v.numpy() for v in M_PINN_graph.vals_lambda], 1.0)
+checks["pinn_gradient_updates"] = (M_PINN_graph.j_gradient_update == M_PINN_python.j_gradient_update == 15)
+checks["pinn_no_retracing"] = (M_PINN_graph.trace_history[0] > 0) and all([n == 0 for n in M_PINN_graph.trace_history[1:]])
+
+with open("graph_epoch_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+# Regression test checking the boundary condition penalty value update from the Jacobi train step sensitivities. The
+# combined train step should yield the same network and batch loss as the Jacobi train step including the boundary
+# loss, and the same penalty values as the separate penalty value update evaluated before the weights update.
+
+import os
+import sys
+import tempfile
+import numpy as np
+import tensorflow as tf
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-10
+
+def PrepareTrainer(save_dir:str, train_step_type:str="Jacobi", weights=None, biases=None):
+    M = Train_Entropic_PINN()
+    M.SetTrainFileHeader(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader())
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([6])
+    M.SetActivationFunction("exponential")
+    M.SetBatchExpo(4)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetTrainStepType(train_step_type)
+    M.EnableBCLoss(True)
+    M.SetLambdaUpdate(update_every=1, reuse_gradients=True)
+    if weights is not None:
+        M.SetWeightsBiases(weights, biases)
+    M.InitializeWeights_and_Biases()
+    M.Preprocessing()
+    return M
+
+def NetworksEqual(M_a:Train_Entropic_PINN, M_b:Train_Entropic_PINN):
+    return all([np.allclose(a, b, rtol=rel_tol, atol=1e-14) for a, b in zip(M_a.GetWeights() + M_a.GetBiases(), M_b.GetWeights() + M_b.GetBiases())])
+
+checks = {}
+with tempfile.TemporaryDirectory() as save_dir:
+    M_combined = PrepareTrainer(save_dir)
+    M_separate = PrepareTrainer(save_dir, weights=M_combined.GetWeights(), biases=M_combined.GetBiases())
+    batch_domain, batch_boundary = next(iter(M_combined.SetTrainBatches()))
+    X, Y = batch_domain[0], batch_domain[1]
+    X_b, P_b, Yt_b = batch_boundary[0], batch_boundary[1], batch_boundary[2]
+
+    loss_combined, vals_lambda_combined = M_combined.Train_Step_Lambda_Update(X, Y, X_b, P_b, Yt_b, M_combined.vals_lambda)
+
+    # Penalty values are updated from the sensitivities before the weights update.
+    vals_lambda_separate = M_separate.UpdateLambdas(X, Y, X_b, P_b, Yt_b, M_separate.vals_lambda)
+    loss_separate = M_separate.Train_Step(X, Y, X_b, P_b, Yt_b, M_separate.vals_lambda, tf.constant(True))
+
+    vals_lambda_combined = np.array([v.numpy() for v in vals_lambda_combined])
+    vals_lambda_separate = np.array([v.numpy() for v in vals_lambda_separate])
+    checks["lambda_update_values"] = np.allclose(vals_lambda_combined, vals_lambda_separate, rtol=rel_tol)
+    checks["lambda_update_changed"] = not np.allclose(vals_lambda_combined, [v.numpy() for v in M_combined.vals_lambda])
+    checks["lambda_update_weights"] = NetworksEqual(M_combined, M_separate)
+    checks["lambda_update_loss"] = np.allclose(loss_combined.numpy(), loss_separate[0].numpy(), rtol=rel_tol)
+    checks["lambda_update_count"] = (int(M_combined._optimizer.iterations) == int(M_separate._optimizer.iterations) == 1)
+
+    # Sensitivities are re-used for the Jacobi train step only.
+    checks["lambda_reuse_jacobi_only"] = M_combined.ReuseLambdaGradients() and \
+                                         not PrepareTrainer(save_dir, train_step_type="Gauss-Seidel").ReuseLambdaGradients()
+
+with open("lambda_update_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
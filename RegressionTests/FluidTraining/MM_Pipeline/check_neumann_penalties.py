@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Regression test checking the evaluation of the Neumann penalties of all boundary conditions from a single MLP
+# Jacobian evaluation. The penalty values, the weighted boundary loss, and their sensitivities should equal those
+# obtained with nested gradient tapes for each boundary condition separately.
+
+import os
+import sys
+import numpy as np
+import tensorflow as tf
+from Manifold_Generation.MLP.Trainer_Base import PhysicsInformedTrainer
+
+from Common.DataDrivenConfig import Config_NICFD
+from Common.CommonMethods import GetReferenceData
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-10
+
+# Normalized density and energy of the MM fluid data as boundary data, with random projections and target gradients.
+X, _ = GetReferenceData(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader()+"_full.csv", ["Density", "Energy"], [], np.float64)
+X_norm = (X - np.min(X, axis=0)) / (np.max(X, axis=0) - np.min(X, axis=0))
+
+# Boundary conditions constrain the second, first, and second network output respectively.
+idx_PIvar = [1, 0, 1]
+rng = np.random.RandomState(0)
+P_boundary = rng.uniform(-1.0, 1.0, size=[np.shape(X_norm)[0], 2, len(idx_PIvar)])
+Yt_boundary = rng.uniform(-1.0, 1.0, size=[np.shape(X_norm)[0], len(idx_PIvar)])
+
+def NeumannPenaltiesTape(M:PhysicsInformedTrainer, x:tf.Tensor, p:tf.Tensor, yt:tf.Tensor):
+    penalties, grads_penalties = [], []
+    for iBc, iVar in enumerate(idx_PIvar):
+        with tf.GradientTape() as tape_weights:
+            tape_weights.watch(M._trainable_hyperparams)
+            with tf.GradientTape(watch_accessed_variables=False) as tape_x:
+                tape_x.watch(x)
+                y = M._MLP_Evaluation(x)[:, iVar]
+            dy = tape_x.gradient(y, x)
+            penalty = tf.reduce_mean(tf.pow(tf.reduce_sum(p[:, :, iBc] * dy, axis=1) - yt[:, iBc], 2))
+        penalties.append(penalty.numpy())
+        grads_penalties.append(tape_weights.gradient(penalty, M._trainable_hyperparams))
+    return np.array(penalties), grads_penalties
+
+def RelativeError(val, val_ref):
+    return np.max(np.abs(val - val_ref)) / max(1.0, np.max(np.abs(val_ref)))
+
+M = PhysicsInformedTrainer()
+M.SetPrecisionPolicy("float64")
+M.SetControllingVariables(["Density", "Energy"])
+M.SetTrainVariables(["s", "T"])
+M.SetHiddenLayers([12, 8])
+M.SetActivationFunction("gelu")
+M.SetVerbose(0)
+M.InitializeWeights_and_Biases()
+M.CollectVariables()
+M.idx_PIvar = idx_PIvar
+M._N_bc = len(idx_PIvar)
+
+x_norm = tf.constant(X_norm, dtype=M._dt)
+p_boundary = tf.constant(P_boundary, dtype=M._dt)
+yt_boundary = tf.constant(Yt_boundary, dtype=M._dt)
+vals_lambda = [tf.constant(v, dtype=M._dt) for v in [0.5, 2.0, 1.5]]
+
+penalties_tape, grads_tape = NeumannPenaltiesTape(M, x_norm, p_boundary, yt_boundary)
+with tf.GradientTape(persistent=True) as tape:
+    tape.watch(M._trainable_hyperparams)
+    penalties = M.ComputeNeumannPenalties(x_norm, yt_boundary, p_boundary)
+    penalties_bc = [penalties[iBc] for iBc in range(M._N_bc)]
+grads_penalties = [tape.gradient(penalty, M._trainable_hyperparams) for penalty in penalties_bc]
+bc_loss = M.ComputeBCLoss(x_norm, yt_boundary, p_boundary, vals_lambda)
+bc_loss_tape = np.sum(np.array([v.numpy() for v in vals_lambda]) * penalties_tape)
+
+checks = {"neumann_penalties": RelativeError(penalties.numpy(), penalties_tape) <= rel_tol,\
+          "neumann_penalty_single": all([RelativeError(M.ComputeNeumannPenalty(x_norm, yt_boundary, p_boundary, iBc).numpy(), penalties.numpy()[iBc]) <= rel_tol for iBc in range(M._N_bc)]),\
+          "neumann_gradients": all([RelativeError(g.numpy(), g_ref.numpy()) <= rel_tol for g_bc, g_bc_ref in zip(grads_penalties, grads_tape) for g, g_ref in zip(g_bc, g_bc_ref)]),\
+          "boundary_loss": RelativeError(bc_loss.numpy(), bc_loss_tape) <= rel_tol}
+
+with open("neumann_penalty_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Regression test checking the function trace counter and the fixed train step input signatures. Incomplete last
+# batches, changing penalty values, and enabling the boundary loss should not trigger retracing after the first epoch.
+# Skipping the incomplete last batch should yield train batches of fixed size, unless the batch size exceeds the
+# number of train data points.
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainer_Base import CustomTrainer
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+def PrepareDirectTrainer(save_dir:str, batch_expo:int=5, drop_remainder:bool=False):
+    M = CustomTrainer()
+    M.SetPrecisionPolicy("float64")
+    M.SetTrainFileHeader(os.getcwd()+"/../MM/"+C.GetConcatenationFileHeader())
+    M.SetControllingVariables(["Density", "Energy"])
+    M.SetTrainVariables(["s"])
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([8])
+    M.SetActivationFunction("gelu")
+    M.SetBatchExpo(batch_expo)
+    M.SetNEpochs(3)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetDropRemainder(drop_remainder)
+    M.InitializeWeights_and_Biases()
+    M.Preprocessing()
+    return M
+
+def PreparePINNTrainer(save_dir:str):
+    M = Train_Entropic_PINN()
+    M.SetTrainFileHeader(os.getcwd()+"/../MM_PINN/"+C.GetConcatenationFileHeader())
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([6])
+    M.SetActivationFunction("exponential")
+    M.SetBatchExpo(5)
+    M.SetNEpochs(3)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetTrainStepType("Jacobi")
+    M.EnableBCLoss(True)
+    M._boundary_loss_patience = 1
+    M.SetLambdaUpdate(update_every=2)
+    M.InitializeWeights_and_Biases()
+    M.Preprocessing()
+    return M
+
+def BatchSizes(M:CustomTrainer):
+    return [int(x_batch.shape[0]) for x_batch, _ in M.SetTrainBatches()]
+
+def NoRetracing(M:CustomTrainer):
+    return (M.trace_history[0] > 0) and all([n == 0 for n in M.trace_history[1:]])
+
+checks = {}
+with tempfile.TemporaryDirectory() as save_dir:
+    # Batches of 32 samples for 80 train data points yield an incomplete last batch.
+    M = PrepareDirectTrainer(save_dir)
+    checks["remainder_batch"] = (BatchSizes(M) == [32, 32, M._Np_train - 64])
+    checks["signature_dynamic_batch"] = (M.SetTrainBatches().element_spec[0].shape[0] is None)
+    M.LoopEpochs()
+    checks["direct_no_retracing"] = NoRetracing(M)
+    checks["direct_train_step_signature"] = (M.Train_Step.input_signature[0].shape[0] is None)
+
+    M_drop = PrepareDirectTrainer(save_dir, drop_remainder=True)
+    checks["drop_remainder_batches"] = (BatchSizes(M_drop) == [32, 32])
+    checks["signature_fixed_batch"] = (M_drop.SetTrainBatches().element_spec[0].shape[0] == 32)
+    M_drop.LoopEpochs()
+    checks["drop_remainder_no_retracing"] = NoRetracing(M_drop)
+    checks["drop_remainder_train_step_signature"] = (M_drop.Train_Step.input_signature[0].shape[0] == 32)
+
+    # All train data is kept if the batch size exceeds the number of train data points.
+    M_large = PrepareDirectTrainer(save_dir, batch_expo=7, drop_remainder=True)
+    checks["drop_remainder_large_batch"] = (BatchSizes(M_large) == [M_large._Np_train])
+
+    # Enabling the boundary loss and updating penalty values does not trigger retracing.
+    M_PINN = PreparePINNTrainer(save_dir)
+    M_PINN.LoopEpochs()
+    checks["pinn_no_retracing"] = NoRetracing(M_PINN) and not np.allclose([v.numpy() for v in M_PINN.vals_lambda], 1.0)
+
+with open("retracing_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
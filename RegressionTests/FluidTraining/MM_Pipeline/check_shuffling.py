@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# Regression test checking the per-epoch shuffling of in-memory train data. Shuffled epochs should contain every
+# train data point exactly once with its matching label, in a different order every epoch, and unshuffled epochs
+# should follow the order of the train data.
+
+import numpy as np
+from Manifold_Generation.MLP.Trainer_Base import CustomTrainer
+
+Np_train = 50
+X_train = np.arange(2*Np_train, dtype=np.float64).reshape([Np_train, 2])
+Y_train = 10.0 * X_train[:, :1]
+
+def TrainBatches(shuffle:bool, seed:int=None):
+    M = CustomTrainer()
+    M.SetPrecisionPolicy("float64")
+    M.SetBatchExpo(3)
+    M.SetShuffleTrainData(shuffle, seed)
+    return M.GetInMemoryDataset(X_train, Y_train)
+
+def CollectEpoch(train_batches):
+    X_batches, Y_batches, batch_sizes = [], [], []
+    for x_batch, y_batch in train_batches:
+        X_batches.append(x_batch.numpy())
+        Y_batches.append(y_batch.numpy())
+        batch_sizes.append(np.shape(x_batch)[0])
+    return np.vstack(X_batches), np.vstack(Y_batches), batch_sizes
+
+def IsPermutation(X:np.ndarray, Y:np.ndarray):
+    return np.array_equal(np.sort(X[:, 0]), X_train[:, 0]) and np.array_equal(Y, 10.0 * X[:, :1]) and np.array_equal(X[:, 1], X[:, 0] + 1)
+
+X_ordered, Y_ordered, batch_sizes = CollectEpoch(TrainBatches(shuffle=False))
+
+train_batches_shuffled = TrainBatches(shuffle=True, seed=1)
+X_epoch_1, Y_epoch_1, batch_sizes_shuffled = CollectEpoch(train_batches_shuffled)
+X_epoch_2, Y_epoch_2, _ = CollectEpoch(train_batches_shuffled)
+X_seeded, _, _ = CollectEpoch(TrainBatches(shuffle=True, seed=1))
+
+checks = {"ordered_epoch": np.array_equal(X_ordered, X_train) and np.array_equal(Y_ordered, Y_train),\
+          "ordered_batch_sizes": (batch_sizes == [8, 8, 8, 8, 8, 8, 2]),\
+          "shuffled_permutation": IsPermutation(X_epoch_1, Y_epoch_1) and IsPermutation(X_epoch_2, Y_epoch_2),\
+          "shuffled_batch_sizes": (batch_sizes_shuffled == batch_sizes),\
+          "shuffled_order": not np.array_equal(X_epoch_1, X_train),\
+          "reshuffled_every_epoch": not np.array_equal(X_epoch_1, X_epoch_2),\
+          "shuffle_seeded": np.array_equal(X_seeded, X_epoch_1)}
+
+with open("shuffling_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+# Regression test checking the streaming of train data from binary storage. Streamed train batches should contain
+# the same normalized data as the in-memory train data, and training on streamed batches should yield the same
+# network as training on the in-memory data when the train data is not shuffled.
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainer_Base import CustomTrainer
+
+from Common.DataDrivenConfig import Config_NICFD
+from Common.CommonMethods import GetReferenceData, WriteBinaryData, WriteDataSplit
+
+C = Config_NICFD(sys.argv[-1])
+
+csv_header = os.getcwd()+"/../MM/"+C.GetConcatenationFileHeader()
+with open(csv_header + "_full.csv", "r") as fid:
+    variables = fid.readline().strip().split(",")
+_, D_full = GetReferenceData(csv_header + "_full.csv", [], variables, np.float64)
+Np_full = np.shape(D_full)[0]
+split_sizes = [int(0.8*Np_full), int(0.1*Np_full), Np_full - int(0.8*Np_full) - int(0.1*Np_full)]
+
+def PrepareTrainer(file_header:str, save_dir:str, streaming:bool, shuffle:bool=False, weights=None, biases=None):
+    M = CustomTrainer()
+    M.SetPrecisionPolicy("float64")
+    M.SetTrainFileHeader(file_header)
+    M.SetControllingVariables(["Density", "Energy"])
+    M.SetTrainVariables(["s"])
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([8])
+    M.SetActivationFunction("gelu")
+    M.SetBatchExpo(4)
+    M.SetNEpochs(2)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetStreamingMode(streaming, chunk_size=32)
+    M.SetShuffleTrainData(shuffle, seed=0)
+    if weights is not None:
+        M.SetWeightsBiases(weights, biases)
+    M.InitializeWeights_and_Biases()
+    return M
+
+def CollectBatches(M:CustomTrainer):
+    X_batches, Y_batches = [], []
+    for x_batch, y_batch in M.SetTrainBatches():
+        X_batches.append(x_batch.numpy())
+        Y_batches.append(y_batch.numpy())
+    return np.vstack(X_batches), np.vstack(Y_batches)
+
+def SortRows(D:np.ndarray):
+    return D[np.lexsort(D.T[::-1]), :]
+
+with tempfile.TemporaryDirectory() as data_dir:
+    # Data set stored in binary format only, with a split index.
+    file_header = data_dir + "/" + C.GetConcatenationFileHeader()
+    WriteBinaryData(file_header + "_full.csv", variables, D_full)
+    WriteDataSplit(file_header, np.arange(Np_full), ["train", "test", "val"], split_sizes, seed=0)
+
+    M_memory = PrepareTrainer(file_header, data_dir, streaming=False)
+    M_memory.Preprocessing()
+    M_stream = PrepareTrainer(file_header, data_dir, streaming=True, weights=M_memory.GetWeights(), biases=M_memory.GetBiases())
+    M_stream.Preprocessing()
+
+    # Scalers fitted chunk-wise equal scalers fitted on the complete data set, test data is loaded in memory.
+    scaler_equal = all([np.allclose(a, b, rtol=1e-12) for a, b in zip([M_stream._X_scale, M_stream._X_offset, M_stream._Y_scale, M_stream._Y_offset],\
+                                                                   [M_memory._X_scale, M_memory._X_offset, M_memory._Y_scale, M_memory._Y_offset])])
+    test_data_equal = np.allclose(M_stream._X_test_norm, M_memory._X_test_norm, rtol=1e-12) and np.allclose(M_stream._Y_test_norm, M_memory._Y_test_norm, rtol=1e-12)
+    train_not_loaded = (M_stream._X_train_norm is None) and (M_stream._Np_train == split_sizes[0])
+
+    # Unshuffled streamed batches follow the order of the train split.
+    X_stream, Y_stream = CollectBatches(M_stream)
+    batches_ordered = np.allclose(X_stream, M_memory._X_train_norm, rtol=1e-12) and np.allclose(Y_stream, M_memory._Y_train_norm, rtol=1e-12)
+
+    # Shuffled streamed batches contain every train data point once per epoch, in a different order every epoch.
+    M_shuffle = PrepareTrainer(file_header, data_dir, streaming=True, shuffle=True)
+    M_shuffle.GetTrainData()
+    train_batches_shuffled = M_shuffle.SetTrainBatches()
+    XY_epochs = []
+    for _ in range(2):
+        XY_epochs.append(np.vstack([np.hstack((x.numpy(), y.numpy())) for x, y in train_batches_shuffled]))
+    XY_memory = np.hstack((M_memory._X_train_norm, M_memory._Y_train_norm))
+    batches_shuffled_complete = all([np.allclose(SortRows(XY), SortRows(XY_memory), rtol=1e-12) for XY in XY_epochs])
+    batches_reshuffled = not np.array_equal(XY_epochs[0], XY_epochs[1]) and not np.allclose(XY_epochs[0], XY_memory)
+
+    # Training on streamed batches yields the same network as training on the in-memory data.
+    M_memory.LoopEpochs()
+    M_stream.LoopEpochs()
+    training_equal = all([np.allclose(w_s, w_m, rtol=1e-10, atol=1e-12) for w_s, w_m in zip(M_stream.GetWeights() + M_stream.GetBiases(), M_memory.GetWeights() + M_memory.GetBiases())])
+    training_validated = np.allclose(np.array(M_stream.val_loss_history), np.array(M_memory.val_loss_history), rtol=1e-8)
+
+# Streaming requires binary data storage.
+try:
+    PrepareTrainer(csv_header, os.getcwd(), streaming=True).GetTrainData()
+    requires_binary = False
+except Exception:
+    requires_binary = True
+
+checks = {"streaming_scaler": scaler_equal,\
+          "streaming_test_data": test_data_equal,\
+          "streaming_train_not_loaded": train_not_loaded,\
+          "streaming_batches_ordered": batches_ordered,\
+          "streaming_batches_shuffled": batches_shuffled_complete,\
+          "streaming_batches_reshuffled": batches_reshuffled,\
+          "streaming_training": training_equal,\
+          "streaming_validation": training_validated,\
+          "streaming_requires_binary": requires_binary}
+
+with open("streaming_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# Regression test checking the validation frequency and stratified validation subsampling. The subsample should be
+# a reproducible selection of distinct validation data points, the validation loss should be evaluated at the
+# requested epochs, and the final validation loss should be evaluated on the complete validation set.
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainer_Base import CustomTrainer
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+def PrepareTrainer(save_dir:str, n_samples:int=None):
+    M = CustomTrainer()
+    M.SetPrecisionPolicy("float64")
+    M.SetTrainFileHeader(os.getcwd()+"/../MM/"+C.GetConcatenationFileHeader())
+    M.SetControllingVariables(["Density", "Energy"])
+    M.SetTrainVariables(["s"])
+    M.SetScaler("minmax")
+    M.SetHiddenLayers([8])
+    M.SetActivationFunction("gelu")
+    M.SetBatchExpo(4)
+    M.SetNEpochs(5)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetValidationSubsample(n_samples, seed=0)
+    M.SetValidationFrequency(2)
+    M.InitializeWeights_and_Biases()
+    M.Preprocessing()
+    return M
+
+checks = {}
+with tempfile.TemporaryDirectory() as save_dir:
+    M = PrepareTrainer(save_dir, 4)
+    Np_val = np.shape(M._X_val_norm)[0]
+    idx_sub = M.GetValidationSubsample()
+    checks["subsample_size"] = (len(np.unique(idx_sub)) == 4) and np.all((idx_sub >= 0) & (idx_sub < Np_val))
+    checks["subsample_reproducible"] = np.array_equal(M.GetValidationSubsample(), idx_sub) and np.array_equal(M._idx_val_sub, idx_sub)
+    checks["subsample_data"] = np.array_equal(M._X_val_sub_tf.numpy(), M._X_val_norm[idx_sub, :]) and \
+                               np.array_equal(M._Y_val_sub_tf.numpy(), M._Y_val_norm[idx_sub, :])
+    checks["subsample_full_set"] = np.array_equal(PrepareTrainer(save_dir, None).GetValidationSubsample(), np.arange(Np_val)) and \
+                                   np.array_equal(PrepareTrainer(save_dir, 2*Np_val).GetValidationSubsample(), np.arange(Np_val))
+
+    # Validation loss is evaluated every second epoch and at the final epoch, the latter on the complete validation set.
+    M.LoopEpochs()
+    val_loss_full = M.EvaluateValidationLoss(full_validation=True)
+    checks["validation_epochs"] = (M.val_epoch_history == [1, 3, 4]) and all([len(h) == 3 for h in M.val_loss_history])
+    checks["validation_final_full"] = np.allclose([h[-1] for h in M.val_loss_history], val_loss_full, rtol=1e-12)
+
+try:
+    CustomTrainer().SetValidationSubsample(0)
+    checks["subsample_invalid_size"] = False
+except Exception:
+    checks["subsample_invalid_size"] = True
+
+with open("validation_subsample_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Regression test checking the fitness cache of the hyper-parameter optimization. Cache keys should be reproducible
+# for the same hyper-parameters and training problem, and cached performance should be returned without training.
+
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.optimizeHP import MLPOptimizer_NICFD
+
+from Common.DataDrivenConfig import Config_NICFD
+
+def PrepareOptimizer(Config:Config_NICFD, history_dir:str):
+    H = MLPOptimizer_NICFD(Config)
+    H.Optimize_Batch_HP(False)
+    H.Optimize_ActivationFunction(False)
+    H.Optimize_Architecture_HP(False)
+    H.Optimize_LearningRate_HP(True)
+    H.SetFitnessCache(True)
+    H.opt_history_filepath = history_dir + "/history_opt_.csv"
+    return H
+
+x = np.array([-3.0, 0.9])
+x_other = np.array([-2.5, 0.9])
+test_score, cost_parameter = 1.5e-3, 1234.0
+
+with tempfile.TemporaryDirectory() as history_dir:
+    H = PrepareOptimizer(Config_NICFD(sys.argv[-1]), history_dir)
+    cache_key = H._get_fitness_cache_key(x)
+
+    # Keys depend on the settings defining the training problem only.
+    C_renamed = Config_NICFD(sys.argv[-1])
+    C_renamed.SetConfigName("config_renamed")
+    C_controls = Config_NICFD(sys.argv[-1])
+    C_controls.SetControllingVariables(C_controls.GetControllingVariables()[::-1])
+    key_reproducible = (PrepareOptimizer(Config_NICFD(sys.argv[-1]), history_dir)._get_fitness_cache_key(x) == cache_key)
+    key_unrelated_setting = (PrepareOptimizer(C_renamed, history_dir)._get_fitness_cache_key(x) == cache_key)
+    key_controlling_variables = (PrepareOptimizer(C_controls, history_dir)._get_fitness_cache_key(x) != cache_key)
+    key_hyper_parameters = (H._get_fitness_cache_key(x_other) != cache_key)
+
+    # Keys depend on the settings of the trainer evaluating the individual.
+    E_scaler = H._prepare_evaluator()
+    E_scaler.SetScaler("robust")
+    E_train_step = H._prepare_evaluator()
+    E_train_step.SetTrainStepType("Block-Jacobi")
+    key_scaler = (H._get_fitness_cache_key(x, E_scaler) != cache_key)
+    key_train_step = (H._get_fitness_cache_key(x, E_train_step) != cache_key)
+
+    # Cached performance is returned by the fitness function without training.
+    empty_before_write = H._read_fitness_cache(cache_key) is None
+    H._write_fitness_cache(cache_key, test_score, cost_parameter)
+    cached_performance = H._read_fitness_cache(cache_key)
+    other_not_cached = H._read_fitness_cache(H._get_fitness_cache_key(x_other)) is None
+    fitness = H.fitnessFunction(x)
+
+    # The cache is cleared when a new optimization is started.
+    H._set_history_header()
+    cleared_on_start = H._read_fitness_cache(cache_key) is None
+
+checks = {"key_reproducible": key_reproducible,\
+          "key_unrelated_setting": key_unrelated_setting,\
+          "key_controlling_variables": key_controlling_variables,\
+          "key_hyper_parameters": key_hyper_parameters,\
+          "key_scaler": key_scaler,\
+          "key_train_step": key_train_step,\
+          "cache_empty": empty_before_write,\
+          "cache_round_trip": (cached_performance == (test_score, cost_parameter)),\
+          "cache_other_key": other_not_cached,\
+          "cache_fitness": (fitness == H.transformTestScore(test_score)),\
+          "cache_cleared": cleared_on_start}
+
+with open("fitness_cache_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+# Regression test checking the decisions of the successive halving scheduler used during hyper-parameter
+# optimization. Candidates report synthetic validation losses, and the scheduler decisions are compared to the
+# expected promotions at each rung.
+
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.optimizeHP import SuccessiveHalvingScheduler
+
+max_epochs = 100
+min_epochs = 10
+reduction_factor = 3
+
+checks = {}
+with tempfile.TemporaryDirectory() as record_dir:
+    record_file = record_dir + "/scheduler_record.csv"
+    def Candidate():
+        return SuccessiveHalvingScheduler(record_file, max_epochs, min_epochs, reduction_factor)
+
+    checks["rungs"] = (Candidate().GetRungs() == [10, 30, 90])
+
+    # Candidates are promoted until three candidates reached the rung, after which only the best third is promoted.
+    checks["promote_first"] = Candidate()(9, [0.5])
+    checks["promote_second"] = Candidate()(9, [0.4])
+    checks["prune_worst"] = not Candidate()(9, [0.6])
+    checks["promote_best"] = Candidate()(9, [0.3])
+
+    # Rungs passed in between validation loss evaluations are all evaluated with the current loss.
+    candidate = Candidate()
+    checks["no_rung_reached"] = candidate(4, [0.2])
+    checks["promote_multiple_rungs"] = candidate(29, [0.2])
+
+    # Diverged candidates are pruned, and the worst loss among the network outputs is compared.
+    checks["prune_nan"] = not Candidate()(9, [np.nan, 0.1])
+    checks["prune_max_output_loss"] = not Candidate()(9, [0.1, 0.35])
+    checks["promote_tied_loss"] = Candidate()(9, [0.25, 0.1])
+
+    with open(record_file, "r") as fid:
+        rungs_recorded = [int(line.split(",")[0]) for line in fid.readlines()]
+    checks["records"] = (rungs_recorded.count(10) == 8) and (rungs_recorded.count(30) == 1) and (len(rungs_recorded) == 9)
+
+with open("scheduler_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# Regression test checking the warm start of individuals during hyper-parameter optimization. Expanding a network
+# without noise should preserve its output, and individuals should be initialized from the nearest previously
+# trained network.
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.optimizeHP import MLPOptimizer_NICFD, ExpandNetwork, IsNetworkExtension
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import TrainMLP_NICFD
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+
+rel_tol = 1e-12
+activation_functions = {"linear": lambda z: z, \
+                        "relu": lambda z: np.maximum(z, 0.0), \
+                        "tanh": np.tanh}
+
+np.random.seed(0)
+x_input = np.random.rand(50, 2)
+
+def RandomNetwork(NN:list[int]):
+    weights = [np.random.randn(NN[i], NN[i+1]) for i in range(len(NN)-1)]
+    biases = [np.random.randn(NN[i+1]) for i in range(len(NN)-1)]
+    return weights, biases
+
+def EvaluateNetwork(weights:list[np.ndarray], biases:list[np.ndarray], activation_function:str):
+    y = x_input
+    for iLayer in range(len(weights)-1):
+        y = activation_functions[activation_function](np.dot(y, weights[iLayer]) + biases[iLayer])
+    return np.dot(y, weights[-1]) + biases[-1]
+
+def OutputPreserved(weights, biases, architecture, activation_function):
+    y_ref = EvaluateNetwork(weights, biases, activation_function)
+    weights_expanded, biases_expanded = ExpandNetwork(weights, biases, architecture, activation_function, noise_level=0.0)
+    architecture_expanded = [np.shape(w)[1] for w in weights_expanded[:-1]]
+    y_expanded = EvaluateNetwork(weights_expanded, biases_expanded, activation_function)
+    return (architecture_expanded == architecture) and np.max(np.abs(y_expanded - y_ref)) <= rel_tol * np.max(np.abs(y_ref))
+
+weights_in, biases_in = RandomNetwork([2, 5, 4, 1])
+checks = {}
+
+# Widening preserves the output for any activation function, identity layers only for idempotent activations.
+for activation_function in activation_functions.keys():
+    checks["widen_" + activation_function] = OutputPreserved(weights_in, biases_in, [8, 6], activation_function)
+for activation_function in ["linear", "relu"]:
+    checks["deepen_" + activation_function] = OutputPreserved(weights_in, biases_in, [8, 6, 4, 7], activation_function)
+
+# Identity layers do not preserve the output of other activation functions, such networks are only widened.
+checks["deepen_tanh_rejected"] = not IsNetworkExtension([5, 4], [8, 6, 4, 7], "tanh")
+try:
+    ExpandNetwork(weights_in, biases_in, [8, 6, 4, 7], "tanh")
+    checks["deepen_tanh_raises"] = False
+except Exception:
+    checks["deepen_tanh_raises"] = True
+
+def WarmStart(hpo_dir:str, activation_function:str, models:list[tuple]):
+    """Warm-start an individual with hidden layers [6, 4, 4] from an index of randomly initialized networks."""
+    H = MLPOptimizer_NICFD(C)
+    H.Optimize_Batch_HP(False)
+    H.Optimize_ActivationFunction(False)
+    H.Optimize_Architecture_HP(False)
+    H.Optimize_LearningRate_HP(False)
+    H.SetActivationFunction(activation_function)
+    H.SetArchitecture([6, 4, 4])
+    H.opt_history_filepath = hpo_dir + "/history_opt_.csv"
+
+    with open(H._get_model_index_file(), "w+") as fid:
+        for model_name, activation_function_model, architecture in models:
+            model_dir = hpo_dir + "/" + model_name
+            os.mkdir(model_dir)
+            weights, biases = RandomNetwork([2] + architecture + [1])
+            for iLayer in range(len(weights)):
+                np.save(model_dir + "/W_%i.npy" % iLayer, weights[iLayer])
+                np.save(model_dir + "/b_%i.npy" % iLayer, biases[iLayer])
+            fid.write("%s,%s,%s,%+.16e\n" % (model_dir, activation_function_model, " ".join("%i" % n for n in architecture), 1e-3))
+
+    E = TrainMLP_NICFD(C)
+    E.SetHiddenLayers([6, 4, 4])
+    H._warm_start_evaluator(np.array([]), E)
+    if not E._trainer_direct._loaded_custom_weights:
+        return None
+    return E._trainer_direct._custom_weights
+
+# The nearest network is listed before a smaller compatible network and a network with another activation function.
+with tempfile.TemporaryDirectory() as hpo_dir:
+    weights_loaded = WarmStart(hpo_dir, "relu", [("model_nearest", "relu", [5, 4]), ("model_small", "relu", [3]), ("model_gelu", "gelu", [6, 4])])
+    W_0_nearest = np.load(hpo_dir + "/model_nearest/W_0.npy")
+checks["warm_start_architecture"] = (weights_loaded is not None) and ([np.shape(w) for w in weights_loaded] == [(2, 6), (6, 4), (4, 4), (4, 1)])
+checks["warm_start_nearest"] = (weights_loaded is not None) and np.array_equal(weights_loaded[0][:, :5], W_0_nearest)
+
+# Shallower networks with a non-ReLU activation function are skipped in favor of networks of equal depth.
+with tempfile.TemporaryDirectory() as hpo_dir:
+    weights_loaded = WarmStart(hpo_dir, "tanh", [("model_shallow", "tanh", [5, 4]), ("model_narrow", "tanh", [5, 3, 2])])
+    W_0_narrow = np.load(hpo_dir + "/model_narrow/W_0.npy")
+checks["warm_start_tanh_widened"] = (weights_loaded is not None) and np.array_equal(weights_loaded[0][:, :5], W_0_narrow)
+
+# Individuals without a compatible network are initialized randomly.
+with tempfile.TemporaryDirectory() as hpo_dir:
+    weights_loaded = WarmStart(hpo_dir, "tanh", [("model_shallow", "tanh", [5, 4])])
+checks["warm_start_tanh_cold"] = (weights_loaded is None)
+
+with open("warm_start_checks.txt", "w+") as fid:
+    for check, passed in checks.items():
+        fid.write("%s %s\n" % (check, "passed" if passed else "failed"))
@@ -37,6 +37,156 @@ def main():
     training_MM_PINN.test_files = ["Model_0/SU2_MLP.mlp"]
 
     test_list.append(training_MM_PINN)
+
+    evaluation_MM_PINN = TestCase("Evaluation_MM_PhysicsInformed")
+    evaluation_MM_PINN.config_dir = "FluidTraining/MM_PINN_Evaluation/"
+    evaluation_MM_PINN.config_file = "config_MM.cfg"
+    evaluation_MM_PINN.exec_command = "./evaluate_MLP.py"
+    evaluation_MM_PINN.reference_files = ["evaluation_checks_ref.txt"]
+    evaluation_MM_PINN.test_files = ["evaluation_checks.txt"]
+    test_list.append(evaluation_MM_PINN)
+
+    derivatives_MM_PINN = TestCase("Derivatives_MM_PhysicsInformed")
+    derivatives_MM_PINN.config_dir = "FluidTraining/MM_PINN_Derivatives/"
+    derivatives_MM_PINN.config_file = "config_MM.cfg"
+    derivatives_MM_PINN.exec_command = "./check_derivatives.py"
+    derivatives_MM_PINN.reference_files = ["derivative_checks_ref.txt"]
+    derivatives_MM_PINN.test_files = ["derivative_checks.txt"]
+    test_list.append(derivatives_MM_PINN)
+
+    data_cache_MM = TestCase("Data_Cache_MM")
+    data_cache_MM.config_dir = "FluidTraining/MM_DataCache/"
+    data_cache_MM.config_file = "config_MM.cfg"
+    data_cache_MM.exec_command = "./check_data_cache.py"
+    data_cache_MM.reference_files = ["data_cache_checks_ref.txt"]
+    data_cache_MM.test_files = ["data_cache_checks.txt"]
+    test_list.append(data_cache_MM)
+
+    streaming_MM = TestCase("Streaming_MM")
+    streaming_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    streaming_MM.config_file = "../MM/config_MM.cfg"
+    streaming_MM.exec_command = "./check_streaming.py"
+    streaming_MM.reference_files = ["streaming_checks_ref.txt"]
+    streaming_MM.test_files = ["streaming_checks.txt"]
+    streaming_MM.timeout = 60.0
+    test_list.append(streaming_MM)
+
+    shuffling_MM = TestCase("Shuffling_MM")
+    shuffling_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    shuffling_MM.config_file = "../MM/config_MM.cfg"
+    shuffling_MM.exec_command = "./check_shuffling.py"
+    shuffling_MM.reference_files = ["shuffling_checks_ref.txt"]
+    shuffling_MM.test_files = ["shuffling_checks.txt"]
+    test_list.append(shuffling_MM)
+
+    graph_epoch_MM = TestCase("Graph_Epoch_MM")
+    graph_epoch_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    graph_epoch_MM.config_file = "../MM/config_MM.cfg"
+    graph_epoch_MM.exec_command = "./check_graph_epoch.py"
+    graph_epoch_MM.reference_files = ["graph_epoch_checks_ref.txt"]
+    graph_epoch_MM.test_files = ["graph_epoch_checks.txt"]
+    graph_epoch_MM.timeout = 120.0
+    test_list.append(graph_epoch_MM)
+
+    validation_subsample_MM = TestCase("Validation_Subsample_MM")
+    validation_subsample_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    validation_subsample_MM.config_file = "../MM/config_MM.cfg"
+    validation_subsample_MM.exec_command = "./check_validation_subsample.py"
+    validation_subsample_MM.reference_files = ["validation_subsample_checks_ref.txt"]
+    validation_subsample_MM.test_files = ["validation_subsample_checks.txt"]
+    validation_subsample_MM.timeout = 60.0
+    test_list.append(validation_subsample_MM)
+
+    neumann_penalties_MM = TestCase("Neumann_Penalties_MM")
+    neumann_penalties_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    neumann_penalties_MM.config_file = "../MM/config_MM.cfg"
+    neumann_penalties_MM.exec_command = "./check_neumann_penalties.py"
+    neumann_penalties_MM.reference_files = ["neumann_penalty_checks_ref.txt"]
+    neumann_penalties_MM.test_files = ["neumann_penalty_checks.txt"]
+    test_list.append(neumann_penalties_MM)
+
+    block_jacobi_MM = TestCase("Block_Jacobi_MM")
+    block_jacobi_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    block_jacobi_MM.config_file = "../MM/config_MM.cfg"
+    block_jacobi_MM.exec_command = "./check_block_jacobi.py"
+    block_jacobi_MM.reference_files = ["block_jacobi_checks_ref.txt"]
+    block_jacobi_MM.test_files = ["block_jacobi_checks.txt"]
+    block_jacobi_MM.timeout = 60.0
+    test_list.append(block_jacobi_MM)
+
+    lambda_update_MM = TestCase("Lambda_Update_MM")
+    lambda_update_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    lambda_update_MM.config_file = "../MM/config_MM.cfg"
+    lambda_update_MM.exec_command = "./check_lambda_update.py"
+    lambda_update_MM.reference_files = ["lambda_update_checks_ref.txt"]
+    lambda_update_MM.test_files = ["lambda_update_checks.txt"]
+    lambda_update_MM.timeout = 60.0
+    test_list.append(lambda_update_MM)
+
+    retracing_MM = TestCase("Retracing_MM")
+    retracing_MM.config_dir = "FluidTraining/MM_Pipeline/"
+    retracing_MM.config_file = "../MM/config_MM.cfg"
+    retracing_MM.exec_command = "./check_retracing.py"
+    retracing_MM.reference_files = ["retracing_checks_ref.txt"]
+    retracing_MM.test_files = ["retracing_checks.txt"]
+    retracing_MM.timeout = 120.0
+    test_list.append(retracing_MM)
+
+    binary_storage = TestCase("Binary_Storage")
+    binary_storage.config_dir = "DataProcessing/BinaryStorage/"
+    binary_storage.config_file = "config_MM.cfg"
+    binary_storage.exec_command = "./check_binary_storage.py"
+    binary_storage.reference_files = ["binary_storage_checks_ref.txt"]
+    binary_storage.test_files = ["binary_storage_checks.txt"]
+    test_list.append(binary_storage)
+
+    data_split = TestCase("Data_Split")
+    data_split.config_dir = "DataProcessing/DataSplit/"
+    data_split.config_file = "config_MM.cfg"
+    data_split.exec_command = "./check_data_split.py"
+    data_split.reference_files = ["data_split_checks_ref.txt"]
+    data_split.test_files = ["data_split_checks.txt"]
+    test_list.append(data_split)
+
+    hpo_scheduler = TestCase("HPO_Scheduler")
+    hpo_scheduler.config_dir = "HPO/Scheduler/"
+    hpo_scheduler.exec_command = "./check_scheduler.py"
+    hpo_scheduler.reference_files = ["scheduler_checks_ref.txt"]
+    hpo_scheduler.test_files = ["scheduler_checks.txt"]
+    test_list.append(hpo_scheduler)
+
+    hpo_fitness_cache = TestCase("HPO_Fitness_Cache")
+    hpo_fitness_cache.config_dir = "HPO/FitnessCache/"
+    hpo_fitness_cache.config_file = "config_MM.cfg"
+    hpo_fitness_cache.exec_command = "./check_fitness_cache.py"
+    hpo_fitness_cache.reference_files = ["fitness_cache_checks_ref.txt"]
+    hpo_fitness_cache.test_files = ["fitness_cache_checks.txt"]
+    test_list.append(hpo_fitness_cache)
+
+    hpo_warm_start = TestCase("HPO_Warm_Start")
+    hpo_warm_start.config_dir = "HPO/WarmStart/"
+    hpo_warm_start.config_file = "config_MM.cfg"
+    hpo_warm_start.exec_command = "./check_warm_start.py"
+    hpo_warm_start.reference_files = ["warm_start_checks_ref.txt"]
+    hpo_warm_start.test_files = ["warm_start_checks.txt"]
+    test_list.append(hpo_warm_start)
+
+    training_FGM_groups = TestCase("Training_FGM_Groups")
+    training_FGM_groups.config_dir = "FGMTraining/Groups/"
+    training_FGM_groups.exec_command = "./check_group_training.py"
+    training_FGM_groups.reference_files = ["group_training_checks_ref.txt"]
+    training_FGM_groups.test_files = ["group_training_checks.txt"]
+    training_FGM_groups.timeout = 120.0
+    test_list.append(training_FGM_groups)
+
+    boundary_nodes_FGM = TestCase("Boundary_Nodes_FGM")
+    boundary_nodes_FGM.config_dir = "FGMTraining/BoundaryNodes/"
+    boundary_nodes_FGM.exec_command = "./check_boundary_nodes.py"
+    boundary_nodes_FGM.reference_files = ["boundary_node_checks_ref.txt"]
+    boundary_nodes_FGM.test_files = ["boundary_node_checks.txt"]
+    boundary_nodes_FGM.timeout = 60.0
+    test_list.append(boundary_nodes_FGM)
+
     pass_list = [test.run_test() for test in test_list]
 
     # Tests summary
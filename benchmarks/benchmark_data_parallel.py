@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# Benchmark the scaling of data-parallel training of the entropic PINN on the MM data set from one
+# CPU core up to all available cores. Logical CPU devices can only be configured before TensorFlow is
+# initialized, so each worker count is trained in a separate process. Models are written to a temporary directory.
+# No measured results are recorded, the scaling of the data-parallel training has not been verified.
+# Usage: python3 benchmarks/benchmark_data_parallel.py RegressionTests/FluidTraining/MM_PINN/config_MM.cfg
+
+import os
+import sys
+import subprocess
+import tempfile
+import numpy as np
+
+n_epochs = 10
+n_cores = os.cpu_count()
+
+def RunTraining(n_workers:int, save_dir:str):
+    from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+    from Common.DataDrivenConfig import Config_NICFD
+
+    C = Config_NICFD(sys.argv[-1])
+
+    M = Train_Entropic_PINN()
+    M.SetDataParallel(n_workers, intra_op_threads=1, inter_op_threads=1)
+    M.SetTrainFileHeader(os.path.dirname(os.path.abspath(sys.argv[-1]))+"/"+C.GetConcatenationFileHeader())
+    M.SetNEpochs(n_epochs)
+    M.SetBatchExpo(10)
+    M.SetHiddenLayers([30])
+    M.SetActivationFunction("exponential")
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetDeviceIndex(0)
+    M.SetModelIndex(0)
+    M.callback_every = n_epochs + 1
+    M.InitializeWeights_and_Biases()
+    M.CollectVariables()
+    M.Train_MLP()
+
+    # First epoch includes tracing.
+    return np.mean(M.throughput_history[1:])
+
+if len(sys.argv) == 3:
+    with tempfile.TemporaryDirectory() as save_dir:
+        print("%.6e" % RunTraining(int(sys.argv[1]), save_dir))
+else:
+    n_workers_list = []
+    n_workers = 1
+    while n_workers < n_cores:
+        n_workers_list.append(n_workers)
+        n_workers *= 2
+    n_workers_list.append(n_cores)
+
+    throughput_single = None
+    print("%-10s %-22s %-10s" % ("Workers", "Throughput[samples/s]", "Speedup"))
+    for n_workers in n_workers_list:
+        output = subprocess.run([sys.executable, __file__, str(n_workers), sys.argv[-1]], capture_output=True, text=True, check=True)
+        throughput = float(output.stdout.strip().split("\n")[-1])
+        if throughput_single is None:
+            throughput_single = throughput
+        print("%-10i %+.6e          %.2f" % (n_workers, throughput, throughput / throughput_single))
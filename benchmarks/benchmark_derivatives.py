@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# Benchmark the layer-wise MLP derivative propagation against nested gradient tapes for the
+# entropic PINN. Reports the evaluation time of the entropy Jacobian and Hessian, the time of
+# the corresponding weight sensitivity computation, and the peak device memory if a GPU is used.
+# No measured results are recorded, the timings and memory use of both approaches have not been verified.
+# Usage: python3 benchmarks/benchmark_derivatives.py
+
+import time
+import numpy as np
+import tensorflow as tf
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+n_points = 2**16
+n_repeats = 50
+
+M = Train_Entropic_PINN()
+M.SetHiddenLayers([40])
+M.SetActivationFunction("exponential")
+M.InitializeWeights_and_Biases()
+M.CollectVariables()
+
+x_norm = tf.constant(np.random.rand(n_points, len(M._controlling_vars)), dtype=M._dt)
+
+@tf.function
+def DerivativesTape(x):
+    with tf.GradientTape(watch_accessed_variables=False, persistent=True) as tape_2:
+        tape_2.watch(x)
+        with tf.GradientTape(watch_accessed_variables=False) as tape_1:
+            tape_1.watch(x)
+            y = M._MLP_Evaluation(x)
+        dy = tape_1.gradient(y, x)
+        dy_rho = dy[:, 0]
+        dy_e = dy[:, 1]
+    d2y_rho = tape_2.gradient(dy_rho, x)
+    d2y_e = tape_2.gradient(dy_e, x)
+    return y, dy, tf.stack([d2y_rho, d2y_e], axis=1)
+
+@tf.function
+def DerivativesForward(x):
+    y, dy, d2y = M.ComputeMLPDerivatives(x)
+    return y, dy[:, 0, :], d2y[:, 0, :, :]
+
+def Sensitivities(derivative_function):
+    @tf.function
+    def ComputeSensitivities(x):
+        with tf.GradientTape() as tape:
+            tape.watch(M._trainable_hyperparams)
+            y, dy, d2y = derivative_function(x)
+            loss = tf.reduce_mean(tf.pow(y, 2)) + tf.reduce_mean(tf.pow(dy, 2)) + tf.reduce_mean(tf.pow(d2y, 2))
+        return tape.gradient(loss, M._trainable_hyperparams)
+    return ComputeSensitivities
+
+def TimeFunction(function):
+    function(x_norm)
+    if tf.config.list_physical_devices("GPU"):
+        tf.config.experimental.reset_memory_stats("GPU:0")
+    t_start = time.time()
+    for _ in range(n_repeats):
+        function(x_norm)
+    t_elapsed = (time.time() - t_start) / n_repeats
+    peak_memory = None
+    if tf.config.list_physical_devices("GPU"):
+        peak_memory = tf.config.experimental.get_memory_info("GPU:0")["peak"]
+    return t_elapsed, peak_memory
+
+# Check consistency of both derivative evaluations.
+y_tape, dy_tape, d2y_tape = DerivativesTape(x_norm)
+y_fwd, dy_fwd, d2y_fwd = DerivativesForward(x_norm)
+print("Max. Jacobian difference: %.3e" % np.max(np.abs(dy_tape.numpy() - dy_fwd.numpy())))
+print("Max. Hessian difference:  %.3e" % np.max(np.abs(d2y_tape.numpy() - d2y_fwd.numpy())))
+
+for label, function in zip(["Derivative evaluation", "Weight sensitivities"], \
+                           [[DerivativesTape, DerivativesForward], [Sensitivities(DerivativesTape), Sensitivities(DerivativesForward)]]):
+    t_tape, mem_tape = TimeFunction(function[0])
+    t_fwd, mem_fwd = TimeFunction(function[1])
+    print("%s: gradient tapes %.3e s, layer-wise propagation %.3e s, speedup %.2f" % (label, t_tape, t_fwd, t_tape / t_fwd))
+    if mem_tape is not None:
+        print("%s: peak memory gradient tapes %i B, layer-wise propagation %i B" % (label, mem_tape, mem_fwd))
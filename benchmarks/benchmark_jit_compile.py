@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Benchmark the per-epoch train time of the entropic PINN on the MM data set with and without
+# XLA compilation of the training kernels. Models are written to a temporary directory.
+# No measured results are recorded, the speedup of XLA compilation has not been verified.
+# Usage: python3 benchmarks/benchmark_jit_compile.py RegressionTests/FluidTraining/MM_PINN/config_MM.cfg
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_PINN
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+data_dir = os.path.dirname(os.path.abspath(sys.argv[-1]))
+
+n_epochs = 20
+
+def RunTraining(jit_compile:bool, save_dir:str):
+    M = Train_Entropic_PINN()
+    M.SetTrainFileHeader(data_dir+"/"+C.GetConcatenationFileHeader())
+    M.SetNEpochs(n_epochs)
+    M.SetHiddenLayers([10])
+    M.SetActivationFunction("exponential")
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetDeviceIndex(0)
+    M.SetModelIndex(0)
+    M.SetJITCompile(jit_compile)
+    M.callback_every = n_epochs + 1
+    M.InitializeWeights_and_Biases()
+    M.CollectVariables()
+    M.Train_MLP()
+
+    # First epoch includes tracing and compilation.
+    return np.mean(M.throughput_history[1:])
+
+with tempfile.TemporaryDirectory() as save_dir:
+    throughput_default = RunTraining(jit_compile=False, save_dir=save_dir)
+    throughput_xla = RunTraining(jit_compile=True, save_dir=save_dir)
+
+print("Train data throughput without XLA: %.3e samples/s" % throughput_default)
+print("Train data throughput with XLA:    %.3e samples/s" % throughput_xla)
+print("Per-epoch speedup: %.2f" % (throughput_xla / throughput_default))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Compare the test set accuracy and per-epoch train data throughput of the direct entropy fit on
+# the MM data set for each of the supported precision policies. Models are written to a temporary directory.
+# No measured results are recorded, the throughput and accuracy of the precision policies have not been verified.
+# Usage: python3 benchmarks/benchmark_precision.py RegressionTests/FluidTraining/MM/config_MM.cfg
+
+import os
+import sys
+import tempfile
+import numpy as np
+from Manifold_Generation.MLP.Trainers_NICFD.Trainers import Train_Entropic_Direct
+
+from Common.DataDrivenConfig import Config_NICFD
+
+C = Config_NICFD(sys.argv[-1])
+data_dir = os.path.dirname(os.path.abspath(sys.argv[-1]))
+
+n_epochs = 20
+
+def RunTraining(precision_policy:str, save_dir:str):
+    M = Train_Entropic_Direct()
+    M.SetTrainFileHeader(data_dir+"/"+C.GetConcatenationFileHeader())
+    M.SetAlphaExpo(-3.0)
+    M.SetLRDecay(0.85)
+    M.SetBatchExpo(6)
+    M.SetHiddenLayers([20])
+    M.SetNEpochs(n_epochs)
+    M.SetVerbose(0)
+    M.SetSaveDir(save_dir)
+    M.SetModelIndex(0)
+    M.SetDeviceIndex(0)
+    M.SetPrecisionPolicy(precision_policy)
+    M.callback_every = n_epochs + 1
+    M.Train_MLP()
+
+    # First epoch includes tracing and compilation.
+    return M.GetTestScore(), np.mean(M.throughput_history[1:])
+
+print("%-16s %-16s %-16s" % ("Policy", "Test loss", "Throughput[samples/s]"))
+with tempfile.TemporaryDirectory() as save_dir:
+    for policy in ["float32", "float64", "mixed_float16", "mixed_bfloat16"]:
+        test_score, throughput = RunTraining(policy, save_dir)
+        print("%-16s %+.6e %+.6e" % (policy, test_score, throughput))